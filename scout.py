@@ -7,6 +7,42 @@ Usage:
     python3 scout.py "Kylian Mbappe"
     python3 scout.py "Marcus Rashford" --days 30
     python3 scout.py "Neymar Jr" --json
+    python3 scout.py "Neymar Jr" --force     # ignore cached result, rerun
+    python3 scout.py "Neymar Jr" --delta     # only what changed since the last run
+    python3 scout.py "Neymar Jr" --deadline 10  # give up after 10s, report what was scored
+    python3 scout.py "Neymar Jr" --no-worker # don't use scout_worker.py even if it's up
+    python3 scout.py "Neymar Jr" --profile --trace-memory  # cProfile / tracemalloc
+                                             # -> scout_logs/profiles/, cited in the audit entry
+
+Warm worker (keeps matchers, connections and caches hot for the CLI):
+    python3 scout_worker.py &     # CLI uses it automatically while it runs
+
+Backfill (rebuild history from archived RSS / JSONL dumps):
+    python3 scout.py --backfill archive/ --days 14 --workers 8
+
+Rescore (re-apply today's dictionaries and scoring to every stored run):
+    python3 scout.py --rescore --workers 8
+    python3 scout.py --rescore --player "Neymar Jr" --since 2025-01-01
+
+Bulk watchlist (CSV or JSONL, one atomic write, see scout_watchlist.py):
+    python3 scout.py --import players.csv
+    python3 scout.py --export watchlist.jsonl
+
+Env:
+    SCOUT_LOG_DIR=dir     # logs, caches, history, state (default scout_logs/)
+    SCOUT_WATCHLIST=path  # watchlist file (default watchlist.json)
+    SCOUT_DICTIONARIES=path.json  # keyword dictionaries (default scout_dictionaries.json)
+    SCOUT_CACHE_TTL=900   # seconds a result stays fresh (0 disables cache)
+    SCOUT_CACHE_MAX=256   # results kept in memory
+    SCOUT_SOCKET=path     # worker socket (default scout_logs/scout_worker.sock)
+    SCOUT_NEWS_URL=url    # feed endpoint (default Google News; see scout_stub.py)
+    HTTP_PROXY / HTTPS_PROXY / NO_PROXY  # honoured for feed fetches, as urllib does
+    SCOUT_RECORD_DIR=dir  # save raw RSS responses there as replay fixtures
+    SCOUT_FETCH_RETRIES=3         # retries per feed on 429 / 5xx / timeouts (backoff + jitter)
+    SCOUT_BREAKER_THRESHOLD=5     # consecutive failures that open a host's circuit
+    SCOUT_BREAKER_COOLDOWN=60     # seconds an open circuit fails fast before a probe
+    SCOUT_FETCH_CONCURRENCY=2     # concurrent fetches to start with; adapts (AIMD) from there
+    SCOUT_FETCH_MAX_CONCURRENCY=8 # ...up to this. Changes go to scout_logs/fetch_limiter.jsonl
 
 Web UI:
     python3 scout_web.py          # opens http://localhost:8888
@@ -21,23 +57,89 @@ import os
 import json
 import re
 import uuid
+import base64
 import time
-import urllib.request
+import random
+import hashlib
+import threading
+import unicodedata
+import cProfile
+import tracemalloc
+import socket
+import sqlite3
+import http.client
 import urllib.parse
+import urllib.request
 import xml.etree.ElementTree as ET
 from html import unescape
-from datetime import datetime, timedelta
-from collections import Counter
+from email.utils import parsedate_tz, mktime_tz
+from datetime import datetime, timezone
+from collections import Counter, OrderedDict
 from pathlib import Path
 
+from scout_metrics import REGISTRY
+
+try:
+    import fcntl
+except ImportError:  # Windows - threads still take turns, processes don't
+    fcntl = None
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
-LOG_DIR = SCRIPT_DIR / "scout_logs"
+LOG_DIR = Path(os.environ.get("SCOUT_LOG_DIR") or SCRIPT_DIR / "scout_logs")
 RUNS_DIR = LOG_DIR / "runs"
 AUDIT_LOG = LOG_DIR / "audit.jsonl"
 ERROR_LOG = LOG_DIR / "errors.log"
-WATCHLIST_FILE = SCRIPT_DIR / "watchlist.json"
+WATCHLIST_FILE = Path(os.environ.get("SCOUT_WATCHLIST") or SCRIPT_DIR / "watchlist.json")
+WATCHLIST_LOCK_FILE = LOG_DIR / "watchlist.lock"
+CACHE_DIR = LOG_DIR / "cache"
+PROFILE_DIR = LOG_DIR / "profiles"
+SEARCH_DB = LOG_DIR / "search.db"
+HISTORY_DB = LOG_DIR / "history.db"
+LIMITER_LOG = LOG_DIR / "fetch_limiter.jsonl"
+STATE_DIR = LOG_DIR / "state"
+WORKER_SOCKET = Path(os.environ.get("SCOUT_SOCKET", LOG_DIR / "scout_worker.sock"))
+
+# Where feeds come from. Point at scout_stub.py for offline / load testing.
+NEWS_URL = os.environ.get("SCOUT_NEWS_URL", "https://news.google.com/rss/search")
+# Set to a directory to save every raw RSS response as a replayable fixture
+RECORD_DIR = os.environ.get("SCOUT_RECORD_DIR")
+
+# Fetch resilience: retries per feed on transient errors (429, 5xx, timeouts),
+# and how many consecutive failures open a host's circuit, for how long
+FETCH_RETRIES = int(os.environ.get("SCOUT_FETCH_RETRIES", 3))
+FETCH_BACKOFF = 0.5       # seconds, doubled per retry, full jitter
+FETCH_BACKOFF_MAX = 8.0
+BREAKER_THRESHOLD = int(os.environ.get("SCOUT_BREAKER_THRESHOLD", 5))
+BREAKER_COOLDOWN = float(os.environ.get("SCOUT_BREAKER_COOLDOWN", 60))  # seconds
+# Concurrent fetches per host: where the adaptive limit starts, and its ceiling
+FETCH_CONCURRENCY = int(os.environ.get("SCOUT_FETCH_CONCURRENCY", 2))
+FETCH_MAX_CONCURRENCY = int(os.environ.get("SCOUT_FETCH_MAX_CONCURRENCY", 8))
+
+# Result cache: how long a scout stays fresh, and how many stay in memory
+CACHE_TTL = int(os.environ.get("SCOUT_CACHE_TTL", 900))  # seconds
+CACHE_MAX_ENTRIES = int(os.environ.get("SCOUT_CACHE_MAX", 256))
+
+
+# ─── Metrics ──────────────────────────────────────────────────────────────────
+# Served by scout_web at /metrics, snapshotted by the scheduler.
+
+RUNS = REGISTRY.counter("scout_runs_total", "Scouts executed (cache hits excluded)", ["trigger"])
+STAGE_SECONDS = REGISTRY.histogram("scout_stage_duration_seconds", "run_scout time per pipeline stage", ["stage"])
+FETCH_SECONDS = REGISTRY.histogram("scout_fetch_duration_seconds", "Upstream feed fetch latency")
+FETCH_ERRORS = REGISTRY.counter("scout_fetch_errors_total", "Upstream feed fetch failures", ["kind"])
+FETCH_RETRIES_TOTAL = REGISTRY.counter("scout_fetch_retries_total", "Feed fetches retried after a transient error")
+FETCH_LIMIT = REGISTRY.gauge("scout_fetch_concurrency_limit", "Adaptive concurrent-fetch limit per upstream host",
+                             ["host"])
+FETCH_LIMIT_CHANGES = REGISTRY.counter("scout_fetch_limit_changes_total", "Adaptive fetch limit moves",
+                                       ["host", "direction", "reason"])
+BREAKER_STATE = REGISTRY.gauge("scout_fetch_circuit_state", "Circuit per upstream host: 0 closed, 1 half-open, 2 open",
+                               ["host"])
+RUNS_PARTIAL = REGISTRY.counter("scout_runs_partial_total", "Runs that ran out of time, by the stage it ran out in",
+                                ["stage"])
+RUNS_CANCELLED = REGISTRY.counter("scout_runs_cancelled_total", "Runs cancelled by their caller", ["reason"])
+CACHE_LOOKUPS = REGISTRY.counter("scout_cache_lookups_total", "Result cache lookups", ["result"])
 
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
@@ -53,8 +155,7 @@ def log_run(entry):
     _ensure_dirs()
 
     # Append to audit trail (one line per run)
-    with open(AUDIT_LOG, "a") as f:
-        f.write(json.dumps(entry, default=str) + "\n")
+    append_jsonl(AUDIT_LOG, entry)
 
     # Save full run file
     safe_name = re.sub(r"[^a-zA-Z0-9_-]", "_", entry.get("player", "unknown"))
@@ -66,6 +167,17 @@ def log_run(entry):
     return str(run_file)
 
 
+def append_jsonl(path, entry):
+    """One O_APPEND write per line, so concurrent writers (sharded scheduler,
+    web threads) never interleave."""
+    line = (json.dumps(entry, default=str) + "\n").encode()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
 def log_error(error_msg, player="unknown", context=""):
     """Log errors to errors.log."""
     _ensure_dirs()
@@ -88,8 +200,104 @@ def get_recent_logs(limit=50):
     return entries
 
 
+def _read_lines_reverse(path, end=None, chunk_size=65536):
+    """
+    Yield (offset, line) pairs from the end of a file backwards, newest first.
+    Reads fixed-size chunks, so memory stays flat no matter how big the file is.
+    `end` is a byte offset to start from (exclusive) - that's the cursor.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        pos = size if end is None else max(0, min(end, size))
+        tail = b""
+        while pos > 0:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + tail
+            lines = buf.split(b"\n")
+            # First piece may be a partial line - carry it into the next chunk
+            tail = lines.pop(0)
+            line_end = pos + len(buf)
+            for line in reversed(lines):
+                line_start = line_end - len(line)
+                if line.strip():
+                    yield line_start, line
+                line_end = line_start - 1
+        if tail.strip():
+            yield 0, tail
+
+
+def _project(entry, fields):
+    """Keep only the requested fields. Dotted names reach into nested dicts."""
+    if not fields:
+        return entry
+    out = {}
+    for field in fields:
+        value = entry
+        for part in field.split("."):
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = out
+            parts = field.split(".")
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return out
+
+
+def iter_logs(cursor=None, player=None, trigger=None, min_score=None,
+              max_score=None, fields=None):
+    """
+    Stream audit entries newest first, with filters and field projection.
+    Yields (cursor, entry) - pass the cursor back in to resume after that entry.
+    """
+    if not AUDIT_LOG.exists():
+        return
+    player_lc = player.lower() if player else None
+    for offset, line in _read_lines_reverse(AUDIT_LOG, end=cursor):
+        # Cheap byte-level pre-check before paying for json.loads
+        if player_lc and player_lc.encode() not in line.lower():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if player_lc and str(entry.get("player", "")).lower() != player_lc:
+            continue
+        if trigger and entry.get("trigger") != trigger:
+            continue
+        score = entry.get("risk_score")
+        if min_score is not None and not (isinstance(score, int) and score >= min_score):
+            continue
+        if max_score is not None and not (isinstance(score, int) and score <= max_score):
+            continue
+        yield offset, _project(entry, fields)
+
+
+def query_logs(cursor=None, limit=50, **filters):
+    """
+    One page of audit entries, newest first.
+    Returns {"entries": [...], "next_cursor": int or None}.
+    """
+    entries = []
+    next_cursor = None
+    for offset, entry in iter_logs(cursor=cursor, **filters):
+        if len(entries) == limit:
+            break
+        entries.append(entry)
+        next_cursor = offset
+    else:
+        next_cursor = None
+    return {"entries": entries, "next_cursor": next_cursor}
+
+
 # ─── Keyword Dictionaries ────────────────────────────────────────────────────
 # These are the "AI". Just word matching. Dumb but works.
+# Built-in defaults. The live copy is scout_dictionaries.json (see Matcher
+# below) - edit that and running processes pick it up without a restart.
 
 RED_FLAGS = {
     "legal_trouble": [
@@ -138,8 +346,8 @@ GREEN_FLAGS = {
     "community": [
         "charity", "foundation", "donate", "donation", "volunteer",
         "community", "school", "hospital", "children", "youth",
-        "campaign", "ambassador", "awareness", "philanthrop",
-        "gives back", "helping", "fundrais",
+        "campaign", "ambassador", "awareness", "philanthrop*",
+        "gives back", "helping", "fundrais*",
     ],
     "mental_strength": [
         "resilient", "comeback", "bounced back", "overcame", "adversity",
@@ -173,11 +381,11 @@ MATCH_CONTEXT = [
     "semi-final", "quarter-final", "quarterfinal", "round of",
     "first leg", "second leg", "minute", "half-time", "halftime",
     "goal", "assist", "header", "penalty", "free kick", "corner",
-    "offside", "var", "referee", "substitut", "lineup", "squad",
+    "offside", "var", "referee", "substitut*", "lineup", "squad",
     "kickoff", "kick-off", "pre-season", "friendly", "vs", "versus",
     "copa del rey", "champions league", "premier league", "la liga",
     "serie a", "bundesliga", "ligue 1", "europa league", "world cup",
-    "euro 2", "fa cup", "carabao", "league cup",
+    "euro 2*", "fa cup", "carabao", "league cup",
 ]
 
 # Keywords that are high-confidence OFF-field (not match context)
@@ -189,68 +397,825 @@ CONFIRMED_OFF_FIELD = [
 ]
 
 
+
+# ─── Matcher ──────────────────────────────────────────────────────────────────
+# The dictionaries compiled into lookup-ready form. One Matcher per dictionary
+# version (content hash), built once and reused. current_matcher() notices
+# when the file changes and swaps the new one in whole - a run grabs one
+# Matcher at the start and uses it throughout, so it never sees half an edit.
+
+DICTIONARY_FILE = Path(os.environ.get("SCOUT_DICTIONARIES", SCRIPT_DIR / "scout_dictionaries.json"))
+DICTIONARY_CHECK_INTERVAL = 2.0  # seconds between mtime checks
+
+DEFAULT_DICTIONARIES = {
+    "red_flags": RED_FLAGS,
+    "green_flags": GREEN_FLAGS,
+    "context_clues": CONTEXT_CLUES,
+    "match_context": MATCH_CONTEXT,
+    "confirmed_off_field": CONFIRMED_OFF_FIELD,
+}
+
+
+def dictionary_version(dictionaries):
+    canonical = json.dumps(dictionaries, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode()).hexdigest()[:12]
+
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    """'N'Golo Kanté, 31' -> ['n', 'golo', 'kante', '31']"""
+    return _WORD_RE.findall(fold(text))
+
+
+class TokenIndex:
+    """
+    Where every word of one article sits. Built once per article; every tier
+    then asks it questions instead of rescanning the text.
+    """
+    __slots__ = ("tokens", "positions")
+
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.positions = {}
+        for i, tok in enumerate(self.tokens):
+            self.positions.setdefault(tok, []).append(i)
+
+    def phrase_at(self, pos, phrase, prefix_last=False):
+        """Does `phrase` (token tuple) start at `pos`? prefix_last lets the final word be a stem."""
+        end = pos + len(phrase)
+        if end > len(self.tokens):
+            return False
+        if prefix_last:
+            return (self.tokens[pos:end - 1] == list(phrase[:-1])
+                    and self.tokens[end - 1].startswith(phrase[-1]))
+        return self.tokens[pos:end] == list(phrase)
+
+    @staticmethod
+    def near(a, b, window):
+        """Any position in sorted list `a` within `window` tokens of one in sorted `b`? O(len(a) + len(b))."""
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if abs(a[i] - b[j]) <= window:
+                return True
+            if a[i] < b[j]:
+                i += 1
+            else:
+                j += 1
+        return False
+
+
+class Matcher:
+    """
+    Keywords match whole words, so "ego" doesn't fire on "Diego" and "drug"
+    doesn't fire on "drugstore". Multi-word keywords match as phrases
+    ("no-show" == "no show"). A trailing * makes the last word a stem:
+    "fundrais*" matches "fundraiser" and "fundraising".
+    """
+
+    def __init__(self, dictionaries):
+        self.version = dictionary_version(dictionaries)
+        self.dictionaries = dictionaries
+        self._keywords = []  # id -> (kind, category, keyword, tokens, is_stem)
+        self._by_first = {}  # first token -> keyword ids (exact first word)
+        self._stems = []     # ids of single-word stems - checked against the vocabulary
+        self._ids = {}       # keyword text -> ids, for positional queries
+        self._match_ids = [] # match-context ids - only ever counted, never reported
+        self.red = self._compile("red", dictionaries["red_flags"])
+        self.green = self._compile("green", dictionaries["green_flags"])
+        self.context = self._compile("context", dictionaries["context_clues"])
+        self.match_context = self._compile("match", {"match": dictionaries["match_context"]})
+        self.confirmed_off_field = frozenset(kw.rstrip("*") for kw in dictionaries["confirmed_off_field"])
+
+    def _compile(self, kind, groups):
+        for category, keywords in groups.items():
+            for kw in keywords:
+                is_stem = kw.endswith("*")
+                label = kw.rstrip("*")
+                tokens = tuple(tokenize(label))
+                if not tokens:
+                    continue
+                kid = len(self._keywords)
+                self._keywords.append((kind, category, label, tokens, is_stem))
+                self._ids.setdefault(label, []).append(kid)
+                if kind == "match":
+                    self._match_ids.append(kid)
+                elif is_stem and len(tokens) == 1:
+                    self._stems.append(kid)
+                else:
+                    self._by_first.setdefault(tokens[0], []).append(kid)
+        return kind
+
+    def _matched(self, index):
+        """Ids of every keyword present in the article. Work is per distinct word, not per keyword."""
+        hit = set()
+        for tok in index.positions:
+            for kid in self._by_first.get(tok, ()):
+                if kid not in hit and self._present(index, kid):
+                    hit.add(kid)
+        for kid in self._stems:
+            if self._present(index, kid):
+                hit.add(kid)
+        return hit
+
+    def scan(self, index):
+        """All dictionary hits in one article, grouped like free_tier_analyze."""
+        found = {"red": {}, "green": {}, "context": {}}
+        for kid in sorted(self._matched(index)):  # ids are in dictionary order
+            kind, category, label = self._keywords[kid][:3]
+            found[kind].setdefault(category, []).append(label)
+        return found
+
+    def match_word_count(self, index):
+        """How many distinct match-context words the article uses."""
+        return sum(1 for kid in self._match_ids if self._present(index, kid))
+
+    def _present(self, index, kid):
+        tokens, is_stem = self._keywords[kid][3], self._keywords[kid][4]
+        if is_stem and len(tokens) == 1:
+            return any(tok.startswith(tokens[0]) for tok in index.positions)
+        positions = index.positions.get(tokens[0])
+        if not positions:
+            return False
+        return len(tokens) == 1 or any(index.phrase_at(p, tokens, is_stem) for p in positions)
+
+    def positions(self, index, keyword):
+        """Sorted token positions where `keyword` starts in this article."""
+        out = set()
+        for kid in self._ids.get(keyword, ()):
+            tokens, is_stem = self._keywords[kid][3], self._keywords[kid][4]
+            if is_stem and len(tokens) == 1:
+                candidates = [p for tok, ps in index.positions.items() if tok.startswith(tokens[0]) for p in ps]
+            else:
+                candidates = index.positions.get(tokens[0], ())
+            out.update(p for p in candidates if index.phrase_at(p, tokens, is_stem))
+        return sorted(out)
+
+
+_MATCHERS = {}  # version -> Matcher
+_matcher_lock = threading.Lock()
+_matcher_state = {"matcher": None, "mtime": None, "checked": 0.0}
+
+
+def _matcher_for(dictionaries):
+    version = dictionary_version(dictionaries)
+    matcher = _MATCHERS.get(version)
+    if matcher is None:
+        matcher = _MATCHERS[version] = Matcher(dictionaries)
+    return matcher
+
+
+def load_dictionaries(path=None):
+    """Read the dictionary file. Falls back to the built-in defaults if it's missing."""
+    path = path or DICTIONARY_FILE
+    if not path.exists():
+        return DEFAULT_DICTIONARIES
+    data = json.loads(path.read_text())
+    missing = [k for k in DEFAULT_DICTIONARIES if k not in data]
+    if missing:
+        raise ValueError(f"{path.name} is missing {', '.join(missing)}")
+    return data
+
+
+def current_matcher():
+    """The live Matcher. Reloads (at most every couple of seconds) if the file changed."""
+    state = _matcher_state
+    now = time.time()
+    if state["matcher"] is not None and now - state["checked"] < DICTIONARY_CHECK_INTERVAL:
+        return state["matcher"]
+
+    with _matcher_lock:
+        if state["matcher"] is not None and now - state["checked"] < DICTIONARY_CHECK_INTERVAL:
+            return state["matcher"]
+        try:
+            mtime = DICTIONARY_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if state["matcher"] is None or mtime != state["mtime"]:
+            try:
+                state["matcher"] = _matcher_for(load_dictionaries())
+            except (OSError, ValueError, AttributeError, TypeError, KeyError) as e:
+                # Bad edit - keep running on what we had
+                log_error(str(e), "dictionaries", "reload")
+                if state["matcher"] is None:
+                    state["matcher"] = _matcher_for(DEFAULT_DICTIONARIES)
+            state["mtime"] = mtime
+        state["checked"] = now
+        return state["matcher"]
+
+
 # ─── News Fetching ────────────────────────────────────────────────────────────
 
-def fetch_news(player_name, days=14):
-    """Fetch news from Google News RSS. Free. No API key. Works."""
-    query = urllib.parse.quote(f'"{player_name}" soccer OR football')
-    url = f"https://news.google.com/rss/search?q={query}&hl=en&gl=US&ceid=US:en"
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
 
-    req = urllib.request.Request(url, headers={
-        "User-Agent": "Mozilla/5.0 (compatible; SoccerScout/1.0)"
-    })
 
+def parse_pubdate(pubdate_str):
+    """RFC 822 date ('Tue, 10 Feb 2026 14:03:00 GMT') -> epoch seconds, or None.
+    Honors the timezone instead of dropping it."""
+    parsed = parsedate_tz(pubdate_str) if pubdate_str else None
+    if parsed is None:
+        return None
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            xml_data = resp.read().decode("utf-8")
-    except Exception as e:
-        log_error(str(e), player_name, "fetch_news")
-        return []
+        return mktime_tz(parsed)
+    except (OverflowError, ValueError):
+        return None
+
+
+def format_day(ts):
+    """Epoch seconds -> 'YYYY-MM-DD' (UTC), or 'unknown'."""
+    return time.strftime("%Y-%m-%d", time.gmtime(ts)) if ts is not None else "unknown"
+
+
+DAY = 86400
+
 
+class Article:
+    """
+    One news item. Slots instead of a dict: a big run holds thousands.
+    The outlet is split off the title once ("Title - Source") and interned,
+    so the many articles from one outlet share one string. The token index
+    isn't kept - classification builds it, uses it and drops it, so a
+    classified article costs no more than a fresh one. to_dict() is the JSON shape.
+    """
+    __slots__ = ("title", "link", "description", "ts", "source")
+
+    def __init__(self, title, link="", description="", ts=None):
+        self.title = title
+        self.link = link
+        self.description = description
+        self.ts = int(ts) if ts is not None else None
+        parts = title.rsplit(" - ", 1)
+        self.source = sys.intern(parts[1].strip()) if len(parts) == 2 else ""
+
+    @property
+    def date(self):
+        return format_day(self.ts)
+
+    @property
+    def day(self):
+        """Days since the epoch (UTC), or None. Cheap to compare and bucket."""
+        return self.ts // DAY if self.ts is not None else None
+
+    @property
+    def text(self):
+        return f"{self.title} {self.description}"
+
+    @property
+    def index(self):
+        """A fresh TokenIndex - build it once and pass it around (see classify_articles)."""
+        return TokenIndex(self.text)
+
+    def to_dict(self):
+        return {"title": self.title, "link": self.link, "description": self.description,
+                "date": self.date, "ts": self.ts}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get("title") or "", d.get("link") or "", d.get("description") or "", d.get("ts"))
+
+    def __repr__(self):
+        return f"Article({self.title[:40]!r}, {self.date})"
+
+
+def parse_rss(xml_data, cutoff_ts=None, context="unknown", deadline=None):
+    """Parse an RSS document into Articles. Drops items older than cutoff_ts.
+    Stops early (keeping what it has) if `deadline` runs out."""
     try:
         root = ET.fromstring(xml_data)
     except ET.ParseError as e:
-        log_error(str(e), player_name, "parse_rss")
+        log_error(str(e), context, "parse_rss")
         return []
 
     articles = []
-    cutoff = datetime.now() - timedelta(days=days)
-
     for item in root.iter("item"):
-        title_el = item.find("title")
-        link_el = item.find("link")
-        pubdate_el = item.find("pubDate")
-        desc_el = item.find("description")
+        if deadline is not None and deadline.stop("parse"):
+            break
+        article = _rss_item(item)
+        ts = article.ts
+        # Undated items can't be ruled out, so they stay in
+        if ts is not None and cutoff_ts is not None and ts < cutoff_ts:
+            continue
+        articles.append(article)
 
-        title = unescape(title_el.text) if title_el is not None and title_el.text else ""
-        link = link_el.text if link_el is not None and link_el.text else ""
-        desc = unescape(desc_el.text) if desc_el is not None and desc_el.text else ""
-        pubdate_str = pubdate_el.text if pubdate_el is not None and pubdate_el.text else ""
+    return articles
 
-        desc = re.sub(r"<[^>]+>", " ", desc)
-        desc = re.sub(r"\s+", " ", desc).strip()
 
-        pub_date = None
-        if pubdate_str:
-            try:
-                pub_date = datetime.strptime(
-                    re.sub(r"\s+\w+$", "", pubdate_str),
-                    "%a, %d %b %Y %H:%M:%S"
-                )
-            except ValueError:
-                pub_date = None
+def _rss_item(item):
+    title = item.findtext("title") or ""
+    link = item.findtext("link") or ""
+    desc = item.findtext("description") or ""
+    ts = parse_pubdate(item.findtext("pubDate"))
+
+    if desc:
+        desc = _WS_RE.sub(" ", _TAG_RE.sub(" ", unescape(desc))).strip()
 
-        if pub_date and pub_date < cutoff:
+    return Article(unescape(title), link, desc, ts)
+
+
+# Keep-alive connections, one set per thread. A batch (or a warm worker) pays
+# the TCP + TLS handshake to news.google.com once, not once per player.
+_http = threading.local()
+USER_AGENT = "Mozilla/5.0 (compatible; SoccerScout/1.0)"
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, status, url, retry_after=None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def _proxy_for(scheme, host):
+    """The proxy urllib would use for this host (HTTP(S)_PROXY, NO_PROXY), or None."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+
+
+def _connection(scheme, netloc, timeout):
+    """
+    This thread's keep-alive connection to netloc. Through a proxy, https is
+    tunnelled (CONNECT) and http is sent to the proxy with absolute URLs -
+    conn.forward_headers is then the dict of headers the proxy wants.
+    """
+    conns = getattr(_http, "conns", None)
+    if conns is None:
+        conns = _http.conns = {}
+    key = (scheme, netloc)
+    conn = conns.get(key)
+    if conn is None:
+        target = urllib.parse.urlsplit("//" + netloc)
+        proxy = _proxy_for(scheme, target.hostname or "")
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        if proxy is None:
+            conn = cls(netloc, timeout=timeout)
+            conn.forward_headers = None
+        else:
+            auth = {}
+            if proxy.username:
+                creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+                auth["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+            conn = cls(proxy.hostname, proxy.port or 80, timeout=timeout)
+            if scheme == "https":
+                conn.set_tunnel(target.hostname, target.port or 443, headers=auth)
+                conn.forward_headers = None
+            else:
+                conn.forward_headers = auth
+        conns[key] = conn
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    conn = getattr(_http, "conns", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def http_get(url, timeout=15, redirects=3):
+    """GET over a pooled keep-alive connection (via the env's proxy, if any).
+    Returns the body as text."""
+    for _ in range(redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {"User-Agent": USER_AGENT, "Connection": "keep-alive"}
+
+        for attempt in (1, 2):
+            conn = _connection(parts.scheme, parts.netloc, timeout)
+            reused = conn.sock is not None
+            request_target, request_headers = path, headers
+            if conn.forward_headers is not None:  # plain-http proxy wants the whole URL
+                request_target = urllib.parse.urlunsplit(parts._replace(fragment=""))
+                request_headers = dict(headers, **conn.forward_headers)
+            try:
+                conn.request("GET", request_target, headers=request_headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                # Server closed an idle keep-alive connection - reconnect once
+                _drop_connection(parts.scheme, parts.netloc)
+                if not reused or attempt == 2:
+                    raise
+            except Exception:
+                _drop_connection(parts.scheme, parts.netloc)
+                raise
+
+        if resp.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+        if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+            url = urllib.parse.urljoin(url, resp.getheader("Location"))
             continue
+        if resp.status != 200:
+            raise HTTPStatusError(resp.status, url, _retry_after(resp.getheader("Retry-After")))
+        charset = resp.headers.get_content_charset() or "utf-8"
+        return body.decode(charset, errors="replace")
 
-        articles.append({
-            "title": title,
-            "link": link,
-            "description": desc,
-            "date": pub_date.strftime("%Y-%m-%d") if pub_date else "unknown",
-        })
+    raise HTTPStatusError(resp.status, url)
+
+
+def _retry_after(value):
+    """Retry-After in seconds (the delta form; dates are rare enough to ignore)."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+# ─── Deadlines ────────────────────────────────────────────────────────────────
+# One token per run, handed down the pipeline: a time budget and a cancel
+# switch. Loops over articles ask stop() as they go and keep what they've
+# done when time is up; blocking calls (fetches, backoff sleeps) shrink their
+# timeouts to what's left. A run that runs out of time returns a partial
+# result, marked as such; a cancelled run raises Cancelled and leaves no trace.
+
+class Cancelled(Exception):
+    """The run's caller gave up on it (e.g. the web client disconnected)."""
+
+    def __init__(self, reason="cancelled", stage=None):
+        super().__init__(f"{reason} (during {stage})" if stage else reason)
+        self.reason = reason
+        self.stage = stage
+
+
+class Deadline:
+    """
+    Deadline(30) - 30 seconds from now; Deadline() - no time limit, only
+    cancel(). A `parent` (say, a batch's deadline) caps the budget and
+    passes its cancellation down.
+    """
+
+    def __init__(self, seconds=None, parent=None):
+        self.budget = seconds
+        self.parent = parent
+        self.expires = time.monotonic() + seconds if seconds else None
+        if parent is not None and parent.expires is not None:
+            self.expires = parent.expires if self.expires is None else min(self.expires, parent.expires)
+        self.reason = None  # why it was cancelled
+        self.stage = None   # where the run first found its time gone
+
+    def cancel(self, reason="cancelled"):
+        self.reason = self.reason or reason
+
+    @property
+    def cancelled(self):
+        return self.reason is not None or (self.parent is not None and self.parent.cancelled)
+
+    def remaining(self):
+        """Seconds left, or None if there's no time limit."""
+        if self.expires is None:
+            return None
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() == 0
+
+    def timeout(self, default=None):
+        """`default` seconds, or less if that's all that's left."""
+        left = self.remaining()
+        if left is None:
+            return default
+        return left if default is None else min(default, left)
+
+    def check(self, stage=None):
+        """Raises Cancelled if the run was cancelled."""
+        if self.cancelled:
+            node = self
+            while node.reason is None:
+                node = node.parent
+            RUNS_CANCELLED.inc(reason=node.reason)
+            raise Cancelled(node.reason, stage)
+
+    def stop(self, stage):
+        """Should `stage` stop here? True once the budget is spent (the first
+        stage to find out is kept in .stage). Raises Cancelled if cancelled."""
+        self.check(stage)
+        if self.expired:
+            self.stage = self.stage or stage
+            return True
+        return False
+
+
+# ─── Fetch Resilience ─────────────────────────────────────────────────────────
+# A blip upstream must not turn into a batch of confident zero scores. Transient
+# errors are retried with capped exponential backoff and full jitter; a host
+# that keeps failing gets its circuit opened so the rest of the batch fails
+# fast instead of hammering it, then one probe is let through after a cooldown.
+# What still fails raises FetchError - never an empty article list.
+
+class FetchError(Exception):
+    """The feed couldn't be fetched. Not the same thing as a feed with no articles."""
+
+    def __init__(self, message, kind="error", attempts=0, retry_after=None):
+        super().__init__(message)
+        self.kind = kind
+        self.attempts = attempts
+        self.retry_after = retry_after  # seconds, when we know (open circuit, 429)
+        self.log_entry = None           # set by run_scout once the failure is logged
+
+    def to_dict(self):
+        return {"kind": self.kind, "message": str(self), "attempts": self.attempts,
+                "retry_after": self.retry_after}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get("message", "fetch failed"), d.get("kind", "error"), d.get("attempts", 0),
+                   d.get("retry_after"))
+
+
+class CircuitBreaker:
+    CLOSED, HALF_OPEN, OPEN = 0, 1, 2
+
+    def __init__(self, host, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def retry_in(self):
+        """Seconds until an open circuit lets a probe through (0 if it would now)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def before(self):
+        """Call before each attempt. Raises FetchError while the circuit is open."""
+        with self._lock:
+            if self.state == self.OPEN and self.retry_in() == 0:
+                self._set(self.HALF_OPEN)
+            if self.state == self.OPEN or (self.state == self.HALF_OPEN and self._probing):
+                wait = round(self.retry_in() or self.cooldown, 1)
+                raise FetchError(f"circuit open for {self.host}, retry in {wait}s",
+                                 "circuit_open", retry_after=wait)
+            if self.state == self.HALF_OPEN:
+                self._probing = True  # exactly one probe at a time
+
+    def abandon(self):
+        """The attempt was given up by the caller - no verdict on the host."""
+        with self._lock:
+            self._probing = False
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            self._set(self.CLOSED)
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+                self._set(self.OPEN)
+
+    def _set(self, state):
+        self.state = state
+        BREAKER_STATE.set(state, host=self.host)
+
+
+_BREAKERS = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def breaker_for(url):
+    """The (process-wide) circuit breaker for a URL's host."""
+    host = urllib.parse.urlsplit(url).netloc
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = _BREAKERS[host] = CircuitBreaker(host)
+        return breaker
+
+
+class AdaptiveLimiter:
+    """
+    AIMD limit on concurrent fetches to one host, TCP-congestion style. Each
+    healthy response while the limit is in use adds 1/limit (about +1 per
+    round trip's worth of requests); a 429, a 503 or a timeout halves it; a
+    response much slower than the best recent one takes 10% off. At most one
+    cut per round - requests already in flight when the limit dropped can't
+    cut it again. Fetches over the limit wait for a slot.
+    """
+    DECREASE = 0.5
+    SLOW_DECREASE = 0.9
+    SLOW_FACTOR = 3.0    # latency over SLOW_FACTOR x baseline reads as congestion
+    BASELINE_DRIFT = 1.02  # per response: lets the baseline follow a slower upstream
+
+    def __init__(self, host, initial=FETCH_CONCURRENCY, min_limit=1, max_limit=FETCH_MAX_CONCURRENCY):
+        self.host = host
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.limit = float(min(max(initial, min_limit), self.max_limit))
+        self.in_flight = 0
+        self.baseline = None   # seconds
+        self.listeners = []    # fn(decision) - e.g. the scheduler's progress output
+        self._round = 0        # bumped on every cut
+        self._cond = threading.Condition()
+        FETCH_LIMIT.set(self.limit, host=host)
+
+    def acquire(self, timeout=None):
+        """Wait for a slot. Returns a token for release(), or None if
+        `timeout` seconds went by first."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                return None
+            self.in_flight += 1
+            return time.perf_counter(), self._round
+
+    def release(self, token, outcome):
+        """outcome: "ok", "overload" (429 / 503 / timeout) or "error" (no signal either way)."""
+        start, started_round = token
+        latency = time.perf_counter() - start
+        with self._cond:
+            busy = self.in_flight >= int(self.limit)  # was the limit what held us back?
+            self.in_flight -= 1
+            before = self.limit
+            reason = None
+            if outcome == "overload" and started_round == self._round:
+                self.limit = max(self.min_limit, self.limit * self.DECREASE)
+                reason = "overload"
+            elif outcome == "ok":
+                slow = self.baseline is not None and latency > self.SLOW_FACTOR * self.baseline
+                self.baseline = latency if self.baseline is None else min(latency, self.baseline * self.BASELINE_DRIFT)
+                if slow and started_round == self._round:
+                    self.limit = max(self.min_limit, self.limit * self.SLOW_DECREASE)
+                    reason = "slow"
+                elif not slow and busy:
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                    reason = "healthy"
+            if reason in ("overload", "slow"):
+                self._round += 1
+            self._cond.notify_all()
+            after = self.limit
+            FETCH_LIMIT.set(after, host=self.host)
+        if int(after) != int(before):
+            self._decided(before, after, reason, latency)
+
+    def _decided(self, before, after, reason, latency):
+        decision = {
+            "timestamp": datetime.now().isoformat(),
+            "host": self.host,
+            "from": int(before),
+            "to": int(after),
+            "reason": reason,
+            "latency_ms": int(latency * 1000),
+            "baseline_ms": int((self.baseline or 0) * 1000),
+        }
+        FETCH_LIMIT_CHANGES.inc(host=self.host, direction="up" if after > before else "down", reason=reason)
+        try:
+            _ensure_dirs()
+            append_jsonl(LIMITER_LOG, decision)
+        except OSError:
+            pass
+        for listener in list(self.listeners):
+            listener(decision)
+
+
+_LIMITERS = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def limiter_for(url):
+    """The (process-wide) adaptive fetch limiter for a URL's host."""
+    host = urllib.parse.urlsplit(url).netloc
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = _LIMITERS[host] = AdaptiveLimiter(host)
+        return limiter
+
+
+def _overloaded(e):
+    """The upstream telling us to back off, as opposed to just failing."""
+    if isinstance(e, HTTPStatusError):
+        return e.status in (429, 503)
+    return isinstance(e, (socket.timeout, TimeoutError))
+
+
+def _transient(e):
+    """Worth retrying: throttling, server errors, timeouts, dropped connections."""
+    if isinstance(e, HTTPStatusError):
+        return e.status == 429 or e.status >= 500
+    return isinstance(e, (OSError, http.client.HTTPException))
+
+
+def _backoff(attempt, retry_after=None):
+    """Full-jitter exponential backoff; a server's Retry-After wins (up to the cap)."""
+    if retry_after is not None:
+        return min(retry_after, FETCH_BACKOFF_MAX)
+    return random.uniform(0, min(FETCH_BACKOFF_MAX, FETCH_BACKOFF * 2 ** attempt))
+
+
+def resilient_get(url, timeout=15, retries=None, context="unknown", deadline=None):
+    """http_get with retries, backoff, the host's circuit breaker and its
+    adaptive concurrency limit. Returns the body, or raises FetchError
+    (kind "deadline" if `deadline` ran out first)."""
+    retries = FETCH_RETRIES if retries is None else retries
+    deadline = deadline or Deadline()
+    breaker = breaker_for(url)
+    limiter = limiter_for(url)
+    for attempt in range(retries + 1):
+        if deadline.stop("fetch"):
+            raise FetchError("ran out of time before the feed came back", "deadline", attempt)
+        breaker.before()
+        token = None
+        while token is None and not (deadline.expired or deadline.cancelled):
+            token = limiter.acquire(deadline.timeout(1.0))  # wake now and then to notice a cancel
+        if token is None:
+            breaker.abandon()
+            deadline.stop("fetch")  # raises Cancelled if that's what it was
+            raise FetchError("ran out of time waiting for a fetch slot", "deadline", attempt)
+        wait = deadline.timeout(timeout)
+        try:
+            with FETCH_SECONDS.time():
+                body = http_get(url, timeout=wait)
+        except Exception as e:
+            clipped = wait < timeout and isinstance(e, (socket.timeout, TimeoutError))
+            if clipped or deadline.expired or deadline.cancelled:
+                # Cut short by our own budget - says nothing about the host
+                limiter.release(token, "error")
+                breaker.abandon()
+                deadline.stop("fetch")  # raises Cancelled if that's what it was
+                raise FetchError(f"ran out of time during the fetch ({e})", "deadline", attempt + 1) from e
+            limiter.release(token, "overload" if _overloaded(e) else "error")
+            kind = f"http_{e.status}" if isinstance(e, HTTPStatusError) else type(e).__name__
+            FETCH_ERRORS.inc(kind=kind)
+            if not _transient(e):
+                breaker.success()  # the host answered; the request was the problem
+                raise FetchError(str(e), kind, attempt + 1) from e
+            breaker.failure()
+            retry_after = getattr(e, "retry_after", None)
+            if attempt == retries or breaker.state == breaker.OPEN:
+                raise FetchError(str(e), kind, attempt + 1, retry_after) from e
+            FETCH_RETRIES_TOTAL.inc()
+            log_error(f"{e} - retry {attempt + 1}/{retries}", context, "fetch_retry")
+            time.sleep(deadline.timeout(_backoff(attempt, retry_after)))
+        else:
+            limiter.release(token, "ok")
+            breaker.success()
+            return body
+
+
+def fixture_key(query):
+    """File name stem a recorded response is stored under (and looked up by)."""
+    return hashlib.sha1(query.encode()).hexdigest()[:16]
+
+
+def record_fixture(query, xml_data, directory=None):
+    """Save a raw RSS response so scout_stub.py can serve it back later."""
+    directory = Path(directory or RECORD_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    key = fixture_key(query)
+    (directory / f"{key}.xml").write_text(xml_data, encoding="utf-8")
+    with open(directory / "index.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps({"query": query, "file": f"{key}.xml",
+                            "recorded_at": datetime.now().isoformat(),
+                            "bytes": len(xml_data)}) + "\n")
+
+
+def fetch_feed(query, days=14, context="unknown", deadline=None):
+    """Fetch one Google News RSS search. Free. No API key. Works.
+    Raises FetchError if the feed can't be had (see resilient_get)."""
+    url = f"{NEWS_URL}?q={urllib.parse.quote(query)}&hl=en&gl=US&ceid=US:en"
+
+    try:
+        xml_data = resilient_get(url, timeout=15, context=context, deadline=deadline)
+    except FetchError as e:
+        log_error(f"{e} ({e.kind}, {e.attempts} attempts)", context, "fetch_news")
+        raise
+
+    if RECORD_DIR:
+        try:
+            record_fixture(query, xml_data)
+        except OSError as e:
+            log_error(str(e), context, "record_fixture")
+
+    cutoff_ts = int(time.time()) - days * 86400
+    return parse_rss(xml_data, cutoff_ts, context=context, deadline=deadline)
+
+
+def fetch_news(player_name, days=14, deadline=None):
+    """Fetch news about one player."""
+    return fetch_feed(f'"{player_name}" soccer OR football', days, context=player_name, deadline=deadline)
 
-    return articles
+
+def fetch_club_news(club, days=14, deadline=None):
+    """Fetch news about a club or league - one feed for a whole squad."""
+    return fetch_feed(f'"{club}" soccer OR football', days, context=f"club:{club}", deadline=deadline)
 
 
 # ─── Tiered Analysis ─────────────────────────────────────────────────────────
@@ -262,52 +1227,44 @@ def fetch_news(player_name, days=14):
 #
 # The idea: don't waste expensive judgment on things cheap logic can handle.
 
-def free_tier_analyze(article):
+def free_tier_analyze(article, matcher=None, index=None):
     """
     FREE TIER: Raw keyword matching against all dictionaries.
     Runs on every single article. No filtering, just detection.
     """
-    text = f"{article['title']} {article['description']}".lower()
-    findings = {"red": {}, "green": {}, "context": {}}
-
-    for category, keywords in RED_FLAGS.items():
-        hits = [kw for kw in keywords if kw.lower() in text]
-        if hits:
-            findings["red"][category] = hits
+    matcher = matcher or current_matcher()
+    return matcher.scan(index or article.index)
 
-    for category, keywords in GREEN_FLAGS.items():
-        hits = [kw for kw in keywords if kw.lower() in text]
-        if hits:
-            findings["green"][category] = hits
 
-    for category, keywords in CONTEXT_CLUES.items():
-        hits = [kw for kw in keywords if kw.lower() in text]
-        if hits:
-            findings["context"][category] = hits
+# How close (in words) "rehab" has to be to an injury word to count as medical
+REHAB_INJURY_WINDOW = 12
 
-    return findings
 
-
-def cheap_tier_filter(article, raw_findings):
+def cheap_tier_filter(article, raw_findings, matcher=None, index=None):
     """
     CHEAP TIER: Heuristic rules that filter out false positives.
     Still zero-cost compute, but smarter than raw keyword matching.
 
     Fixes the problem where "clash" in "Copa del Rey clash" triggers
     attitude_problems, or "suspended" in "match suspended due to rain".
+    Proximity rules ask the article's token index, they don't rescan text.
     """
-    text = f"{article['title']} {article['description']}".lower()
+    matcher = matcher or current_matcher()
+    index = index or article.index
     filtered = {"red": {}, "green": raw_findings["green"], "context": raw_findings["context"]}
 
     # Count how many match-context words appear
-    match_words = sum(1 for mw in MATCH_CONTEXT if mw in text)
+    match_words = matcher.match_word_count(index)
     is_match_article = match_words >= 2  # 2+ match words = probably about a game
 
+    injury_hits = raw_findings.get("context", {}).get("injury", [])
+    injury_positions = None
+
     for category, hits in raw_findings["red"].items():
         surviving_hits = []
         for kw in hits:
             # Rule 1: If the keyword is a confirmed off-field term, always keep it
-            if kw in CONFIRMED_OFF_FIELD:
+            if kw in matcher.confirmed_off_field:
                 surviving_hits.append(kw)
                 continue
 
@@ -319,9 +1276,14 @@ def cheap_tier_filter(article, raw_findings):
             ):
                 continue  # likely match context, not off-field
 
-            # Rule 3: "rehabilitation" / "rehab" near "injury" = medical, not substance
-            if kw in ("rehab", "rehabilitation") and "injury" in raw_findings.get("context", {}):
-                continue
+            # Rule 3: "rehabilitation" / "rehab" near an injury word = medical, not substance
+            if kw in ("rehab", "rehabilitation") and injury_hits:
+                if injury_positions is None:
+                    injury_positions = sorted(
+                        p for ikw in injury_hits for p in matcher.positions(index, ikw)
+                    )
+                if TokenIndex.near(matcher.positions(index, kw), injury_positions, REHAB_INJURY_WINDOW):
+                    continue
 
             surviving_hits.append(kw)
 
@@ -339,31 +1301,31 @@ def expensive_tier_flag(player_name, articles, all_findings, score):
 
     Returns a list of items that need manual review.
     """
+    return review_flags(Tally.of(articles, all_findings), score)
+
+
+def review_flags(tally, score):
+    """expensive_tier_flag over a Tally (see assess_windows)."""
     review_items = []
 
     # Flag 1: High score but few articles — could be noise
-    if score >= 5 and len(articles) < 5:
+    if score >= 5 and tally.articles < 5:
         review_items.append({
             "reason": "HIGH_SCORE_LOW_DATA",
-            "detail": f"Risk score {score}/10 but only {len(articles)} articles. Small sample = unreliable.",
+            "detail": f"Risk score {score}/10 but only {tally.articles} articles. Small sample = unreliable.",
             "action": "Manually verify flagged articles. Increase --days to get more data.",
         })
 
     # Flag 2: Contradictory signals — red AND green in same run
-    total_red = sum(len(h) for f in all_findings for h in f["red"].values())
-    total_green = sum(len(h) for f in all_findings for h in f["green"].values())
-    if total_red >= 3 and total_green >= 5:
+    if tally.red >= 3 and tally.green >= 5:
         review_items.append({
             "reason": "CONTRADICTORY_SIGNALS",
-            "detail": f"{total_red} red hits + {total_green} green hits. Mixed picture.",
+            "detail": f"{tally.red} red hits + {tally.green} green hits. Mixed picture.",
             "action": "Read flagged articles yourself. Keyword matching can't judge nuance.",
         })
 
     # Flag 3: Single category dominating red flags
-    cat_counts = Counter()
-    for f in all_findings:
-        for cat in f["red"]:
-            cat_counts[cat] += 1
+    cat_counts = tally.red_categories
     if cat_counts:
         top_cat, top_count = cat_counts.most_common(1)[0]
         total_flagged = sum(cat_counts.values())
@@ -375,13 +1337,12 @@ def expensive_tier_flag(player_name, articles, all_findings, score):
             })
 
     # Flag 4: All dates are the same — news burst about one event
-    dates = [a["date"] for a in articles if a["date"] != "unknown"]
-    if dates:
-        unique_dates = set(dates)
-        if len(unique_dates) <= 2 and len(dates) >= 5:
+    if tally.dated:
+        unique_dates = len(tally.days)
+        if unique_dates <= 2 and tally.dated >= 5:
             review_items.append({
                 "reason": "NEWS_BURST",
-                "detail": f"All {len(dates)} articles from {len(unique_dates)} date(s). Likely one event amplified.",
+                "detail": f"All {tally.dated} articles from {unique_dates} date(s). Likely one event amplified.",
                 "action": "Verify this is multiple incidents, not one story echoed across outlets.",
             })
 
@@ -391,29 +1352,36 @@ def expensive_tier_flag(player_name, articles, all_findings, score):
 # ─── Self-Check / Audit ──────────────────────────────────────────────────────
 # After every run, audit the output. If something looks off, log it.
 
-def self_check(player_name, articles, all_findings, score):
+def self_check(player_name, articles, all_findings, score, now=None):
     """
     Post-run audit. Checks output quality and flags problems.
     Returns dict with issues found and suggested fixes.
+    `now` lets historical runs judge staleness as of their own date.
     """
+    return audit_tally(Tally.of(articles, all_findings), score, now)
+
+
+def audit_tally(tally, score, now=None):
+    """self_check over a Tally (see assess_windows)."""
     issues = []
     suggestions = []
     confidence = 1.0  # starts at 100%, each issue reduces it
+    n = tally.articles
 
     # Check 1: No articles found
-    if not articles:
+    if not n:
         issues.append("ZERO_ARTICLES: No news found for this player.")
         suggestions.append("Try alternate name spellings, add nationality, or increase --days.")
         confidence -= 0.5
 
     # Check 2: Very few articles
-    elif len(articles) < 3:
-        issues.append(f"LOW_COVERAGE: Only {len(articles)} articles. Thin dataset.")
+    elif n < 3:
+        issues.append(f"LOW_COVERAGE: Only {n} articles. Thin dataset.")
         suggestions.append("Increase --days to 60 or 90 for more data. Or player may be low-profile.")
         confidence -= 0.2
 
     # Check 3: Risk score at extremes
-    if score == 0 and len(articles) > 10:
+    if score == 0 and n > 10:
         issues.append("PERFECT_ZERO: Score is 0 with many articles. Possibly under-detecting.")
         suggestions.append("Review keyword dictionaries. Player may use different name in media.")
         confidence -= 0.1
@@ -424,50 +1392,33 @@ def self_check(player_name, articles, all_findings, score):
         confidence -= 0.15
 
     # Check 4: All articles from same source
-    if articles:
-        sources = set()
-        for a in articles:
-            # Extract domain-ish from title suffix (Google News format: "Title - Source")
-            parts = a["title"].rsplit(" - ", 1)
-            if len(parts) == 2:
-                sources.add(parts[1].strip().lower())
-        if len(sources) == 1 and len(articles) > 3:
-            issues.append(f"SINGLE_SOURCE: All articles from one outlet ({sources.pop()}). Echo chamber risk.")
-            suggestions.append("Cross-reference with other search queries or news sources.")
-            confidence -= 0.2
+    # Outlet from the title suffix (Google News format: "Title - Source"), split at fetch
+    if len(tally.sources) == 1 and n > 3:
+        issues.append(f"SINGLE_SOURCE: All articles from one outlet ({next(iter(tally.sources))}). Echo chamber risk.")
+        suggestions.append("Cross-reference with other search queries or news sources.")
+        confidence -= 0.2
 
     # Check 5: Stale data
-    if articles:
-        dates = [a["date"] for a in articles if a["date"] != "unknown"]
-        if dates:
-            newest = max(dates)
-            try:
-                newest_dt = datetime.strptime(newest, "%Y-%m-%d")
-                days_old = (datetime.now() - newest_dt).days
-                if days_old > 7:
-                    issues.append(f"STALE_DATA: Newest article is {days_old} days old.")
-                    suggestions.append("Recent news may not be indexed yet. Re-run in a day or two.")
-                    confidence -= 0.1
-            except ValueError:
-                pass
+    if tally.newest is not None:
+        # Both sides in UTC; a naive `now` is local time
+        newest_dt = datetime(*time.gmtime(tally.newest)[:3], tzinfo=timezone.utc)
+        days_old = ((now or datetime.now()).astimezone(timezone.utc) - newest_dt).days
+        if days_old > 7:
+            issues.append(f"STALE_DATA: Newest article is {days_old} days old.")
+            suggestions.append("Recent news may not be indexed yet. Re-run in a day or two.")
+            confidence -= 0.1
 
     # Check 6: Keyword saturation (one keyword triggering everywhere)
-    kw_counts = Counter()
-    for f in all_findings:
-        for hits in f["red"].values():
-            for kw in hits:
-                kw_counts[kw] += 1
-    if kw_counts:
-        top_kw, top_count = kw_counts.most_common(1)[0]
-        if top_count > len(articles) * 0.5 and top_count >= 3:
-            issues.append(f"KEYWORD_SATURATION: '{top_kw}' matched in {top_count}/{len(articles)} articles.")
+    if tally.red_keywords:
+        top_kw, top_count = tally.red_keywords.most_common(1)[0]
+        if top_count > n * 0.5 and top_count >= 3:
+            issues.append(f"KEYWORD_SATURATION: '{top_kw}' matched in {top_count}/{n} articles.")
             suggestions.append(f"'{top_kw}' may be too generic. Consider if it's genuinely off-field.")
             confidence -= 0.1
 
     # Check 7: Green flags unrealistically high
-    total_green = sum(len(h) for f in all_findings for h in f["green"].values())
-    if total_green > len(articles) * 3:
-        issues.append(f"GREEN_INFLATION: {total_green} green hits from {len(articles)} articles. PR puff?")
+    if tally.green > n * 3:
+        issues.append(f"GREEN_INFLATION: {tally.green} green hits from {n} articles. PR puff?")
         suggestions.append("High green flag count may indicate PR-driven coverage, not reality.")
         confidence -= 0.05
 
@@ -483,6 +1434,9 @@ def self_check(player_name, articles, all_findings, score):
 
 # ─── Scoring ──────────────────────────────────────────────────────────────────
 
+SCORING_VERSION = 1  # bump when scoring, self-check or cheap-tier rules change what a score means
+
+
 def compute_risk_score(all_findings):
     red_count = sum(
         len(hits)
@@ -494,10 +1448,69 @@ def compute_risk_score(all_findings):
         for f in all_findings
         for hits in f["green"].values()
     )
+    return score_from_counts(red_count, green_count)
+
+
+def score_from_counts(red_count, green_count):
     raw = (red_count * 2) - (green_count * 1)
     return max(0, min(10, raw))
 
 
+class Tally:
+    """
+    Running totals over classified articles - everything the score, the
+    self-check and the review flags look at. Add articles newest first and
+    copy() at each lookback boundary, and every window is scored from one
+    pass over one fetch (see assess_windows).
+    """
+
+    def __init__(self):
+        self.articles = 0
+        self.red = 0                    # red keyword hits
+        self.green = 0
+        self.red_categories = Counter()  # category -> articles flagged with it
+        self.red_keywords = Counter()    # keyword -> hits
+        self.sources = set()
+        self.days = set()               # distinct publication days
+        self.dated = 0
+        self.newest = None
+
+    @classmethod
+    def of(cls, articles, findings):
+        tally = cls()
+        for article, finding in zip(articles, findings):
+            tally.add(article, finding)
+        return tally
+
+    def add(self, article, finding):
+        self.articles += 1
+        for cat, hits in finding["red"].items():
+            self.red += len(hits)
+            self.red_categories[cat] += 1
+            self.red_keywords.update(hits)
+        for hits in finding["green"].values():
+            self.green += len(hits)
+        if article.source:
+            self.sources.add(article.source.lower())
+        if article.ts is not None:
+            self.dated += 1
+            self.days.add(article.day)
+            if self.newest is None or article.ts > self.newest:
+                self.newest = article.ts
+
+    def copy(self):
+        other = Tally()
+        other.__dict__.update(self.__dict__)
+        other.red_categories = Counter(self.red_categories)
+        other.red_keywords = Counter(self.red_keywords)
+        other.sources = set(self.sources)
+        other.days = set(self.days)
+        return other
+
+    def risk_score(self):
+        return score_from_counts(self.red, self.green)
+
+
 def categorize_risk(score):
     if score <= 2:
         return "LOW RISK"
@@ -511,7 +1524,7 @@ def categorize_risk(score):
 
 # ─── Report Generation ────────────────────────────────────────────────────────
 
-def generate_report(player_name, articles, all_findings, score, audit, review_items):
+def generate_report(player_name, articles, all_findings, score, audit, review_items, partial=None):
     risk_label = categorize_risk(score)
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
 
@@ -524,6 +1537,9 @@ def generate_report(player_name, articles, all_findings, score, audit, review_it
     lines.append(f"  Articles:     {len(articles)} found")
     lines.append(f"  Risk Score:   {score}/10 ({risk_label})")
     lines.append(f"  Confidence:   {int(audit['confidence'] * 100)}%")
+    if partial:
+        lines.append(f"  Status:       PARTIAL - out of time during {partial['stage']}, "
+                     f"{partial['articles_scored']} of {partial['articles_fetched']} articles scored")
     lines.append("=" * 70)
 
     # Aggregate
@@ -583,11 +1599,11 @@ def generate_report(player_name, articles, all_findings, score, audit, review_it
     lines.append("-" * 40)
     if flagged_articles:
         for article, findings in flagged_articles[:15]:
-            lines.append(f"  [{article['date']}] {article['title'][:80]}")
+            lines.append(f"  [{article.date}] {article.title[:80]}")
             for cat, hits in findings["red"].items():
                 label = cat.replace("_", " ").title()
                 lines.append(f"    >> {label}: {', '.join(hits)}")
-            lines.append(f"    {article['link']}")
+            lines.append(f"    {article.link}")
             lines.append("")
     else:
         lines.append("  No articles with red flags.")
@@ -602,7 +1618,7 @@ def generate_report(player_name, articles, all_findings, score, audit, review_it
             marker = "!"
         elif all_findings[i]["green"]:
             marker = "+"
-        lines.append(f"  [{marker}] [{article['date']}] {article['title'][:75]}")
+        lines.append(f"  [{marker}] [{article.date}] {article.title[:75]}")
 
     # Self-Check Results
     lines.append("")
@@ -659,50 +1675,648 @@ def generate_report(player_name, articles, all_findings, score, audit, review_it
     return "\n".join(lines)
 
 
-# ─── Core Runner ──────────────────────────────────────────────────────────────
-# This is what everything calls: CLI, web UI, scheduler.
+# ─── Result Cache ─────────────────────────────────────────────────────────────
+# Same player, same lookback, a few minutes apart = same answer. Don't refetch.
+# Memory LRU in front, one JSON file per key on disk behind it, so the CLI,
+# web UI and scheduler all see each other's results.
+
+def fold(text):
+    """Lowercase and strip accents: 'Mbappé' -> 'mbappe'."""
+    if text.isascii():
+        return text.lower()
+    folded = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in folded if not unicodedata.combining(c)).lower()
+
+
+def normalize_player(name):
+    """'  Kylian  Mbappé ' -> 'kylian mbappe'. Accents, case and spacing don't matter."""
+    return " ".join(fold(name).split())
+
+
+class ResultCache:
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, directory=CACHE_DIR):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory = directory
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        digest = hashlib.sha1(f"{key[0]}|{key[1]}".encode()).hexdigest()[:16]
+        return self.directory / f"{digest}.json"
+
+    def get(self, player_name, days):
+        """Return (result, age_seconds) if fresh, else None."""
+        if self.ttl <= 0:
+            return None
+        key = (normalize_player(player_name), int(days))
+        now = time.time()
+
+        with self._lock:
+            item = self._memory.get(key)
+            if item is not None:
+                if now - item["cached_at"] <= self.ttl:
+                    self._memory.move_to_end(key)
+                    return item["result"], now - item["cached_at"]
+                del self._memory[key]
+
+        path = self._path(key)
+        try:
+            item = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if now - item.get("cached_at", 0) > self.ttl:
+            return None
+
+        self._remember(key, item)
+        return item["result"], now - item["cached_at"]
+
+    def put(self, player_name, days, result):
+        if self.ttl <= 0:
+            return
+        key = (normalize_player(player_name), int(days))
+        item = {"cached_at": time.time(), "result": result}
+        self._remember(key, item)
+
+        # Write-then-rename so a reader in another process never sees half a file
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_text(json.dumps(item, default=str))
+            os.replace(tmp, path)
+        except OSError as e:
+            log_error(str(e), player_name, "cache_put")
+
+    def _remember(self, key, item):
+        with self._lock:
+            self._memory[key] = item
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+RESULT_CACHE = ResultCache()
+
+
+# ─── Run-to-Run Deltas ────────────────────────────────────────────────────────
+# Each live run leaves behind what it saw: hashed ids of every article and the
+# findings on the flagged ones. The next run for that player and lookback
+# diffs against it with set operations, so analysts read what changed since
+# yesterday - new flags, resolved flags, the score move - not the whole report.
+
+def article_id(article):
+    """Short stable id for an article: a hash of its link (its title if it has none)."""
+    return hashlib.sha1((article.link or article.title).encode()).hexdigest()[:12]
+
 
-def run_scout(player_name, days=14, trigger="manual"):
+def run_state(run_id, articles, findings, score):
+    """What a run saw, for the next run to diff against."""
+    flagged = {}
+    for a, f in zip(articles, findings):
+        if f["red"]:
+            flagged[article_id(a)] = {"title": a.title, "link": a.link, "date": a.date, "red": f["red"]}
+    return {
+        "run_id": run_id,
+        "timestamp": datetime.now().isoformat(),
+        "risk_score": score,
+        "seen": sorted({article_id(a) for a in articles}),
+        "flagged": flagged,
+    }
+
+
+def compute_delta(previous, state):
     """
-    Run the full scouting pipeline. Returns a complete result dict.
-    Everything is logged automatically.
+    New flagged articles, resolved ones and the score move since `previous`
+    (None on a player's first run - everything flagged is new).
+    A resolved article either aged out of the lookback or stopped matching.
     """
-    run_id = str(uuid.uuid4())[:8]
-    start = time.time()
-    errors = []
+    flagged, seen = state["flagged"], set(state["seen"])
+    prev_flagged = previous["flagged"] if previous else {}
+    prev_seen = set(previous["seen"]) if previous else set()
+    new_ids = flagged.keys() - prev_flagged.keys()
+    resolved_ids = prev_flagged.keys() - flagged.keys()
+    score_from = previous["risk_score"] if previous else None
+    return {
+        "since_run": previous["run_id"] if previous else None,
+        "since": previous["timestamp"] if previous else None,
+        "score_from": score_from,
+        "score_to": state["risk_score"],
+        "score_change": state["risk_score"] - score_from if score_from is not None else None,
+        "new_articles": len(seen - prev_seen),
+        "new_flagged": [dict(flagged[i], id=i) for i in sorted(new_ids, key=lambda i: flagged[i]["date"], reverse=True)],
+        "resolved": [{"id": i, "title": prev_flagged[i]["title"],
+                      "reason": "cleared" if i in seen else "aged_out"} for i in sorted(resolved_ids)],
+        "still_flagged": len(flagged.keys() & prev_flagged.keys()),
+    }
 
-    # Step 1: Fetch (FREE - uses Google News RSS, no API cost)
-    articles = fetch_news(player_name, days=days)
-    if not articles:
-        errors.append("No articles found")
 
-    # Step 2: FREE tier — raw keyword scan on every article
-    raw_findings = [free_tier_analyze(a) for a in articles]
+def generate_delta_report(player_name, delta):
+    """The compact what-changed report."""
+    lines = []
+    if delta["since_run"] is None:
+        lines.append(f"DELTA - {player_name}: first run, nothing to compare against")
+    else:
+        lines.append(f"DELTA - {player_name} since {delta['since'][:16].replace('T', ' ')} (run {delta['since_run']})")
+    change = delta["score_change"]
+    if change is None:
+        lines.append(f"  Score: {delta['score_to']}/10")
+    else:
+        lines.append(f"  Score: {delta['score_from']}/10 -> {delta['score_to']}/10 ({change:+d})")
+    lines.append(f"  New articles: {delta['new_articles']} | New flags: {len(delta['new_flagged'])} | "
+                 f"Resolved: {len(delta['resolved'])} | Still flagged: {delta['still_flagged']}")
+    if delta["new_flagged"]:
+        lines.append("  NEW")
+        for item in delta["new_flagged"][:15]:
+            lines.append(f"    [{item['date']}] {item['title'][:80]}")
+            for cat, hits in item["red"].items():
+                lines.append(f"      >> {cat.replace('_', ' ').title()}: {', '.join(hits)}")
+    if delta["resolved"]:
+        lines.append("  RESOLVED")
+        for item in delta["resolved"][:15]:
+            lines.append(f"    {item['title'][:80]} ({item['reason'].replace('_', ' ')})")
+    return "\n".join(lines)
 
-    # Step 3: CHEAP tier — filter false positives with heuristics
-    filtered_findings = [
-        cheap_tier_filter(a, raw)
-        for a, raw in zip(articles, raw_findings)
-    ]
 
-    # Step 4: Score (FREE — just arithmetic)
-    score = compute_risk_score(filtered_findings)
+def needs_attention(delta, threshold=5, jump=2):
+    """Worth an analyst's look today: new flags, a score up by `jump` or more,
+    or a first run already at `threshold`. Unchanged high scorers were seen before."""
+    if delta["new_flagged"]:
+        return True
+    if delta["score_change"] is None:
+        return delta["score_to"] >= threshold
+    return delta["score_change"] >= jump
 
-    # Step 5: Self-check (CHEAP — rule-based audit)
-    audit = self_check(player_name, articles, filtered_findings, score)
 
-    # Step 6: EXPENSIVE tier — flag items needing human review
-    review_items = expensive_tier_flag(player_name, articles, filtered_findings, score)
+class RunStateStore:
+    """Last run's state per player and lookback, one small JSON file each."""
 
-    # Step 7: Generate report
-    report = generate_report(player_name, articles, filtered_findings, score, audit, review_items)
+    def __init__(self, directory=STATE_DIR):
+        self.directory = directory
 
-    duration_ms = int((time.time() - start) * 1000)
+    def _path(self, player_name, days):
+        digest = hashlib.sha1(f"{normalize_player(player_name)}|{int(days)}".encode()).hexdigest()[:16]
+        return self.directory / f"{digest}.json"
+
+    def get(self, player_name, days):
+        try:
+            return json.loads(self._path(player_name, days).read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, player_name, days, state):
+        # Write-then-rename, like the result cache
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(player_name, days)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_text(json.dumps(state, default=str))
+            os.replace(tmp, path)
+        except OSError as e:
+            log_error(str(e), player_name, "run_state_put")
+
+
+RUN_STATE = RunStateStore()
+
+
+# ─── Article Search ───────────────────────────────────────────────────────────
+# Every article any run has seen, full-text indexed (sqlite FTS5) and tied to
+# the players it was fetched for. run_scout adds to it; /api/search reads it.
+
+class SearchIndex:
+    """
+    articles     one row per story (keyed by link, else title)
+    articles_fts FTS5 over title + description, accent-insensitive
+    mentions     which players' runs turned the story up
+    """
+    PLAYER_WALK_MAX = 2000  # stories; past this a player+words search walks the FTS instead
+
+    def __init__(self, path=SEARCH_DB):
+        self.path = path
+        self.db = None
+        self.available = True
+        self._lock = threading.Lock()
+
+    def _open(self):
+        if self.db is not None or not self.available:
+            return self.db
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                             check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")  # searches don't wait on a writing scheduler
+        try:
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id          INTEGER PRIMARY KEY,
+                    key         TEXT NOT NULL UNIQUE,
+                    title       TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    link        TEXT NOT NULL,
+                    source      TEXT NOT NULL,
+                    ts          INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS articles_ts ON articles (ts);
+                CREATE TABLE IF NOT EXISTS mentions (
+                    player_key  TEXT NOT NULL,
+                    article_id  INTEGER NOT NULL,
+                    player      TEXT NOT NULL,
+                    run_id      TEXT,
+                    PRIMARY KEY (player_key, article_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS mentions_article ON mentions (article_id);
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, description, content='articles', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                );
+            """)
+        except sqlite3.OperationalError as e:
+            # This sqlite was built without FTS5 - run without search
+            log_error(str(e), "search", "open")
+            db.close()
+            self.available = False
+            return None
+        self.db = db
+        return db
+
+    def add(self, player_name, articles, run_id=None):
+        """Index a run's articles under `player_name`. Stories seen before aren't re-indexed."""
+        if not articles:
+            return 0
+        added = 0
+        with self._lock:
+            db = self._open()
+            if db is None:
+                return 0
+            player_key = normalize_player(player_name)
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                for a in articles:
+                    key = a.link or a.title
+                    cur = db.execute(
+                        "INSERT OR IGNORE INTO articles (key, title, description, link, source, ts) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, a.title, a.description, a.link, a.source, a.ts))
+                    if cur.rowcount:
+                        article_id = cur.lastrowid
+                        db.execute("INSERT INTO articles_fts (rowid, title, description) VALUES (?, ?, ?)",
+                                   (article_id, a.title, a.description))
+                        added += 1
+                    else:
+                        article_id = db.execute("SELECT id FROM articles WHERE key = ?", (key,)).fetchone()[0]
+                    db.execute(
+                        "INSERT OR REPLACE INTO mentions (player_key, article_id, player, run_id) VALUES (?, ?, ?, ?)",
+                        (player_key, article_id, player_name, run_id))
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        return added
+
+    def search(self, terms=None, phrase=None, player=None, since=None, limit=50, cursor=None):
+        """
+        Most recently indexed first. `terms`: words that must all appear
+        ("nightclub", "drink*" for a prefix); `phrase`: words in that order.
+        `player` limits to stories fetched for that player. Needs terms,
+        phrase or player. Returns {"results": [...], "next_cursor": id or None};
+        pass next_cursor back for the next page.
+
+        Walks the FTS (or the player's stories) in id order and stops at
+        `limit` - a page costs the same whether 10 or a million rows match.
+        """
+        match = _fts_query(terms, phrase)
+        player_key = normalize_player(player) if player else None
+        if not match and not player_key:
+            raise ValueError("give terms, phrase or player")
+
+        with self._lock:
+            db = self._open()
+            if db is None:
+                return {"results": [], "next_cursor": None, "error": "search unavailable (no FTS5)"}
+            # Player + words: walk whichever side is likely smaller. A player's
+            # stories are cheap to count; an FTS doclist isn't.
+            walk_player = player_key and (not match or db.execute(
+                "SELECT count(*) FROM mentions WHERE player_key = ?", (player_key,)
+            ).fetchone()[0] <= self.PLAYER_WALK_MAX)
+
+        if walk_player:
+            source, id_col = "mentions pm JOIN articles a ON a.id = pm.article_id", "pm.article_id"
+            where, params = ["pm.player_key = ?"], [player_key]
+            if match:
+                where.append("EXISTS (SELECT 1 FROM articles_fts WHERE articles_fts MATCH ? AND rowid = a.id)")
+                params.append(match)
+        else:
+            source, id_col = "articles_fts f JOIN articles a ON a.id = f.rowid", "f.rowid"
+            where, params = ["articles_fts MATCH ?"], [match]
+            if player_key:
+                where.append("EXISTS (SELECT 1 FROM mentions m WHERE m.player_key = ? AND m.article_id = a.id)")
+                params.append(player_key)
+        if since is not None:
+            where.append("a.ts >= ?")
+            params.append(int(since))
+        if cursor is not None:
+            where.append(f"{id_col} < ?")
+            params.append(int(cursor))
+        sql = f"""
+            SELECT a.id, a.title, a.description, a.link, a.source, a.ts,
+                   (SELECT group_concat(player, char(31)) FROM
+                        (SELECT DISTINCT player FROM mentions WHERE article_id = a.id))
+            FROM {source} WHERE {" AND ".join(where)}
+            ORDER BY {id_col} DESC LIMIT ?"""
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = self.db.execute(sql, params).fetchall()
+        results = [
+            {"title": r[1], "description": r[2], "link": r[3], "source": r[4],
+             "date": format_day(r[5]), "ts": r[5], "players": sorted((r[6] or "").split("\x1f"))}
+            for r in rows[:limit]
+        ]
+        more = len(rows) > limit
+        return {"results": results, "next_cursor": rows[limit - 1][0] if more else None}
+
+    def stats(self):
+        with self._lock:
+            db = self._open()
+            if db is None:
+                return {"articles": 0, "players": 0}
+            articles = db.execute("SELECT count(*) FROM articles").fetchone()[0]
+            players = db.execute("SELECT count(DISTINCT player_key) FROM mentions").fetchone()[0]
+        return {"articles": articles, "players": players}
+
+
+def _fts_query(terms=None, phrase=None):
+    """User words -> an FTS5 MATCH string. Everything is quoted, so FTS
+    operators in the input are just words; a trailing * keeps prefix search."""
+    parts = []
+    for word in (terms or "").split():
+        prefix = word.endswith("*")
+        tokens = tokenize(word)
+        if tokens:
+            quoted = '"' + " ".join(tokens) + '"'  # "N'Golo" -> "n golo", adjacent
+            parts.append(f"{quoted}*" if prefix else quoted)
+    if phrase:
+        tokens = tokenize(phrase)
+        if tokens:
+            parts.append('"' + " ".join(tokens) + '"')
+    return " AND ".join(parts)
+
+
+SEARCH_INDEX = SearchIndex()
+
+
+# ─── Article History ──────────────────────────────────────────────────────────
+# The articles behind every live run, so history can be rescored offline when
+# the dictionaries or scoring change (scout.py --rescore, scout_rescore.py).
+# Stories are stored once, by article_id; a run is just the list of ids it
+# scored, so a player's overlapping daily lookbacks cost a few bytes a story.
+
+class ArticleHistory:
+    """
+    stories      one row per story, keyed by article_id()
+    runs         one row per live run: who, when, lookback, original score
+    run_articles which stories each run scored, in feed order
+    """
 
-    # Aggregate flags for log
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self.db = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        if self.db is not None:
+            return self.db
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                             check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")  # a rescore can read while runs write
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS stories (
+                id          TEXT PRIMARY KEY,
+                title       TEXT NOT NULL,
+                description TEXT NOT NULL,
+                link        TEXT NOT NULL,
+                ts          INTEGER
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS runs (
+                seq             INTEGER PRIMARY KEY,
+                run_id          TEXT NOT NULL,
+                player          TEXT NOT NULL,
+                player_key      TEXT NOT NULL,
+                timestamp       TEXT NOT NULL,
+                days            INTEGER NOT NULL,
+                trigger         TEXT,
+                feed            TEXT,
+                risk_score      INTEGER,
+                dict_version    TEXT,
+                scoring_version INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS runs_player ON runs (player_key, timestamp);
+            CREATE TABLE IF NOT EXISTS run_articles (
+                run         INTEGER NOT NULL,
+                pos         INTEGER NOT NULL,
+                story       TEXT NOT NULL,
+                PRIMARY KEY (run, pos)
+            ) WITHOUT ROWID;
+        """)
+        self.db = db
+        return db
+
+    def add(self, entry, articles):
+        """Store the articles a run scored, under its audit `entry`."""
+        ids = [article_id(a) for a in articles]
+        with self._lock:
+            db = self._open()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.executemany(
+                    "INSERT OR IGNORE INTO stories (id, title, description, link, ts) VALUES (?, ?, ?, ?, ?)",
+                    [(i, a.title, a.description, a.link, a.ts) for i, a in zip(ids, articles)])
+                seq = db.execute(
+                    "INSERT INTO runs (run_id, player, player_key, timestamp, days, trigger, feed, "
+                    "risk_score, dict_version, scoring_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (entry["run_id"], entry["player"], normalize_player(entry["player"]),
+                     entry["timestamp"], entry["days"], entry.get("trigger"), entry.get("feed"),
+                     entry.get("risk_score"), entry.get("dict_version"), entry.get("scoring_version")),
+                ).lastrowid
+                db.executemany("INSERT INTO run_articles (run, pos, story) VALUES (?, ?, ?)",
+                               [(seq, pos, i) for pos, i in enumerate(ids)])
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        return len(ids)
+
+    def stats(self):
+        with self._lock:
+            db = self._open()
+            stories = db.execute("SELECT count(*) FROM stories").fetchone()[0]
+            runs = db.execute("SELECT count(*) FROM runs").fetchone()[0]
+        return {"stories": stories, "runs": runs}
+
+
+ARTICLE_HISTORY = ArticleHistory()
+
+
+# ─── Profiling ────────────────────────────────────────────────────────────────
+# --profile / --trace-memory. Artifacts go to scout_logs/profiles/ and every
+# audit entry written while a profile is active points at them.
+
+_profiling = threading.local()
+
+
+class Profiler:
+    """cProfile and/or tracemalloc around a block.
+
+    Writes <stamp>_<name>.pstats (open with `python3 -m pstats`) and
+    <stamp>_<name>.mem.txt (peak + top allocation sites). Paths are known up
+    front, in .artifacts, so entries logged inside the block can cite them.
+    """
+
+    def __init__(self, name, cpu=True, memory=False, top=25):
+        stamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        base = PROFILE_DIR / f"{stamp}_{re.sub(r'[^a-zA-Z0-9_-]', '_', name)}"
+        self.top = top
+        self.artifacts = {}
+        if cpu:
+            self.artifacts["pstats"] = str(base.with_suffix(".pstats"))
+        if memory:
+            self.artifacts["memory"] = str(base.with_suffix(".mem.txt"))
+        self._profile = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        _profiling.current = self
+        if "memory" in self.artifacts and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if "pstats" in self.artifacts:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.artifacts["pstats"])
+        if "memory" in self.artifacts:
+            self._write_memory()
+        _profiling.current = None
+        return False
+
+    def _write_memory(self):
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+        # Leave out the profiler's own bookkeeping and import machinery
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ])
+        stats = snapshot.statistics("lineno")
+        lines = [
+            f"current: {current / 1024:.1f} KiB  peak: {peak / 1024:.1f} KiB",
+            f"top {self.top} allocation sites (still live at exit):",
+        ]
+        lines.extend(str(stat) for stat in stats[:self.top])
+        Path(self.artifacts["memory"]).write_text("\n".join(lines) + "\n")
+
+
+def active_profile():
+    """The Profiler running on this thread, if any."""
+    return getattr(_profiling, "current", None)
+
+
+# ─── Core Runner ──────────────────────────────────────────────────────────────
+# This is what everything calls: CLI, web UI, scheduler.
+
+def classify_articles(articles, matcher=None, deadline=None):
+    """Steps 2-3: FREE tier keyword scan, then CHEAP tier false-positive filter.
+    If `deadline` runs out, returns findings for the articles done so far."""
+    matcher = matcher or current_matcher()
+    findings = []
+    for a in articles:
+        if deadline is not None and deadline.stop("classify"):
+            break
+        index = a.index  # one tokenization per article, shared by both tiers, then dropped
+        raw = free_tier_analyze(a, matcher, index)
+        findings.append(cheap_tier_filter(a, raw, matcher, index))
+    return findings
+
+
+def assess(player_name, articles, findings, now=None):
+    """Steps 4-6: score, self-check, expensive-tier review flags."""
+    tally = Tally.of(articles, findings)
+    score = tally.risk_score()
+    return score, audit_tally(tally, score, now), review_flags(tally, score)
+
+
+def assess_windows(player_name, articles, findings, windows, now=None):
+    """
+    assess() for several lookbacks at once, from articles fetched for the
+    widest. One pass newest-first over the classified articles, snapshotting
+    the running Tally as each window's cutoff goes by.
+    Returns {days: (articles, findings, score, audit, review_items)}, the
+    lists in feed order. Undated articles count in every window, as at fetch.
+    """
+    now_ts = int((now or datetime.now()).timestamp())
+    newest_first = sorted(range(len(articles)),
+                          key=lambda i: -articles[i].ts if articles[i].ts is not None else float("-inf"))
+    tally = Tally()
+    members = []
+    pos = 0
+    out = {}
+    for days in sorted(windows):
+        cutoff = now_ts - days * DAY
+        while pos < len(newest_first):
+            i = newest_first[pos]
+            if articles[i].ts is not None and articles[i].ts < cutoff:
+                break
+            tally.add(articles[i], findings[i])
+            members.append(i)
+            pos += 1
+        snapshot = tally.copy()
+        score = snapshot.risk_score()
+        keep = sorted(members)
+        out[days] = ([articles[i] for i in keep], [findings[i] for i in keep], score,
+                     audit_tally(snapshot, score, now), review_flags(snapshot, score))
+    return out
+
+
+def build_log_entry(player_name, articles, findings, score, audit, review_items,
+                    trigger, days, duration_ms=0, errors=None, run_id=None, timestamp=None,
+                    dict_version=None):
+    """The audit-log shape every run writes, live or historical."""
+    red_agg, green_agg = _flag_summary(findings)
+    return {
+        "run_id": run_id or str(uuid.uuid4())[:8],
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "player": player_name,
+        "trigger": trigger,
+        "days": days,
+        "status": "ok",
+        "articles_found": len(articles),
+        "risk_score": score,
+        "risk_label": categorize_risk(score),
+        "red_flags": red_agg,
+        "green_flags": green_agg,
+        "self_check": audit,
+        "review_items": review_items,
+        "duration_ms": duration_ms,
+        "errors": errors or [],
+        "dict_version": dict_version or current_matcher().version,
+        "scoring_version": SCORING_VERSION,
+        "tiers": _tiers(review_items),
+    }
+
+
+def _flag_summary(findings):
+    """{category: [distinct keywords]} for red and green flags across findings."""
     red_agg = {}
     green_agg = {}
-    for f in filtered_findings:
+    for f in findings:
         for cat, hits in f["red"].items():
             red_agg.setdefault(cat, []).extend(hits)
         for cat, hits in f["green"].items():
@@ -711,13 +2325,22 @@ def run_scout(player_name, days=14, trigger="manual"):
         red_agg[cat] = list(set(red_agg[cat]))
     for cat in green_agg:
         green_agg[cat] = list(set(green_agg[cat]))
+    return red_agg, green_agg
 
-    # Build log entry
-    log_entry = {
-        "run_id": run_id,
-        "timestamp": datetime.now().isoformat(),
-        "player": player_name,
-        "trigger": trigger,
+
+def _tiers(review_items):
+    return {
+        "free": "keyword_matching",
+        "cheap": "false_positive_filter",
+        "expensive": f"{len(review_items)} items flagged for human review",
+    }
+
+
+def window_view(player_name, days, articles, findings, score, audit, review_items, partial=None):
+    """One lookback of a multi-window run: what the UI needs to show it
+    without asking the server again."""
+    red_agg, green_agg = _flag_summary(findings)
+    return {
         "days": days,
         "articles_found": len(articles),
         "risk_score": score,
@@ -726,24 +2349,215 @@ def run_scout(player_name, days=14, trigger="manual"):
         "green_flags": green_agg,
         "self_check": audit,
         "review_items": review_items,
-        "duration_ms": duration_ms,
-        "errors": errors,
-        "tiers": {
-            "free": "keyword_matching",
-            "cheap": "false_positive_filter",
-            "expensive": f"{len(review_items)} items flagged for human review",
-        },
+        "tiers": _tiers(review_items),
+        "report": generate_report(player_name, articles, findings, score, audit, review_items, partial),
     }
 
-    # Log it
-    run_file = log_run(log_entry)
 
+def fetch_failed_entry(player_name, error, trigger, days, duration_ms=0, run_id=None, feed="player",
+                       dict_version=None):
+    """The audit-log shape of a run whose fetch failed: no score, no articles
+    count - so it can't be mistaken for a clean, quiet week."""
     return {
+        "run_id": run_id or str(uuid.uuid4())[:8],
+        "timestamp": datetime.now().isoformat(),
+        "player": player_name,
+        "trigger": trigger,
+        "days": days,
+        "status": "fetch_failed",
+        "articles_found": None,
+        "risk_score": None,
+        "risk_label": "FETCH_FAILED",
+        "fetch_error": error.to_dict(),
+        "duration_ms": duration_ms,
+        "errors": [f"Fetch failed: {error}"],
+        "dict_version": dict_version or current_matcher().version,
+        "feed": feed,
+    }
+
+
+def cached_result(player_name, days, matcher=None, windows=None):
+    """A fresh cached result for this player/lookback (and these extra
+    windows, if asked for), or None."""
+    matcher = matcher or current_matcher()
+    hit = RESULT_CACHE.get(player_name, days)
+    if hit is not None and windows and not {str(w) for w in windows} <= set(hit[0].get("windows", ())):
+        return None
+    # A result scored with older dictionaries isn't the same answer any more
+    if hit is not None and hit[0]["log"].get("dict_version") == matcher.version:
+        result, age = hit
+        return dict(result, cached=True, cache_age_s=int(age))
+    return None
+
+
+def run_scout(player_name, days=14, trigger="manual", force=False, articles=None, feed="player",
+              profile=False, trace_memory=False, windows=None, deadline=None):
+    """
+    Run the full scouting pipeline. Returns a complete result dict.
+    Everything is logged automatically.
+
+    A fresh cached result (see CACHE_TTL) comes back immediately with
+    "cached": True and no new audit entry. force=True always reruns.
+    Pass `articles` to skip the fetch (e.g. a shared club feed) and
+    `feed` to record where they came from.
+
+    windows=(7, 30, 90) fetches the widest lookback once, classifies each
+    article once and scores every window in one pass (assess_windows). The
+    result gains "windows": {"7": window_view(...), ...}; `days` is still the
+    run that's reported, logged and cached.
+
+    Every live run is diffed against the player's previous run at the same
+    lookback (see compute_delta): the entry gets "delta", the result a short
+    "delta_report".
+
+    If the feed can't be fetched, the failure is logged (status
+    "fetch_failed", no score), nothing is cached, and FetchError is raised
+    with the entry on it as `log_entry`.
+
+    `deadline` (a Deadline) bounds the run. If it runs out mid-run, the
+    articles scored so far are reported and logged with status "partial"
+    and a "partial" block saying where it stopped; partial results aren't
+    cached or diffed against. Out of time before anything was scored is a
+    failed fetch (kind "deadline"). If it's cancelled, Cancelled is raised
+    at the next check and nothing is logged.
+
+    profile / trace_memory run it under a Profiler (unless one is already
+    active, e.g. a profiled scheduler batch); the audit entry records the
+    artifact paths under "profile".
+    """
+    if (profile or trace_memory) and active_profile() is None:
+        with Profiler(f"scout_{player_name}", cpu=profile, memory=trace_memory):
+            return run_scout(player_name, days, trigger, force, articles, feed, windows=windows,
+                             deadline=deadline)
+
+    windows = sorted(set(windows) | {days}) if windows else None
+    matcher = current_matcher()
+    if not force:
+        hit = cached_result(player_name, days, matcher, windows)
+        CACHE_LOOKUPS.inc(result="miss" if hit is None else "hit")
+        if hit is not None:
+            return hit
+    RUNS.inc(trigger=trigger)
+
+    run_id = str(uuid.uuid4())[:8]
+    start = time.time()
+    errors = []
+    deadline = deadline or Deadline()
+
+    def failed(e):
+        e.log_entry = fetch_failed_entry(
+            player_name, e, trigger, days, int((time.time() - start) * 1000), run_id, feed, matcher.version)
+        log_run(e.log_entry)
+        return e
+
+    # Step 1: Fetch (FREE - uses Google News RSS, no API cost)
+    with STAGE_SECONDS.time(stage="fetch"):
+        if articles is None:
+            try:
+                articles = fetch_news(player_name, days=windows[-1] if windows else days, deadline=deadline)
+            except FetchError as e:
+                deadline.check("fetch")  # cancelled while failing: nobody's listening
+                raise failed(e)
+    fetched = articles
+
+    # Steps 2-3: FREE tier keyword scan, CHEAP tier false-positive filter
+    with STAGE_SECONDS.time(stage="classify"):
+        filtered_findings = classify_articles(articles, matcher, deadline)
+
+    partial = None
+    if deadline.stage:
+        if not filtered_findings:
+            raise failed(FetchError(f"ran out of time during {deadline.stage}, nothing scored", "deadline"))
+        articles = articles[:len(filtered_findings)]
+        partial = {"stage": deadline.stage, "articles_fetched": len(fetched),
+                   "articles_scored": len(articles), "budget_s": deadline.budget}
+        errors.append(f"Out of time during {deadline.stage}: scored {len(articles)} of {len(fetched)} articles")
+        RUNS_PARTIAL.inc(stage=deadline.stage)
+
+    # Steps 4-6: score, self-check, EXPENSIVE tier review flags
+    with STAGE_SECONDS.time(stage="assess"):
+        if windows:
+            scored = assess_windows(player_name, articles, filtered_findings, windows)
+            articles, filtered_findings, score, audit, review_items = scored[days]
+        else:
+            score, audit, review_items = assess(player_name, articles, filtered_findings)
+    if not articles:
+        errors.append("No articles found")
+
+    # Step 7: Generate report
+    deadline.check("report")
+    with STAGE_SECONDS.time(stage="report"):
+        report = generate_report(player_name, articles, filtered_findings, score, audit, review_items, partial)
+        views = {str(w): window_view(player_name, w, *scored[w], partial=partial)
+                 for w in windows} if windows else None
+
+    # Step 8: What changed since this player's last run (same lookback)
+    with STAGE_SECONDS.time(stage="delta"):
+        state = run_state(run_id, articles, filtered_findings, score)
+        delta = compute_delta(RUN_STATE.get(player_name, days), state)
+        delta_report = generate_delta_report(player_name, delta)
+
+    duration_ms = int((time.time() - start) * 1000)
+
+    # Build log entry
+    log_entry = build_log_entry(
+        player_name, articles, filtered_findings, score, audit, review_items,
+        trigger=trigger, days=days, duration_ms=duration_ms, errors=errors, run_id=run_id,
+        dict_version=matcher.version,
+    )
+    log_entry["feed"] = feed
+    log_entry["delta"] = delta
+    if partial:
+        log_entry["status"] = "partial"
+        log_entry["partial"] = partial
+    if feed == "player":
+        log_entry["fetch_limit"] = int(limiter_for(NEWS_URL).limit)  # concurrency it was fetched under
+    if views:
+        log_entry["windows"] = {
+            w: dict({k: v[k] for k in ("articles_found", "risk_score", "risk_label")},
+                    confidence=v["self_check"]["confidence"])
+            for w, v in views.items()
+        }
+    if active_profile() is not None:
+        log_entry["profile"] = active_profile().artifacts
+
+    # Log it - the last point a cancel can stop the run
+    deadline.check("log")
+    with STAGE_SECONDS.time(stage="log"):
+        run_file = log_run(log_entry)
+        if not partial:  # the next run diffs against a complete one
+            RUN_STATE.put(player_name, days, state)
+
+    # Searchable later (/api/search). A broken index mustn't break the scout.
+    with STAGE_SECONDS.time(stage="index"):
+        try:
+            SEARCH_INDEX.add(player_name, fetched, run_id)
+        except sqlite3.Error as e:
+            log_error(str(e), player_name, "search_index")
+
+    # Kept for offline rescoring (scout.py --rescore) - complete runs only
+    if not partial:
+        with STAGE_SECONDS.time(stage="history"):
+            try:
+                ARTICLE_HISTORY.add(log_entry, articles)
+            except sqlite3.Error as e:
+                log_error(str(e), player_name, "article_history")
+
+    result = {
         "run_id": run_id,
         "report": report,
+        "delta_report": delta_report,
         "log": log_entry,
         "log_file": run_file,
     }
+    if views:
+        result["windows"] = views
+    if partial:
+        result["partial"] = partial
+    else:
+        RESULT_CACHE.put(player_name, days, result)
+
+    return dict(result, cached=False)
 
 
 # ─── Watchlist ────────────────────────────────────────────────────────────────
@@ -755,7 +2569,215 @@ def load_watchlist():
 
 
 def save_watchlist(data):
-    WATCHLIST_FILE.write_text(json.dumps(data, indent=2))
+    """Write-then-rename: readers see the old list or the new one, never half."""
+    tmp = WATCHLIST_FILE.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, WATCHLIST_FILE)
+
+
+_WATCHLIST_LOCK = threading.Lock()
+
+
+def edit_watchlist(fn):
+    """
+    The one way to change watchlist.json: load it, fn(wl) edits it in place,
+    save if anything changed. Serialized across threads (web requests, batch
+    workers) and, by an flock on scout_logs/watchlist.lock, across processes
+    (scheduler, shards, CLI imports) - nobody's write is lost to another's.
+    Returns whatever fn returns.
+    """
+    WATCHLIST_LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with _WATCHLIST_LOCK, open(WATCHLIST_LOCK_FILE, "w") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        wl = load_watchlist()
+        before = json.dumps(wl, sort_keys=True)
+        result = fn(wl)
+        if json.dumps(wl, sort_keys=True) != before:
+            save_watchlist(wl)
+        return result
+
+
+def player_entry(p):
+    """Watchlist players may be bare strings or dicts - always hand back a dict.
+    Dicts can carry "club" (or "league") for squad fetches and "aliases",
+    handed back as a list whatever the file says (a lone string is one alias)."""
+    if isinstance(p, str):
+        return {"name": p}
+    aliases = p.get("aliases", [])
+    if isinstance(aliases, list):
+        return p
+    if isinstance(aliases, str):
+        aliases = [aliases] if aliases.strip() else []
+    return dict(p, aliases=list(aliases) if isinstance(aliases, (list, tuple)) else [])
+
+
+def update_player(p, **fields):
+    """Merge new fields into a watchlist entry without dropping club/aliases."""
+    return dict(player_entry(p), **fields)
+
+
+def watchlist_index(players):
+    """normalized name or alias -> position in `players`. First entry wins."""
+    index = {}
+    for i, p in enumerate(map(player_entry, players)):
+        for name in [p.get("name", ""), *p.get("aliases", [])]:
+            key = normalize_player(name)
+            if key:
+                index.setdefault(key, i)
+    return index
+
+
+def merge_players(wl, records):
+    """
+    Add many players to `wl` in one pass; the caller saves once.
+    A record (name string or dict with name/club/league/aliases/...) that
+    matches an existing player by name or alias, accent- and case-blind,
+    fills in club/league and adds aliases - it never overwrites scores.
+    "aliases" is a list; a lone string counts as one alias, anything else
+    makes the record invalid.
+    Returns {"added", "updated", "unchanged", "invalid"} counts.
+    """
+    players = wl.setdefault("players", [])
+    index = watchlist_index(players)
+    counts = {"added": 0, "updated": 0, "unchanged": 0, "invalid": 0}
+    for rec in records:
+        given = rec.get("aliases") if isinstance(rec, dict) else None
+        rec = player_entry(rec) if isinstance(rec, (str, dict)) else {}
+        name = " ".join(str(rec.get("name") or "").split())
+        if not name or not (given is None or isinstance(given, (str, list, tuple))):
+            counts["invalid"] += 1
+            continue
+        # Distinct aliases only, and never the name itself
+        aliases = {}
+        for a in rec.get("aliases", []):
+            a = " ".join(str(a).split())
+            if a and normalize_player(a) != normalize_player(name):
+                aliases.setdefault(normalize_player(a), a)
+        aliases = list(aliases.values())
+        keys = [normalize_player(n) for n in [name, *aliases]]
+        pos = next((index[k] for k in keys if k in index), None)
+
+        if pos is None:
+            entry = dict(rec, name=name)
+            entry.pop("aliases", None)
+            if aliases:
+                entry["aliases"] = aliases
+            entry.setdefault("last_score", None)
+            players.append(entry)
+            pos = len(players) - 1
+            counts["added"] += 1
+        else:
+            old = player_entry(players[pos])
+            entry = dict(old)
+            for field in ("club", "league"):
+                if rec.get(field) and not old.get(field):
+                    entry[field] = rec[field]
+            known = {normalize_player(n) for n in [old.get("name", ""), *old.get("aliases", [])]}
+            extra = [a for a, key in zip([name, *aliases], keys) if key not in known]
+            if extra:
+                entry["aliases"] = list(old.get("aliases", [])) + extra
+            if entry == old:
+                counts["unchanged"] += 1
+                continue
+            players[pos] = entry
+            counts["updated"] += 1
+        for key in keys:
+            index.setdefault(key, pos)
+    return counts
+
+
+# ─── Name Matching ────────────────────────────────────────────────────────────
+# Which watchlist players does this article mention? One lookup table for the
+# whole list, built once, matched on whole words of accent-folded text.
+
+class PlayerMatcher:
+    def __init__(self, players):
+        """`players` is an iterable of (name, [aliases])."""
+        self._owners = {}   # token tuple -> set of player names
+        self._lengths = {}  # first token -> spelling lengths starting with it
+        for name, aliases in players:
+            for spelling in [name, *aliases]:
+                tokens = tuple(tokenize(spelling))
+                if not tokens:
+                    continue
+                self._owners.setdefault(tokens, set()).add(name)
+                self._lengths.setdefault(tokens[0], set()).add(len(tokens))
+
+    @classmethod
+    def from_watchlist(cls, wl=None):
+        wl = wl if wl is not None else load_watchlist()
+        players = []
+        for p in map(player_entry, wl.get("players", [])):
+            if p.get("name"):
+                players.append((p["name"], p.get("aliases", [])))
+        return cls(players)
+
+    def __len__(self):
+        return len({n for names in self._owners.values() for n in names})
+
+    def players_in(self, text):
+        """Set of player names mentioned in `text`."""
+        tokens = tokenize(text)
+        found = set()
+        for i, tok in enumerate(tokens):
+            lengths = self._lengths.get(tok)
+            if not lengths:
+                continue
+            for n in lengths:
+                owners = self._owners.get(tuple(tokens[i:i + n]))
+                if owners:
+                    found |= owners
+        return found
+
+
+# ─── Warm Worker Client ───────────────────────────────────────────────────────
+# If scout_worker.py is running, hand the scout to it: its matchers, HTTP
+# connections and result cache are already warm. If not, the caller runs
+# in-process as usual.
+
+class WorkerError(Exception):
+    """The worker took the request but no answer came back. It may have run
+    the scout (and logged it), so the caller mustn't simply run it again."""
+
+
+def scout_via_worker(player_name, days=14, trigger="cli", force=False, timeout=120, deadline=None):
+    """
+    Run a scout on the warm worker. Returns the result dict, or None if no
+    worker is up (nothing listening - safe to run it here instead). Raises
+    WorkerError if the worker was reached but didn't answer in `timeout`
+    seconds (or in `deadline`, the run's budget on the worker, plus a margin).
+    """
+    if not hasattr(socket, "AF_UNIX") or not WORKER_SOCKET.exists():
+        return None
+    request = {"op": "scout", "player": player_name, "days": days,
+               "trigger": trigger, "force": force, "deadline": deadline}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(max(timeout, deadline + 10) if deadline else timeout)
+        try:
+            sock.connect(str(WORKER_SOCKET))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None  # stale socket - no worker behind it
+        except OSError as e:
+            raise WorkerError(f"couldn't reach the worker ({e})") from e
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                reply = json.loads(f.readline() or b"null")
+        except (OSError, ValueError) as e:
+            log_error(f"worker gave no answer: {e}", player_name, "scout_via_worker")
+            raise WorkerError(f"worker gave no answer ({e})") from e
+        if reply is None:
+            log_error("worker hung up mid-request", player_name, "scout_via_worker")
+            raise WorkerError("worker hung up mid-request")
+    if reply and "fetch_error" in reply:
+        # The worker tried and upstream failed - don't fetch all over again here
+        raise FetchError.from_dict(reply["fetch_error"])
+    if not reply or "error" in reply:
+        if reply:
+            log_error(reply["error"], player_name, "scout_via_worker")
+        return None
+    return reply
 
 
 # ─── CLI ──────────────────────────────────────────────────────────────────────
@@ -765,9 +2787,26 @@ def main():
         print(__doc__)
         sys.exit(0)
 
+    if sys.argv[1] == "--backfill":
+        import scout_backfill
+        scout_backfill.main(sys.argv[2:])
+        return
+
+    if sys.argv[1] == "--rescore":
+        import scout_rescore
+        scout_rescore.main(sys.argv[2:])
+        return
+
+    if sys.argv[1] in ("--import", "--export"):
+        import scout_watchlist
+        scout_watchlist.main(sys.argv[1:])
+        return
+
     player_name = sys.argv[1]
     days = 14
     output_json = False
+    force = False
+    budget = None
 
     for i, arg in enumerate(sys.argv[2:], start=2):
         if arg == "--days" and i + 1 < len(sys.argv):
@@ -775,14 +2814,48 @@ def main():
                 days = int(sys.argv[i + 1])
             except ValueError:
                 pass
+        if arg == "--deadline" and i + 1 < len(sys.argv):
+            try:
+                budget = float(sys.argv[i + 1])
+            except ValueError:
+                pass
         if arg == "--json":
             output_json = True
+        if arg in ("--force", "--refresh"):
+            force = True
+    profile = "--profile" in sys.argv
+    trace_memory = "--trace-memory" in sys.argv
+    if profile or trace_memory:
+        force = True  # a cache hit has nothing to profile
 
     print(f"[*] Scouting: {player_name}")
     print(f"[*] Looking back: {days} days")
     print(f"[*] Fetching news...")
 
-    result = run_scout(player_name, days=days, trigger="cli")
+    result = None
+    try:
+        if "--no-worker" not in sys.argv and not (profile or trace_memory):
+            result = scout_via_worker(player_name, days=days, trigger="cli", force=force, deadline=budget)
+            if result is not None:
+                print(f"[*] Served by warm worker (pid {result.get('worker_pid', '?')})")
+        if result is None:
+            result = run_scout(player_name, days=days, trigger="cli", force=force,
+                               profile=profile, trace_memory=trace_memory,
+                               deadline=Deadline(budget) if budget else None)
+    except FetchError as e:
+        print(f"[!] Couldn't fetch news: {e} ({e.attempts} attempts)")
+        print("[!] Logged as a failed run - no score given. Try again later.")
+        sys.exit(2)
+    except WorkerError as e:
+        print(f"[!] {e} - not rerunning here, it may have scouted already.")
+        print("[!] Check the audit log, or rerun with --no-worker.")
+        sys.exit(2)
+    if result["cached"]:
+        print(f"[*] Cached result from {result['cache_age_s']}s ago (--force to refresh)")
+    if result.get("partial"):
+        p = result["partial"]
+        print(f"[!] PARTIAL: out of time during {p['stage']} - "
+              f"{p['articles_scored']} of {p['articles_fetched']} articles scored")
 
     if not result["log"]["articles_found"]:
         print("[!] No articles found. Try a different name or longer --days.")
@@ -790,12 +2863,17 @@ def main():
 
     if output_json:
         print(json.dumps(result["log"], indent=2, default=str))
+    elif "--delta" in sys.argv and result.get("delta_report"):
+        print()
+        print(result["delta_report"])
     else:
         print()
         print(result["report"])
 
     print(f"\n[*] Logged to: {result['log_file']}")
     print(f"[*] Run ID: {result['run_id']}")
+    for kind, path in result["log"].get("profile", {}).items():
+        print(f"[*] Profile ({kind}): {path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Soccer Player Scout - Backfill
+Rebuilds risk history from archived RSS responses or JSONL article dumps.
+
+Streams the archive once, routes every article to each watchlist player it
+names, spools those to disk per player, then scores each player's history in
+parallel: one entry per day that had news, scored over the lookback window
+ending that day (UTC), stamped with that day's date.
+
+Memory stays flat however big the archive: routing buffers FLUSH_EVERY
+lines, each worker dedupes and date-sorts its player's spool on disk
+(SORT_CHUNK lines at a time), walks it day by day holding only the
+lookback window, and writes its entries to a part file the parent appends.
+
+Usage:
+    python3 scout.py --backfill archive/                # .xml/.rss/.jsonl, .gz ok
+    python3 scout.py --backfill dump.jsonl --days 30 --workers 8
+
+JSONL lines need a title and ideally description, link and a date
+(ts / published / pubDate / date - epoch, RFC 822 or ISO 8601).
+
+Entries go to scout_logs/backfill/<backfill_id>.jsonl, not audit.jsonl -
+they're reconstructions, not runs that happened.
+"""
+
+import os
+import sys
+import json
+import gzip
+import heapq
+import uuid
+import shutil
+import hashlib
+import tempfile
+from collections import deque
+from itertools import groupby
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from scout import (
+    LOG_DIR, DAY, Article, PlayerMatcher, load_watchlist, log_error, parse_pubdate,
+    classify_articles, assess, build_log_entry, current_matcher, _rss_item,
+)
+
+BACKFILL_DIR = LOG_DIR / "backfill"
+FLUSH_EVERY = 20000  # spooled lines held in memory before hitting disk
+SORT_CHUNK = 50000   # spool lines sorted in memory at a time before merging from disk
+
+
+# ─── Streaming Readers ────────────────────────────────────────────────────────
+
+def iter_archive(path):
+    """Yield Articles from a file or a directory tree of dumps."""
+    path = Path(path)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for f in files:
+        name = f.name.lower()
+        opener = gzip.open if name.endswith(".gz") else open
+        name = name[:-3] if name.endswith(".gz") else name
+        try:
+            if name.endswith((".xml", ".rss")):
+                with opener(f, "rb") as fh:
+                    yield from _iter_rss(fh)
+            elif name.endswith((".jsonl", ".ndjson")):
+                with opener(f, "rt", encoding="utf-8") as fh:
+                    yield from _iter_jsonl(fh, f)
+        except (OSError, ET.ParseError) as e:
+            log_error(str(e), "backfill", f"read {f}")
+
+
+def _iter_rss(fh):
+    """iterparse items one at a time and detach them, so a huge file stays small."""
+    stack = []
+    for event, elem in ET.iterparse(fh, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag == "item":
+            yield _rss_item(elem)
+            if stack:
+                stack[-1].remove(elem)
+
+
+def _iter_jsonl(fh, source):
+    for n, line in enumerate(fh, 1):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError:
+            log_error("bad JSON line", "backfill", f"{source}:{n}")
+            continue
+        ts = _coerce_ts(next(
+            (raw[k] for k in ("ts", "published", "pubDate", "date") if raw.get(k)), None
+        ))
+        yield Article(
+            raw.get("title") or "",
+            raw.get("link") or raw.get("url") or "",
+            raw.get("description") or raw.get("summary") or "",
+            ts,
+        )
+
+
+def _coerce_ts(value):
+    """Epoch number, RFC 822 or ISO 8601 -> epoch seconds (naive ISO = UTC)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    ts = parse_pubdate(value)
+    if ts is not None:
+        return ts
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+# ─── Routing ──────────────────────────────────────────────────────────────────
+
+def _spool_path(spool_dir, player):
+    digest = hashlib.sha1(player.encode()).hexdigest()[:12]
+    return spool_dir / f"{digest}.jsonl"
+
+
+def spool_articles(articles, matcher, spool_dir):
+    """Route each article to every player it names. Returns (seen, routed, per-player counts)."""
+    buffers = {}
+    counts = {}
+    seen = routed = buffered = 0
+
+    def flush():
+        for player, lines in buffers.items():
+            with open(_spool_path(spool_dir, player), "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        buffers.clear()
+
+    for article in articles:
+        seen += 1
+        players = matcher.players_in(article.text)
+        if not players:
+            continue
+        routed += 1
+        line = json.dumps(article.to_dict()) + "\n"
+        for player in players:
+            buffers.setdefault(player, []).append(line)
+            counts[player] = counts.get(player, 0) + 1
+            buffered += 1
+        if buffered >= FLUSH_EVERY:
+            flush()
+            buffered = 0
+
+    flush()
+    return seen, routed, counts
+
+
+# ─── Historical Scoring ───────────────────────────────────────────────────────
+
+def _sorted_lines(lines, key, tmp_dir):
+    """Yield `lines` ordered by key(line), SORT_CHUNK in memory at a time:
+    sorted runs spill to temp files and are merged back."""
+    runs = []
+    chunk = []
+
+    def spill():
+        chunk.sort(key=key)
+        run = tempfile.TemporaryFile("w+", encoding="utf-8", dir=tmp_dir)
+        run.writelines(chunk)
+        run.seek(0)
+        runs.append(run)
+        chunk.clear()
+
+    try:
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= SORT_CHUNK:
+                spill()
+        if not runs:
+            yield from sorted(chunk, key=key)
+            return
+        if chunk:
+            spill()
+        yield from heapq.merge(*runs, key=key)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _stories(spool_file, counts):
+    """
+    A spool's dated stories as Articles, oldest first, each story once
+    (archived snapshots overlap heavily - the first copy spooled wins).
+    Two on-disk sorts: by story to drop repeats, then by date.
+    Undated lines are counted in counts["undated"] and skipped.
+    """
+    tmp_dir = spool_file.parent
+
+    def tagged():
+        with open(spool_file, encoding="utf-8") as f:
+            for n, line in enumerate(f):
+                d = json.loads(line)
+                if d.get("ts") is None:
+                    counts["undated"] += 1
+                    continue
+                story = hashlib.sha1((d.get("link") or d.get("title") or "").encode()).hexdigest()
+                yield f"{story}\t{n:012d}\t{int(d['ts'])}\t{line}"
+
+    def first_copies():
+        by_story = _sorted_lines(tagged(), lambda l: l[:53], tmp_dir)
+        for _, copies in groupby(by_story, key=lambda l: l[:40]):
+            _, n, ts, line = next(copies).split("\t", 3)
+            yield f"{ts}\t{n}\t{line}"
+
+    by_date = _sorted_lines(first_copies(), lambda l: tuple(map(int, l.split("\t", 2)[:2])), tmp_dir)
+    for line in by_date:
+        yield Article.from_dict(json.loads(line.split("\t", 2)[2]))
+
+
+def score_history(player, spool_file, days, backfill_id, out_file=None):
+    """
+    Score one player's spooled articles as a daily series (UTC days).
+    Runs in a worker process. Walks the stories day by day keeping only
+    the lookback window, and writes entries to `out_file` (default: beside
+    the spool) rather than returning them. Returns (player, out_file,
+    entries, undated).
+    """
+    if days < 1:
+        raise ValueError(f"lookback must be at least 1 day, got {days}")
+    spool_file = Path(spool_file)
+    out_file = Path(out_file or spool_file.with_suffix(".part"))
+    matcher = current_matcher()
+    counts = {"undated": 0}
+    window = deque()  # (article, findings), oldest first
+    window_s = days * DAY
+    written = 0
+    with open(out_file, "w", encoding="utf-8") as out:
+        for day, todays in groupby(_stories(spool_file, counts), key=lambda a: a.day):
+            todays = list(todays)
+            window.extend(zip(todays, classify_articles(todays, matcher)))
+            as_of = (day + 1) * DAY - 1
+            while window and window[0][0].ts <= as_of - window_s:
+                window.popleft()
+            articles = [a for a, _ in window]
+            findings = [f for _, f in window]
+            when = datetime.fromtimestamp(as_of, tz=timezone.utc)
+            score, audit, review_items = assess(player, articles, findings, now=when)
+            entry = build_log_entry(
+                player, articles, findings, score, audit, review_items,
+                trigger="backfill", days=days, timestamp=when.isoformat(),
+                dict_version=matcher.version,
+            )
+            entry["backfill_id"] = backfill_id
+            out.write(json.dumps(entry, default=str) + "\n")
+            written += 1
+
+    return player, out_file, written, counts["undated"]
+
+
+def run_backfill(path, days=14, workers=None, wl=None):
+    """Stream `path`, score every watchlist player's history, write one JSONL file."""
+    if days < 1:
+        raise ValueError(f"lookback must be at least 1 day, got {days}")
+    matcher = PlayerMatcher.from_watchlist(wl)
+    if not len(matcher):
+        print("[!] Watchlist is empty - nothing to route articles to.")
+        return None
+
+    backfill_id = datetime.now().strftime("%Y%m%dT%H%M%S") + "_" + str(uuid.uuid4())[:4]
+    BACKFILL_DIR.mkdir(parents=True, exist_ok=True)
+    out_file = BACKFILL_DIR / f"{backfill_id}.jsonl"
+    spool_dir = Path(tempfile.mkdtemp(prefix="spool_", dir=BACKFILL_DIR))
+
+    print(f"[*] Backfill {backfill_id}: {path}")
+    print(f"[*] Players: {len(matcher)} | Lookback: {days} days")
+    try:
+        seen, routed, counts = spool_articles(iter_archive(path), matcher, spool_dir)
+        print(f"[*] Read {seen} articles, {routed} mention a watchlist player")
+
+        written = 0
+        with open(out_file, "w", encoding="utf-8") as out, \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(score_history, player, _spool_path(spool_dir, player), days, backfill_id)
+                for player in counts
+            ]
+            for fut in as_completed(futures):
+                try:
+                    player, part, n, undated = fut.result()
+                except Exception as e:
+                    log_error(str(e), "backfill", "score_history")
+                    print(f"    [!] {e}")
+                    continue
+                with open(part, encoding="utf-8") as f:
+                    shutil.copyfileobj(f, out)
+                part.unlink()
+                written += n
+                note = f" ({undated} undated skipped)" if undated else ""
+                print(f"    {player}: {n} daily entries{note}")
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+    print(f"[*] Done. {written} historical entries -> {out_file}")
+    return {"backfill_id": backfill_id, "articles": seen, "routed": routed,
+            "entries": written, "file": str(out_file)}
+
+
+def main(argv):
+    """scout.py --backfill PATH [--days N] [--workers N]"""
+    if not argv or argv[0].startswith("-"):
+        print(__doc__)
+        sys.exit(1)
+    path = argv[0]
+    days = load_watchlist().get("settings", {}).get("days", 14)
+    workers = None
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg in ("--days", "--workers") and i + 1 < len(argv):
+            try:
+                value = int(argv[i + 1])
+            except ValueError:
+                continue
+            if arg == "--days":
+                days = value
+            else:
+                workers = value
+    if days < 1:
+        print(f"[!] --days must be at least 1, got {days}")
+        sys.exit(1)
+    if not os.path.exists(path):
+        print(f"[!] No such file or directory: {path}")
+        sys.exit(1)
+    run_backfill(path, days=days, workers=workers)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
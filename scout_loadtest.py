@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Soccer Player Scout - Load Test
+Drives a scout_web instance with a weighted mix of requests from N
+concurrent clients, then reports throughput, latency percentiles and error
+rates per endpoint. Results are saved as JSON so runs can be compared
+across server changes.
+
+Usage:
+    python3 scout_loadtest.py --spawn                         # stub + web server on free ports
+    python3 scout_loadtest.py --spawn --stub-latency 300 --concurrency 32 --duration 60
+    python3 scout_loadtest.py --url http://localhost:8888 --requests 2000
+    python3 scout_loadtest.py --compare before.json after.json
+
+Options:
+    --url URL            server to hit (default: spawn one, see --spawn)
+    --spawn              start scout_stub.py + scout_web.py for the run, stop them after
+    --stub-latency MS    feed latency for the spawned stub (default 200)
+    --stub-errors F      feed error rate for the spawned stub (default 0)
+    --mix SPEC           weights per op (default page=1,watchlist=4,logs=3,scout=2)
+    --concurrency N      client threads (default 8)
+    --duration S         run for S seconds (default 20) ...
+    --requests N         ... or stop after N requests
+    --players N          distinct players /api/scout picks from (default 20)
+    --force-rate F       fraction of scouts sent with force=true (default 0.5)
+    --label TEXT         stored with the results, shown by --compare
+    --out PATH           results file (default scout_logs/loadtest/<timestamp>.json)
+
+Ops: page = GET /, watchlist = GET /api/watchlist,
+     logs = GET /api/logs?limit=50, scout = POST /api/scout
+
+A spawned server runs in a throwaway directory (SCOUT_LOG_DIR and
+SCOUT_WATCHLIST point into a temp dir, removed when it stops), so its
+scouts never reach this checkout's watchlist, audit log or caches. Only
+the results file is written here. A server given with --url is used as is.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import socket
+import tempfile
+import threading
+import subprocess
+import http.client
+import urllib.parse
+from datetime import datetime
+from pathlib import Path
+
+from scout import SCRIPT_DIR, LOG_DIR
+
+LOADTEST_DIR = LOG_DIR / "loadtest"
+DEFAULT_MIX = "page=1,watchlist=4,logs=3,scout=2"
+OPS = {
+    "page": ("GET", "/"),
+    "watchlist": ("GET", "/api/watchlist"),
+    "logs": ("GET", "/api/logs?limit=50"),
+    "scout": ("POST", "/api/scout"),
+}
+
+
+# ─── Spawned Servers ──────────────────────────────────────────────────────────
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for(port, path, timeout=15):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", path)
+            conn.getresponse().read()
+            conn.close()
+            return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def spawn_servers(stub_latency=200, stub_errors=0.0):
+    """
+    Start a stub feed and a web server pointed at it, the server's logs and
+    watchlist in a fresh temp dir. Returns (base_url, [procs], workdir) -
+    hand all of it to stop_servers.
+    """
+    stub_port, web_port = _free_port(), _free_port()
+    workdir = Path(tempfile.mkdtemp(prefix="scout_loadtest."))
+    procs = []
+    quiet = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    procs.append(subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / "scout_stub.py"), "--port", str(stub_port),
+         "--latency", str(stub_latency), "--jitter", str(stub_latency / 4),
+         "--error-rate", str(stub_errors), "--seed", "1"], **quiet,
+    ))
+    env = dict(os.environ, SCOUT_NEWS_URL=f"http://127.0.0.1:{stub_port}/rss/search",
+               SCOUT_LOG_DIR=str(workdir / "scout_logs"),
+               SCOUT_WATCHLIST=str(workdir / "watchlist.json"))
+    env.pop("SCOUT_SOCKET", None)  # a worker socket from the caller's env would be the real one
+    procs.append(subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / "scout_web.py"), "--port", str(web_port)], env=env, **quiet,
+    ))
+    if not (_wait_for(stub_port, "/rss/search?q=ping") and _wait_for(web_port, "/metrics")):
+        stop_servers(procs, workdir)
+        raise RuntimeError("spawned servers didn't come up")
+    return f"http://127.0.0.1:{web_port}", procs, workdir
+
+
+def stop_servers(procs, workdir=None):
+    for p in procs:
+        p.terminate()
+    for p in procs:
+        try:
+            p.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            p.kill()
+    if workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ─── Load Generation ──────────────────────────────────────────────────────────
+
+def parse_mix(spec):
+    """'page=1,scout=2' -> {'page': 1.0, 'scout': 2.0}"""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPS:
+            raise ValueError(f"unknown op {name!r} (have {', '.join(OPS)})")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("mix has no weight")
+    return mix
+
+
+class Client(threading.Thread):
+    """One simulated analyst: picks ops from the mix until told to stop."""
+
+    def __init__(self, base_url, mix, stop, budget, players, force_rate, seed):
+        super().__init__(daemon=True)
+        url = urllib.parse.urlsplit(base_url)
+        self.host, self.port = url.hostname, url.port or 80
+        self.ops, self.weights = list(mix), list(mix.values())
+        self.stop, self.budget = stop, budget
+        self.players, self.force_rate = players, force_rate
+        self.rng = random.Random(seed)
+        self.conn = None
+        self.samples = []  # (op, started_at, seconds, status or error)
+
+    def _request(self, method, path, body=None):
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=300)
+        headers = {"Content-Type": "application/json"} if body else {}
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            resp = self.conn.getresponse()
+            resp.read()
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            raise
+        if resp.will_close:
+            self.conn.close()
+            self.conn = None
+        return resp.status
+
+    def run(self):
+        while not self.stop.is_set() and self.budget.take():
+            op = self.rng.choices(self.ops, self.weights)[0]
+            method, path = OPS[op]
+            body = None
+            if op == "scout":
+                body = json.dumps({
+                    "player": f"Loadtest Player {self.rng.randrange(self.players)}",
+                    "days": 14,
+                    "force": self.rng.random() < self.force_rate,
+                })
+            start = time.perf_counter()
+            try:
+                outcome = self._request(method, path, body)
+            except Exception as e:
+                outcome = type(e).__name__
+            self.samples.append((op, start, time.perf_counter() - start, outcome))
+        if self.conn is not None:
+            self.conn.close()
+
+
+class Budget:
+    """Shared request counter; unlimited when total is None."""
+
+    def __init__(self, total=None):
+        self.left = total
+        self.lock = threading.Lock()
+
+    def take(self):
+        if self.left is None:
+            return True
+        with self.lock:
+            if self.left <= 0:
+                return False
+            self.left -= 1
+            return True
+
+
+def run_load(base_url, mix, concurrency=8, duration=20, requests=None,
+             players=20, force_rate=0.5, seed=1):
+    """Run the load and return raw samples plus the wall-clock time it took."""
+    stop = threading.Event()
+    budget = Budget(requests)
+    clients = [
+        Client(base_url, mix, stop, budget, players, force_rate, seed + i)
+        for i in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for c in clients:
+        c.start()
+    if requests is None:
+        stop.wait(duration)
+        stop.set()
+    for c in clients:
+        c.join()
+    elapsed = time.perf_counter() - started
+    return [s for c in clients for s in c.samples], elapsed
+
+
+# ─── Reporting ────────────────────────────────────────────────────────────────
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _summarize(samples, elapsed):
+    latencies = sorted(s[2] for s in samples)
+    outcomes = {}
+    for s in samples:
+        outcomes[str(s[3])] = outcomes.get(str(s[3]), 0) + 1
+    errors = sum(1 for s in samples if not (isinstance(s[3], int) and s[3] < 400))
+    ms = lambda v: round(v * 1000, 1) if v is not None else None
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0,
+        "rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+        "mean_ms": ms(sum(latencies) / len(latencies)) if latencies else None,
+        "p50_ms": ms(_percentile(latencies, 50)),
+        "p90_ms": ms(_percentile(latencies, 90)),
+        "p99_ms": ms(_percentile(latencies, 99)),
+        "max_ms": ms(latencies[-1]) if latencies else None,
+        "outcomes": outcomes,
+    }
+
+
+def summarize(samples, elapsed):
+    by_op = {}
+    for s in samples:
+        by_op.setdefault(s[0], []).append(s)
+    return {
+        "total": _summarize(samples, elapsed),
+        "ops": {op: _summarize(rows, elapsed) for op, rows in sorted(by_op.items())},
+    }
+
+
+def print_summary(summary):
+    header = f"  {'op':<10} {'reqs':>7} {'rps':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'err%':>6}"
+    print(header)
+    print("  " + "-" * (len(header) - 2))
+    rows = list(summary["ops"].items()) + [("TOTAL", summary["total"])]
+    for op, s in rows:
+        fmt = lambda v: f"{v:.1f}" if v is not None else "-"
+        print(f"  {op:<10} {s['requests']:>7} {s['rps']:>8.1f} {fmt(s['p50_ms']):>8} "
+              f"{fmt(s['p90_ms']):>8} {fmt(s['p99_ms']):>8} {fmt(s['max_ms']):>8} "
+              f"{s['error_rate'] * 100:>6.1f}")
+    bad = {k: v for k, v in summary["total"]["outcomes"].items() if k != "200"}
+    if bad:
+        print(f"  Non-200 outcomes: {bad}")
+
+
+def compare(path_a, path_b):
+    """Side-by-side p50/p99/rps for two saved runs."""
+    a, b = (json.loads(Path(p).read_text()) for p in (path_a, path_b))
+    print(f"[*] A: {a.get('label') or path_a} ({a['started_at']})")
+    print(f"[*] B: {b.get('label') or path_b} ({b['started_at']})")
+    print(f"  {'op':<10} {'metric':<8} {'A':>10} {'B':>10} {'change':>9}")
+    ops = sorted(set(a["ops"]) | set(b["ops"])) + ["TOTAL"]
+    for op in ops:
+        sa = a["total"] if op == "TOTAL" else a["ops"].get(op)
+        sb = b["total"] if op == "TOTAL" else b["ops"].get(op)
+        if not sa or not sb:
+            continue
+        for metric in ("rps", "p50_ms", "p99_ms", "error_rate"):
+            va, vb = sa.get(metric), sb.get(metric)
+            change = f"{(vb - va) / va * 100:+.0f}%" if va and vb is not None else "-"
+            print(f"  {op:<10} {metric:<8} {va if va is not None else '-':>10} "
+                  f"{vb if vb is not None else '-':>10} {change:>9}")
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def _arg(flag, cast, default):
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv):
+            try:
+                return cast(sys.argv[i + 1])
+            except ValueError:
+                pass
+    return default
+
+
+def config_for_run(config):
+    keys = ("mix", "concurrency", "duration", "requests", "players", "force_rate")
+    return {k: config[k] for k in keys}
+
+
+def main():
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print(__doc__)
+        sys.exit(0)
+
+    if "--compare" in sys.argv:
+        i = sys.argv.index("--compare")
+        if len(sys.argv) < i + 3:
+            print("[!] --compare needs two result files")
+            sys.exit(1)
+        compare(sys.argv[i + 1], sys.argv[i + 2])
+        return
+
+    try:
+        mix = parse_mix(_arg("--mix", str, DEFAULT_MIX))
+    except ValueError as e:
+        print(f"[!] {e}")
+        sys.exit(1)
+    config = {
+        "mix": mix,
+        "concurrency": _arg("--concurrency", int, 8),
+        "duration": _arg("--duration", float, 20),
+        "requests": _arg("--requests", int, None),
+        "players": _arg("--players", int, 20),
+        "force_rate": _arg("--force-rate", float, 0.5),
+    }
+    url = _arg("--url", str, None)
+    procs, workdir = [], None
+    if url is None or "--spawn" in sys.argv:
+        stub_latency = _arg("--stub-latency", float, 200)
+        stub_errors = _arg("--stub-errors", float, 0.0)
+        print(f"[*] Spawning stub feed ({stub_latency:.0f}ms, {stub_errors:.0%} errors) + web server...")
+        url, procs, workdir = spawn_servers(stub_latency, stub_errors)
+        config.update(spawned=True, stub_latency_ms=stub_latency, stub_error_rate=stub_errors)
+
+    limit = f"{config['requests']} requests" if config["requests"] else f"{config['duration']:.0f}s"
+    print(f"[*] Target: {url}")
+    print(f"[*] Mix: {', '.join(f'{k}={v:g}' for k, v in mix.items())} | "
+          f"{config['concurrency']} clients | {limit}")
+
+    started_at = datetime.now().isoformat()
+    try:
+        samples, elapsed = run_load(url, **config_for_run(config))
+    finally:
+        if procs:
+            stop_servers(procs, workdir)
+
+    summary = summarize(samples, elapsed)
+    print(f"[*] {len(samples)} requests in {elapsed:.1f}s\n")
+    print_summary(summary)
+
+    result = dict(summary, label=_arg("--label", str, None), url=url,
+                  started_at=started_at, elapsed_s=round(elapsed, 2), config=config)
+    out = Path(_arg("--out", str, LOADTEST_DIR / f"{started_at.replace(':', '-')}.json"))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=2))
+    print(f"\n[*] Saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Soccer Player Scout - Rescoring
+Re-applies the current dictionaries, cheap-tier rules and scoring to every
+run in the article history (scout_logs/history.db), without refetching.
+
+Each player's history is one task in a process pool: the worker reads the
+player's stories once, classifies each story once (a story sits in many
+overlapping daily lookbacks), then streams the player's runs in time order
+and scores each one from its story ids, as of the moment it ran.
+
+Usage:
+    python3 scout.py --rescore                          # everyone, all history
+    python3 scout.py --rescore --workers 8
+    python3 scout.py --rescore --player "Neymar Jr" --since 2025-01-01
+
+Output is a new score series, versioned by what produced it:
+scout_logs/rescore/v<SCORING_VERSION>-<dict_version>.jsonl, one audit-shaped
+entry per run (trigger "rescore", the original run_id, the original score
+under "rescored_from"). Rerunning with the same dictionaries and scoring
+rewrites the same series. A filtered rescore (--player / --since) never
+touches the full series: it goes to its own file beside it,
+v<N>-<dict>.<player>.since-<date>.jsonl. Runs from before the history
+existed can't be rescored - their articles were never kept.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+from itertools import groupby
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from scout import (
+    LOG_DIR, HISTORY_DB, SCORING_VERSION, ArticleHistory, Article, log_error,
+    normalize_player, classify_articles, assess, build_log_entry, current_matcher,
+)
+
+RESCORE_DIR = LOG_DIR / "rescore"
+
+
+def series_id(matcher=None):
+    """What a score series was produced by: scoring rules + dictionaries."""
+    return f"v{SCORING_VERSION}-{(matcher or current_matcher()).version}"
+
+
+def series_file(series, player=None, since=None):
+    """Where a rescore writes. Only an unfiltered rescore owns <series>.jsonl;
+    a subset gets its own file so it can't replace the full series."""
+    parts = [series]
+    if player:
+        parts.append(re.sub(r"[^a-z0-9]+", "_", normalize_player(player)).strip("_") or "player")
+    if since:
+        parts.append("since-" + re.sub(r"[^0-9A-Za-z-]+", "-", since))
+    return RESCORE_DIR / (".".join(parts) + ".jsonl")
+
+
+# ─── Per-Player Pass ──────────────────────────────────────────────────────────
+
+def rescore_player(player_key, since=None, db_path=HISTORY_DB):
+    """
+    Rescore one player's stored runs. Runs in a worker process; memory is
+    one player's stories, not the history. Returns (player, JSON lines,
+    runs, runs whose score changed).
+    """
+    matcher = current_matcher()
+    series = series_id(matcher)
+    since = since or ""
+    db = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30)
+    try:
+        rows = db.execute("""
+            SELECT DISTINCT s.id, s.title, s.description, s.link, s.ts
+            FROM runs r JOIN run_articles ra ON ra.run = r.seq JOIN stories s ON s.id = ra.story
+            WHERE r.player_key = ? AND r.timestamp >= ?""", (player_key, since)).fetchall()
+        articles = [Article(title, link, description, ts) for _, title, description, link, ts in rows]
+        classified = dict(zip((r[0] for r in rows), zip(articles, classify_articles(articles, matcher))))
+
+        lines = []
+        changed = 0
+        player = player_key
+        cur = db.execute("""
+            SELECT r.seq, r.run_id, r.player, r.timestamp, r.days, r.trigger, r.risk_score,
+                   r.dict_version, r.scoring_version, ra.story
+            FROM runs r LEFT JOIN run_articles ra ON ra.run = r.seq
+            WHERE r.player_key = ? AND r.timestamp >= ?
+            ORDER BY r.timestamp, r.seq, ra.pos""", (player_key, since))
+        for _, run_rows in groupby(cur, key=lambda r: r[0]):
+            run_rows = list(run_rows)
+            _, run_id, player, timestamp, days, trigger, old_score, old_dict, old_scoring, _ = run_rows[0]
+            pairs = [classified[r[9]] for r in run_rows if r[9] is not None]
+            window = [a for a, _ in pairs]
+            window_findings = [f for _, f in pairs]
+            score, audit, review_items = assess(player, window, window_findings,
+                                                now=datetime.fromisoformat(timestamp))
+            entry = build_log_entry(
+                player, window, window_findings, score, audit, review_items,
+                trigger="rescore", days=days, run_id=run_id, timestamp=timestamp,
+                dict_version=matcher.version,
+            )
+            entry["series"] = series
+            entry["rescored_from"] = {"trigger": trigger, "risk_score": old_score,
+                                      "dict_version": old_dict, "scoring_version": old_scoring}
+            changed += score != old_score
+            lines.append(json.dumps(entry, default=str) + "\n")
+    finally:
+        db.close()
+    return player, lines, len(lines), changed
+
+
+# ─── Driver ───────────────────────────────────────────────────────────────────
+
+def run_rescore(workers=None, player=None, since=None, db_path=HISTORY_DB):
+    """Rescore the whole history (or one player's) into a new series file."""
+    if not db_path.exists():
+        print("[!] No article history yet - live runs record it as they go.")
+        return None
+    stats = ArticleHistory(db_path).stats()
+    series = series_id()
+    RESCORE_DIR.mkdir(parents=True, exist_ok=True)
+    out_file = series_file(series, player, since)
+    tmp = out_file.with_suffix(f".{os.getpid()}.tmp")
+
+    db = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30)
+    try:
+        # Biggest histories first, so the pool doesn't end waiting on one long task
+        where, params = ("WHERE player_key = ?", [normalize_player(player)]) if player else ("", [])
+        keys = [k for k, _ in db.execute(
+            f"SELECT player_key, count(*) FROM runs {where} GROUP BY player_key ORDER BY 2 DESC", params)]
+    finally:
+        db.close()
+
+    print(f"[*] Rescore -> series {series}")
+    print(f"[*] History: {stats['runs']} runs, {stats['stories']} stories | "
+          f"Players: {len(keys)}{f' | Since: {since}' if since else ''}")
+    start = time.time()
+    runs = changed = failed = 0
+    try:
+        with open(tmp, "w", encoding="utf-8") as out, ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(rescore_player, key, since, db_path) for key in keys]
+            for fut in as_completed(futures):
+                try:
+                    name, lines, n, n_changed = fut.result()
+                except Exception as e:
+                    failed += 1
+                    log_error(str(e), "rescore", "rescore_player")
+                    print(f"    [!] {e}")
+                    continue
+                out.writelines(lines)
+                runs += n
+                changed += n_changed
+                if player or len(keys) <= 20:
+                    print(f"    {name}: {n} runs, {n_changed} rescored differently")
+        os.replace(tmp, out_file)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    elapsed = time.time() - start
+    rate = f" ({runs / elapsed:.0f} runs/s)" if elapsed > 0 else ""
+    print(f"[*] Done in {elapsed:.1f}s{rate}. {runs} runs, {changed} with a different score"
+          f"{f', {failed} players failed' if failed else ''} -> {out_file}")
+    return {"series": series, "runs": runs, "changed": changed, "failed": failed,
+            "players": len(keys), "file": str(out_file)}
+
+
+def main(argv):
+    """scout.py --rescore [--workers N] [--player NAME] [--since YYYY-MM-DD]"""
+    if argv and argv[0] in ("-h", "--help"):
+        print(__doc__)
+        sys.exit(0)
+    workers = player = since = None
+    for i, arg in enumerate(argv):
+        if i + 1 >= len(argv):
+            break
+        if arg == "--workers":
+            try:
+                workers = int(argv[i + 1])
+            except ValueError:
+                pass
+        elif arg == "--player":
+            player = argv[i + 1]
+        elif arg == "--since":
+            since = argv[i + 1]
+            try:
+                datetime.fromisoformat(since)
+            except ValueError:
+                print(f"[!] --since wants a date like 2025-01-01, got {since!r}")
+                sys.exit(1)
+    run_rescore(workers=workers, player=player, since=since)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -5,30 +5,186 @@ Runs scouting on all watchlist players. Set it and forget it.
 
 Usage:
     python3 scout_scheduler.py                # run once, now
+    python3 scout_scheduler.py --force        # run once, ignore cached results
+    python3 scout_scheduler.py --squad        # one feed per club, shared by its players
+    python3 scout_scheduler.py --shard        # join today's batch as one of N workers
+    python3 scout_scheduler.py --shard --worker-id box2 --batch nightly-42
     python3 scout_scheduler.py --daemon       # loop forever, run at 7am daily
     python3 scout_scheduler.py --install-cron # install crontab entry
+    python3 scout_scheduler.py --profile --trace-memory  # cProfile + tracemalloc the batch
 
 Reads players from watchlist.json. Results logged to scout_logs/.
+Players whose news fetch fails are retried once after everyone else; if it
+fails again they're reported as not scored and keep their previous score.
+Fetches run concurrently under an adaptive (AIMD) limit that climbs while
+Google News answers promptly and halves on 429/503/timeouts - see
+SCOUT_FETCH_CONCURRENCY in scout.py. Limit changes are printed as they
+happen and logged to scout_logs/fetch_limiter.jsonl.
+Every player gets a time budget inside the batch's (seconds, 0 = none):
+    SCOUT_PLAYER_DEADLINE=120   # past it the player is reported partial - what was scored
+    SCOUT_BATCH_DEADLINE=3600   # past it running players wrap up partial, the rest are
+                                # skipped (sharded: left in the queue) and keep their scores
+Partial and skipped players don't get a new watchlist score.
+Prometheus metrics snapshot: scout_logs/metrics.prom (metrics_<worker>.prom when sharded).
+Profiles: scout_logs/profiles/<stamp>_batch.pstats / .mem.txt, cited by each audit entry.
+In squad mode, give players a "club" (or "league") and optional "aliases":
+    {"name": "Vinicius Junior", "club": "Real Madrid", "aliases": ["Vini Jr"]}
 """
 
 import sys
 import os
 import json
 import time
+import re
+import socket
+import sqlite3
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
-WATCHLIST_FILE = SCRIPT_DIR / "watchlist.json"
 SCOUT_SCRIPT = SCRIPT_DIR / "scout.py"
 
 # Import the core runner
 sys.path.insert(0, str(SCRIPT_DIR))
-from scout import run_scout, load_watchlist, save_watchlist, log_error
+from scout import (
+    LOG_DIR, run_scout, cached_result, fetch_club_news, load_watchlist, edit_watchlist,
+    log_error, player_entry, update_player, PlayerMatcher, Profiler, FetchError, breaker_for, NEWS_URL,
+    limiter_for, active_profile, LIMITER_LOG, needs_attention, Deadline,
+)
+from scout_metrics import REGISTRY
 
+PLAYER_DEADLINE = float(os.environ.get("SCOUT_PLAYER_DEADLINE", 120))  # seconds, 0 = none
+BATCH_DEADLINE = float(os.environ.get("SCOUT_BATCH_DEADLINE", 3600))
 
-def run_all_players():
+METRICS_SNAPSHOT = LOG_DIR / "metrics.prom"
+BATCH_PLAYERS = REGISTRY.gauge("scout_batch_players", "Players in the current batch")
+BATCH_PROGRESS = REGISTRY.gauge("scout_batch_players_finished", "Players finished in the current batch", ["outcome"])
+BATCH_SECONDS = REGISTRY.histogram("scout_batch_duration_seconds", "Wall time per scheduled batch",
+                                   buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200))
+BATCH_COMPLETED = REGISTRY.gauge("scout_batch_last_completed_timestamp_seconds", "When the last batch finished")
+
+
+def _batch_started(total):
+    BATCH_PLAYERS.set(total)
+    for outcome in ("ok", "cached", "partial", "error", "skipped"):
+        BATCH_PROGRESS.set(0, outcome=outcome)
+
+
+def _batch_step(outcome, snapshot=METRICS_SNAPSHOT):
+    BATCH_PROGRESS.inc(outcome=outcome)
+    REGISTRY.write_snapshot(snapshot)
+
+
+# ─── Concurrency ──────────────────────────────────────────────────────────────
+# Fetches go through scout's adaptive limiter, so the pool just has to be big
+# enough for the limit's ceiling; the limiter decides how many actually run.
+
+_OUTPUT = threading.Lock()  # progress lines come from the main thread, limit moves from fetch threads
+
+
+def _workers():
+    """One thread per possible concurrent fetch - or just this one while a
+    Profiler is active (profiles are per-thread)."""
+    return 1 if active_profile() is not None else limiter_for(NEWS_URL).max_limit
+
+
+def run_concurrently(fn, jobs, workers=None):
+    """Yield (job, result or exception) for fn(*job) over jobs, as each finishes."""
+    workers = _workers() if workers is None else workers
+    if workers <= 1:
+        for job in jobs:
+            try:
+                yield job, fn(*job)
+            except Exception as e:
+                yield job, e
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scout") as pool:
+        futures = {pool.submit(fn, *job): job for job in jobs}
+        for fut in as_completed(futures):
+            try:
+                yield futures[fut], fut.result()
+            except Exception as e:
+                yield futures[fut], e
+
+
+@contextmanager
+def limit_reporting():
+    """Print the fetch limiter's decisions while the block runs; sum them up after."""
+    limiter = limiter_for(NEWS_URL)
+    moves = {"up": 0, "down": 0}
+    peak = [int(limiter.limit)]
+
+    def report(decision):
+        direction = "up" if decision["to"] > decision["from"] else "down"
+        moves[direction] += 1
+        peak[0] = max(peak[0], decision["to"])
+        with _OUTPUT:
+            print(f"    [limit] {decision['from']} -> {decision['to']} concurrent fetches "
+                  f"({decision['reason']}, {decision['latency_ms']}ms)")
+
+    print(f"[*] Fetch concurrency: {int(limiter.limit)} to start, adaptive up to {limiter.max_limit}")
+    limiter.listeners.append(report)
+    try:
+        yield
+    finally:
+        limiter.listeners.remove(report)
+        print(f"[*] Fetch limit: {int(limiter.limit)} now, peak {peak[0]} "
+              f"({moves['up']} up, {moves['down']} down) - {LIMITER_LOG.name}")
+
+
+def prefetch_squads(wl, days, force=False, batch_deadline=None):
+    """
+    Squad mode: fetch each club/league feed once and hand every article to each
+    watchlist player it mentions (names + aliases, one matcher for the list).
+    Upstream requests go from one per player to one per club.
+    Returns {player name: [articles]} - players nobody mentioned aren't in it.
+    """
+    groups = {}
+    for p in map(player_entry, wl.get("players", [])):
+        group = p.get("club") or p.get("league")
+        if not group or not p.get("name"):
+            continue
+        if not force and cached_result(p["name"], days) is not None:
+            continue  # fresh result already - don't fetch on its behalf
+        groups.setdefault(group, []).append(p["name"])
+
+    if not groups:
+        return {}
+
+    matcher = PlayerMatcher.from_watchlist(wl)
+    shared = {}
+    seen = {}  # player -> links already attributed (clubs' feeds overlap)
+    print(f"[*] Squad mode: {len(groups)} club feed(s) for {sum(map(len, groups.values()))} players")
+    def fetch(group):
+        return fetch_club_news(group, days=days, deadline=Deadline(PLAYER_DEADLINE or None, parent=batch_deadline))
+
+    for (group,), articles in run_concurrently(fetch, [(g,) for g in groups]):
+        if isinstance(articles, FetchError):
+            # Its players fall back to their own feeds (and the retry pass)
+            print(f"    {group}: fetch failed ({articles.kind})")
+            continue
+        if isinstance(articles, Exception):
+            print(f"    {group}: ERROR: {articles}")
+            log_error(str(articles), f"club:{group}", "prefetch_squads")
+            continue
+        attributed = 0
+        for a in articles:
+            for name in matcher.players_in(a.text):
+                key = a.link or a.title
+                if key in seen.setdefault(name, set()):
+                    continue
+                seen[name].add(key)
+                shared.setdefault(name, []).append(a)
+                attributed += 1
+        print(f"    {group}: {len(articles)} articles, {attributed} player mentions")
+    return shared
+
+
+def run_all_players(force=False, squad=False):
     """Scout every player on the watchlist. Update their scores. Return summary."""
     wl = load_watchlist()
     players = wl.get("players", [])
@@ -42,70 +198,466 @@ def run_all_players():
 
     print(f"[*] Scheduled run: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     print(f"[*] Players: {len(players)} | Lookback: {days} days")
-    print("-" * 50)
+    batch_start = time.time()
+    batch_deadline = Deadline(BATCH_DEADLINE or None)
+    _batch_started(len(players))
+    with limit_reporting():
+        shared = prefetch_squads(wl, days, force, batch_deadline) if squad else {}
+        print("-" * 50)
+
+        jobs = []
+        for i, p in enumerate(players):
+            entry = player_entry(p)
+            if entry.get("name"):
+                jobs.append((i, entry["name"], entry.get("club") or entry.get("league")))
+
+        results = []
+        updates = {}   # name -> new watchlist fields, written back in one locked edit
+        deferred = []  # players whose fetch failed - retried once at the end
+        def scout(i, name, group):
+            if batch_deadline.expired:
+                return None  # batch out of time - don't start anyone new
+            return _scheduled_scout(name, group, days, force, shared, batch_deadline)
+
+        for n, ((i, name, _), outcome) in enumerate(run_concurrently(scout, jobs), 1):
+            prefix = f"[{n}/{len(jobs)}] {name}: "
+            with _OUTPUT:
+                if outcome is None:
+                    _skipped(name, results, prefix)
+                elif isinstance(outcome, FetchError) and outcome.kind == "deadline":
+                    print(f"{prefix}OUT OF TIME before anything was scored - not scored")
+                    results.append(outcome.log_entry or {"player": name, "error": str(outcome),
+                                                         "status": "fetch_failed"})
+                    _batch_step("error")
+                elif isinstance(outcome, FetchError):
+                    print(f"{prefix}FETCH FAILED ({outcome.kind}) - retrying at the end")
+                    deferred.append(i)
+                elif isinstance(outcome, Exception):
+                    print(f"{prefix}ERROR: {outcome}")
+                    log_error(str(outcome), name, "scheduler")
+                    results.append({"player": name, "error": str(outcome)})
+                    _batch_step("error")
+                else:
+                    _record(updates, name, outcome, results, prefix)
+
+        if deferred:
+            _retry_deferred(players, deferred, days, force, results, updates, batch_deadline)
+
+    # Scores back onto the watchlist as it is now - edits made during the batch survive
+    _locked_watchlist_update(updates)
+
+    BATCH_SECONDS.observe(time.time() - batch_start)
+    BATCH_COMPLETED.set(int(time.time()))
+    REGISTRY.write_snapshot(METRICS_SNAPSHOT)
 
-    results = []
-    for i, p in enumerate(players):
-        name = p if isinstance(p, str) else p.get("name", "")
-        if not name:
-            continue
-
-        print(f"[{i+1}/{len(players)}] Scouting: {name}...", end=" ", flush=True)
+    print("-" * 50)
+    print(f"[*] Done. {len(results)} players scouted.")
+    print(f"[*] Logs: {LOG_DIR}")
+    print(f"[*] Metrics: {METRICS_SNAPSHOT}")
 
-        try:
-            result = run_scout(name, days=days, trigger="scheduled")
-            score = result["log"]["risk_score"]
-            label = result["log"]["risk_label"]
-            articles = result["log"]["articles_found"]
-            confidence = result["log"]["self_check"]["confidence"]
-            issues = result["log"]["self_check"]["issues"]
-            duration = result["log"]["duration_ms"]
+    print_attention(results)
+    return results
 
-            print(f"{score}/10 ({label}) | {articles} articles | {int(confidence*100)}% conf | {duration}ms")
 
-            # Print self-check issues if any
-            if issues:
-                for issue in issues:
-                    print(f"    [!] {issue}")
+def _scheduled_scout(name, group, days, force, shared, batch_deadline=None):
+    """Scout one player: their squad feed's articles if it mentioned them, else their own fetch."""
+    deadline = Deadline(PLAYER_DEADLINE or None, parent=batch_deadline)
+    if name in shared:
+        return run_scout(name, days=days, trigger="scheduled", force=force,
+                         articles=shared[name], feed=f"club:{group}", deadline=deadline)
+    # Not in squad mode, or no club story mentioned them - fetch on their own
+    return run_scout(name, days=days, trigger="scheduled", force=force, deadline=deadline)
 
-            # Print expensive-tier review items
-            for item in result["log"].get("review_items", []):
-                print(f"    [REVIEW] {item['reason']}: {item['detail']}")
 
-            # Update watchlist entry with score
-            players[i] = {"name": name, "last_score": score, "last_run": datetime.now().isoformat()}
-            results.append(result["log"])
+def _record(updates, name, result, results, prefix=""):
+    print_result(result, prefix)
+    results.append(_summary_entry(result))
+    if result.get("partial"):
+        _batch_step("partial")  # part of the news isn't a score to keep
+        return
+    # Watchlist entry gets the score
+    updates[name] = {"last_score": result["log"]["risk_score"], "last_run": datetime.now().isoformat()}
+    _batch_step("cached" if result["cached"] else "ok")
 
-        except Exception as e:
-            print(f"ERROR: {e}")
-            log_error(str(e), name, "scheduler")
-            results.append({"player": name, "error": str(e)})
 
-        # Be nice to Google News - wait between requests
-        if i < len(players) - 1:
-            time.sleep(2)
+def _skipped(name, results, prefix=""):
+    print(f"{prefix}SKIPPED - batch out of time")
+    results.append({"player": name, "status": "skipped"})
+    _batch_step("skipped")
 
-    # Save updated watchlist
-    wl["players"] = players
-    wl["last_scheduled_run"] = datetime.now().isoformat()
-    save_watchlist(wl)
 
+def _retry_deferred(players, deferred, days, force, results, updates, batch_deadline=None):
+    """
+    Second chance for players whose fetch failed, after everyone else. If the
+    upstream circuit is open, wait out its cooldown first (within the batch's
+    time). Whoever fails again is reported as not scored - their watchlist
+    score is left alone.
+    """
+    batch_deadline = batch_deadline or Deadline()
     print("-" * 50)
-    print(f"[*] Done. {len(results)} players scouted.")
-    print(f"[*] Logs: {SCRIPT_DIR / 'scout_logs'}")
-
-    # Summary: flag any players that need attention
-    attention = [r for r in results if isinstance(r.get("risk_score"), int) and r["risk_score"] >= 5]
+    print(f"[*] Retrying {len(deferred)} player(s) whose fetch failed")
+    wait = breaker_for(NEWS_URL).retry_in()
+    if wait:
+        print(f"[*] Upstream circuit open - waiting {wait:.0f}s")
+        time.sleep(batch_deadline.timeout(wait))
+    jobs = [(i, player_entry(players[i]).get("name", "")) for i in deferred]
+    def scout(i, name):
+        if batch_deadline.expired:
+            return None
+        return run_scout(name, days=days, trigger="scheduled", force=force,
+                         deadline=Deadline(PLAYER_DEADLINE or None, parent=batch_deadline))
+
+    for n, ((i, name), outcome) in enumerate(run_concurrently(scout, jobs), 1):
+        prefix = f"[retry {n}/{len(jobs)}] {name}: "
+        with _OUTPUT:
+            if outcome is None:
+                _skipped(name, results, prefix)
+            elif isinstance(outcome, FetchError):
+                print(f"{prefix}FETCH FAILED again ({outcome.kind}) - not scored")
+                results.append(outcome.log_entry or {"player": name, "error": str(outcome), "status": "fetch_failed"})
+                _batch_step("error")
+            elif isinstance(outcome, Exception):
+                print(f"{prefix}ERROR: {outcome}")
+                log_error(str(outcome), name, "scheduler")
+                results.append({"player": name, "error": str(outcome)})
+                _batch_step("error")
+            else:
+                _record(updates, name, outcome, results, prefix)
+
+
+def _summary_entry(result):
+    """A run's log entry for the batch summary. A cached result's entry is an
+    earlier run's, delta included - it's marked so that delta isn't news twice."""
+    return dict(result["log"], cached=True) if result["cached"] else result["log"]
+
+
+def _delta_of(entry):
+    """An entry's delta; entries logged before deltas existed count as first runs."""
+    return entry.get("delta") or {
+        "since_run": None, "score_change": None, "score_to": entry["risk_score"],
+        "new_flagged": [], "resolved": [],
+    }
+
+
+def print_result(result, prefix=""):
+    """One line per player, then any self-check issues and review items."""
+    log = result["log"]
+    score = log["risk_score"]
+    label = log["risk_label"]
+    articles = log["articles_found"]
+    confidence = log["self_check"]["confidence"]
+    issues = log["self_check"]["issues"]
+    duration = log["duration_ms"]
+
+    cached = f" | cached {result['cache_age_s']}s" if result["cached"] else ""
+    partial = result.get("partial")
+    if partial:
+        cached += (f" | PARTIAL: out of time during {partial['stage']}, "
+                   f"{partial['articles_scored']}/{partial['articles_fetched']} scored")
+    delta = log.get("delta")
+    change = ""
+    if delta and delta["since_run"]:
+        change = f" | {delta['score_change']:+d}, {len(delta['new_flagged'])} new / {len(delta['resolved'])} resolved flags"
+    print(f"{prefix}{score}/10 ({label}) | {articles} articles | {int(confidence*100)}% conf | {duration}ms{cached}{change}")
+
+    # Print self-check issues if any
+    if issues:
+        for issue in issues:
+            print(f"    [!] {issue}")
+
+    # Print expensive-tier review items
+    for item in log.get("review_items", []):
+        print(f"    [REVIEW] {item['reason']}: {item['detail']}")
+
+
+def print_attention(results):
+    """
+    Summary: players whose news changed in a way worth reading - new flagged
+    articles, a score jump, or a first run already high (see needs_attention).
+    High scorers with nothing new since yesterday are counted, not re-listed,
+    and so are results served from the cache: their delta was already reported.
+    """
+    scored = [r for r in results if isinstance(r.get("risk_score"), int) and r.get("status") != "partial"]
+    attention = [r for r in scored if not r.get("cached") and needs_attention(_delta_of(r))]
     if attention:
         print()
-        print("!! PLAYERS NEEDING ATTENTION:")
+        print("!! PLAYERS NEEDING ATTENTION (changed since last run):")
         for r in attention:
-            print(f"   {r['player']}: {r['risk_score']}/10 ({r['risk_label']})")
-
-    return results
-
+            d = _delta_of(r)
+            if d["since_run"] is None:
+                why = "first run"
+            else:
+                why = f"{d['score_change']:+d} since {d['since'][:10]}"
+            print(f"   {r['player']}: {r['risk_score']}/10 ({r['risk_label']}) | {why} | "
+                  f"{len(d['new_flagged'])} new flag(s), {len(d['resolved'])} resolved")
+            for item in d["new_flagged"][:3]:
+                print(f"      + [{item['date']}] {item['title'][:70]}")
+            if len(d["new_flagged"]) > 3:
+                print(f"      + ...{len(d['new_flagged']) - 3} more")
+    listed = {id(r) for r in attention}
+    quiet_high = [r for r in scored if r["risk_score"] >= 5 and id(r) not in listed]
+    if quiet_high:
+        print(f"   ({len(quiet_high)} more at 5+/10 with nothing new since last run)")
+    failed = [r for r in results if r.get("status") == "fetch_failed"]
+    unfetched = [r["player"] for r in failed if (r.get("fetch_error") or {}).get("kind") != "deadline"]
+    timed_out = [r["player"] for r in failed if (r.get("fetch_error") or {}).get("kind") == "deadline"]
+    partial = [r["player"] for r in results if r.get("status") == "partial"]
+    skipped = [r["player"] for r in results if r.get("status") == "skipped"]
+    if failed or partial or skipped:
+        print()
+    if unfetched:
+        print(f"!! NOT SCORED - news fetch failed: {', '.join(unfetched)}")
+    if timed_out:
+        print(f"!! NOT SCORED - ran out of time: {', '.join(timed_out)}")
+    if partial:
+        print(f"!! PARTIAL - ran out of time, score not kept: {', '.join(partial)}")
+    if skipped:
+        print(f"!! SKIPPED - batch ran out of time: {', '.join(skipped)}")
+
+
+# ─── Sharded Mode ─────────────────────────────────────────────────────────────
+# Several scheduler processes (or machines sharing this directory) split one
+# batch. Each claims a player with a lease in a sqlite queue, scouts it, and
+# marks it done. A worker that dies stops renewing; once its lease expires
+# anyone can reclaim the player. Whoever finishes the batch last writes the
+# scores back to the watchlist.
+
+QUEUE_DB = LOG_DIR / "queue.sqlite"
+LEASE_SECONDS = 300
+MAX_ATTEMPTS = 3
+
+
+class WorkQueue:
+    def __init__(self, path=QUEUE_DB, lease_seconds=LEASE_SECONDS):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        # Autocommit; every write goes through an explicit BEGIN IMMEDIATE
+        self.db = sqlite3.connect(str(path), timeout=30, isolation_level=None,
+                                  check_same_thread=False)
+        self._lock = threading.Lock()
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS work (
+                batch       TEXT NOT NULL,
+                player      TEXT NOT NULL,
+                status      TEXT NOT NULL DEFAULT 'pending',
+                worker      TEXT,
+                lease_until REAL,
+                attempts    INTEGER NOT NULL DEFAULT 0,
+                result      TEXT,
+                updated     REAL,
+                PRIMARY KEY (batch, player)
+            )""")
+
+    def _tx(self, fn):
+        with self._lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                out = fn(self.db)
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+            return out
+
+    def seed(self, batch, players):
+        """Add the batch's players. Safe to call from every worker."""
+        now = time.time()
+        self._tx(lambda db: db.executemany(
+            "INSERT OR IGNORE INTO work (batch, player, updated) VALUES (?, ?, ?)",
+            [(batch, p, now) for p in players]))
+
+    def claim(self, batch, worker):
+        """Lease the next free (or abandoned) player. Returns (player, attempt) or None.
+        An abandoned player that has used up MAX_ATTEMPTS is failed, not leased again."""
+        def take(db):
+            now = time.time()
+            # Whoever kept dying on this player won't do better a fourth time
+            for (player,) in db.execute(
+                    """SELECT player FROM work
+                       WHERE batch = ? AND status = 'claimed' AND lease_until < ? AND attempts >= ?""",
+                    (batch, now, MAX_ATTEMPTS)).fetchall():
+                error = f"lease expired on all {MAX_ATTEMPTS} attempts - worker died or hung mid-scout"
+                db.execute(
+                    """UPDATE work SET status = 'failed', result = ?, lease_until = NULL, updated = ?
+                       WHERE batch = ? AND player = ?""",
+                    (json.dumps({"player": player, "error": error}), now, batch, player))
+            row = db.execute(
+                """SELECT player, attempts FROM work
+                   WHERE batch = ? AND (status = 'pending'
+                         OR (status = 'claimed' AND lease_until < ?))
+                   ORDER BY attempts, rowid LIMIT 1""",  # retries go to the back
+                (batch, now)).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                """UPDATE work SET status = 'claimed', worker = ?, lease_until = ?,
+                          attempts = attempts + 1, updated = ?
+                   WHERE batch = ? AND player = ?""",
+                (worker, now + self.lease_seconds, now, batch, row[0]))
+            return row[0], row[1] + 1
+        return self._tx(take)
+
+    def renew(self, batch, player, worker):
+        """Extend our lease. False means someone else has reclaimed it."""
+        def extend(db):
+            now = time.time()
+            return db.execute(
+                """UPDATE work SET lease_until = ?, updated = ?
+                   WHERE batch = ? AND player = ? AND worker = ? AND status = 'claimed'""",
+                (now + self.lease_seconds, now, batch, player, worker)).rowcount == 1
+        return self._tx(extend)
+
+    def finish(self, batch, player, worker, result=None, error=None, attempt=1):
+        """Record the outcome - only if we still hold the lease."""
+        if error is not None:
+            status = "failed" if attempt >= MAX_ATTEMPTS else "pending"
+            payload = json.dumps({"player": player, "error": error})
+        else:
+            status = "done"
+            payload = json.dumps(result, default=str)
+        return self._tx(lambda db: db.execute(
+            """UPDATE work SET status = ?, result = ?, lease_until = NULL, updated = ?
+               WHERE batch = ? AND player = ? AND worker = ? AND status = 'claimed'""",
+            (status, payload, time.time(), batch, player, worker)).rowcount == 1)
+
+    def progress(self, batch):
+        rows = self.db.execute(
+            "SELECT status, COUNT(*) FROM work WHERE batch = ? GROUP BY status", (batch,))
+        return dict(rows.fetchall())
+
+    def results(self, batch):
+        rows = self.db.execute(
+            "SELECT result FROM work WHERE batch = ? AND result IS NOT NULL ORDER BY rowid", (batch,))
+        return [json.loads(r[0]) for r in rows]
+
+
+class LeaseKeeper(threading.Thread):
+    """Renews a lease in the background while a (possibly slow) scout runs."""
+
+    def __init__(self, queue, batch, player, worker):
+        super().__init__(daemon=True)
+        self.args = (batch, player, worker)
+        self.queue = queue
+        self.done = threading.Event()
+        self.lost = False
+
+    def run(self):
+        while not self.done.wait(self.queue.lease_seconds / 3):
+            if not self.queue.renew(*self.args):
+                self.lost = True
+                return
+
+
+def _locked_watchlist_update(updates):
+    """Merge {name: fields} into watchlist.json through scout.edit_watchlist -
+    the same locked writer the web server and other workers use."""
+    def apply(wl):
+        wl["players"] = [
+            update_player(p, **updates[player_entry(p).get("name")])
+            if player_entry(p).get("name") in updates else p
+            for p in wl.get("players", [])
+        ]
+        wl["last_scheduled_run"] = datetime.now().isoformat()
+
+    edit_watchlist(apply)
+
+
+def run_shard(worker_id=None, batch=None, force=False):
+    """
+    Sharded scheduler worker. Start as many as you like against the same
+    scout_logs/ directory; they split today's batch between them. Fetches
+    are paced by the adaptive limiter (limiter_for(NEWS_URL)), not a sleep.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    wl = load_watchlist()
+    days = wl.get("settings", {}).get("days", 14)
+    names = [n for n in (player_entry(p).get("name") for p in wl.get("players", [])) if n]
+    batch = batch or f"{datetime.now().strftime('%Y-%m-%d')}:{days}d"
+
+    queue = WorkQueue()
+    queue.seed(batch, names)
+    shard_deadline = Deadline(BATCH_DEADLINE or None)
+    snapshot = LOG_DIR / f"metrics_{re.sub(r'[^A-Za-z0-9_.-]', '_', worker_id)}.prom"
+    batch_start = time.time()
+    _batch_started(len(names))
+    print(f"[*] Sharded run: batch {batch} | worker {worker_id}")
+    print(f"[*] Players in batch: {len(names)} | Lookback: {days} days")
+    print("-" * 50)
 
-def daemon_mode():
+    mine = 0
+    while True:
+        if shard_deadline.expired:
+            print("[*] Batch deadline reached - leaving the rest in the queue")
+            break
+        claim = queue.claim(batch, worker_id)
+        if claim is None:
+            break
+        name, attempt = claim
+        retry = f" (attempt {attempt})" if attempt > 1 else ""
+        print(f"[{worker_id}] Scouting: {name}{retry}...", end=" ", flush=True)
+
+        keeper = LeaseKeeper(queue, batch, name, worker_id)
+        keeper.start()
+        try:
+            result = run_scout(name, days=days, trigger="scheduled", force=force,
+                               deadline=Deadline(PLAYER_DEADLINE or None, parent=shard_deadline))
+            print_result(result)
+            outcome = {"result": _summary_entry(result)}
+            _batch_step("partial" if result.get("partial") else "cached" if result["cached"] else "ok", snapshot)
+        except FetchError as e:
+            # Back in the queue behind everyone else (see claim); an open
+            # circuit means give upstream its cooldown before the next claim
+            print(f"FETCH FAILED ({e.kind})")
+            outcome = {"error": str(e)}
+            _batch_step("error", snapshot)
+            if e.retry_after:
+                time.sleep(min(e.retry_after, LEASE_SECONDS / 3))
+        except Exception as e:
+            print(f"ERROR: {e}")
+            log_error(str(e), name, "scheduler_shard")
+            outcome = {"error": str(e)}
+            _batch_step("error", snapshot)
+        finally:
+            keeper.done.set()
+
+        if keeper.lost or not queue.finish(batch, name, worker_id, attempt=attempt, **outcome):
+            print(f"    [!] Lease on {name} expired and was reclaimed - result not recorded")
+        else:
+            mine += 1
+
+    progress = queue.progress(batch)
+    BATCH_SECONDS.observe(time.time() - batch_start)
+    BATCH_COMPLETED.set(int(time.time()))
+    REGISTRY.write_snapshot(snapshot)
+    print("-" * 50)
+    print(f"[*] Worker {worker_id} done: {mine} players. Batch: {progress}")
+
+    # Last one out writes the scores back
+    if not progress.get("pending") and not progress.get("claimed"):
+        results = queue.results(batch)
+        _locked_watchlist_update({
+            r["player"]: {"last_score": r["risk_score"], "last_run": r["timestamp"]}
+            for r in results if "risk_score" in r and r.get("status") != "partial"
+        })
+        print("[*] Batch complete. Watchlist updated.")
+        print_attention(results)
+
+    return mine
+
+
+def profiled(name, fn, profile=False, trace_memory=False, **kwargs):
+    """Run a batch under cProfile / tracemalloc if asked. Every audit entry
+    written meanwhile cites the artifacts (see scout.Profiler)."""
+    if not (profile or trace_memory):
+        return fn(**kwargs)
+    with Profiler(name, cpu=profile, memory=trace_memory) as prof:
+        result = fn(**kwargs)
+    for kind, path in prof.artifacts.items():
+        print(f"[*] Profile ({kind}): {path}")
+    return result
+
+
+def daemon_mode(squad=False, profile=False, trace_memory=False):
     """Run forever. Execute at target_hour every day."""
     target_hour = 7  # 7 AM
     print(f"[*] Daemon mode. Will run daily at {target_hour}:00.")
@@ -123,7 +675,7 @@ def daemon_mode():
             print(f"  SCHEDULED RUN - {now.strftime('%Y-%m-%d %H:%M')}")
             print(f"{'='*50}")
             try:
-                run_all_players()
+                profiled("batch", run_all_players, profile, trace_memory, squad=squad)
             except Exception as e:
                 print(f"[!] Scheduler error: {e}")
                 log_error(str(e), "scheduler", "daemon_mode")
@@ -137,7 +689,7 @@ def install_cron():
     """Install a crontab entry to run every day at 7 AM."""
     python = sys.executable
     script = str(SCRIPT_DIR / "scout_scheduler.py")
-    log_file = str(SCRIPT_DIR / "scout_logs" / "cron.log")
+    log_file = str(LOG_DIR / "cron.log")
 
     cron_line = f"0 7 * * * cd {SCRIPT_DIR} && {python} {script} >> {log_file} 2>&1"
 
@@ -177,17 +729,32 @@ def install_cron():
         print(f"    {cron_line}")
 
 
+def _arg_value(flag):
+    """Value after `flag` on the command line, or None."""
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return None
+
+
 def main():
     if "--help" in sys.argv or "-h" in sys.argv:
         print(__doc__)
         sys.exit(0)
 
+    profile = "--profile" in sys.argv
+    trace_memory = "--trace-memory" in sys.argv
     if "--install-cron" in sys.argv:
         install_cron()
+    elif "--shard" in sys.argv:
+        profiled("shard", run_shard, profile, trace_memory, worker_id=_arg_value("--worker-id"),
+                 batch=_arg_value("--batch"), force="--force" in sys.argv)
     elif "--daemon" in sys.argv:
-        daemon_mode()
+        daemon_mode(squad="--squad" in sys.argv, profile=profile, trace_memory=trace_memory)
     else:
-        run_all_players()
+        profiled("batch", run_all_players, profile, trace_memory,
+                 force="--force" in sys.argv, squad="--squad" in sys.argv)
 
 
 if __name__ == "__main__":
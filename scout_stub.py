@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Soccer Player Scout - Stub News Server
+A local stand-in for Google News RSS, for offline runs, regression tests
+and load tests. Serves recorded fixtures; anything not recorded gets a
+synthetic feed about whoever was asked for. Latency, errors and payload
+size are all knobs.
+
+Record real responses first (optional):
+    SCOUT_RECORD_DIR=fixtures python3 scout.py "Neymar Jr"
+
+Then replay:
+    python3 scout_stub.py --fixtures fixtures --port 8899 --latency 200 --error-rate 0.05
+    SCOUT_NEWS_URL=http://127.0.0.1:8899/rss/search python3 scout.py "Neymar Jr"
+
+Options:
+    --fixtures DIR      recorded responses (from SCOUT_RECORD_DIR)
+    --port N            default 8899
+    --latency MS        mean added latency per request (default 0)
+    --jitter MS         +/- uniform jitter around --latency (default 0)
+    --error-rate F      fraction of requests that fail with 429/503 (default 0)
+    --items N           items per synthetic feed - sets payload size (default 40)
+    --no-synthetic      404 on anything without a fixture
+    --seed N            make synthetic feeds and failures repeatable
+"""
+
+import sys
+import time
+import random
+import threading
+import urllib.parse
+from email.utils import formatdate
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+from scout import fixture_key, current_matcher
+
+PORT = 8899
+
+OUTLETS = ["BBC Sport", "ESPN", "The Guardian", "Sky Sports", "Marca", "L'Equipe", "Goal.com"]
+FILLER = [
+    "{p} speaks after the weekend", "{p} trains with the squad", "{p} linked with a summer move",
+    "Manager praises {p}", "{p} in the spotlight", "What next for {p}?",
+]
+
+
+class StubConfig:
+    def __init__(self, fixtures=None, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 items=40, synthetic=True, seed=None):
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.items = items
+        self.synthetic = synthetic
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.served = {"fixture": 0, "synthetic": 0, "error": 0, "missing": 0}
+
+    def roll(self):
+        with self.rng_lock:
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms))
+            fail = self.rng.random() < self.error_rate
+            status = self.rng.choice((429, 503))
+        return delay / 1000, (status if fail else None)
+
+
+def _player_from_query(query):
+    """'"Neymar Jr" soccer OR football' -> 'Neymar Jr'"""
+    if query.startswith('"') and '"' in query[1:]:
+        return query[1:query.index('"', 1)]
+    return query
+
+
+def synthetic_feed(query, items, rng):
+    """A plausible feed: mostly filler, some dictionary words, spread over 60 days."""
+    player = escape(_player_from_query(query))
+    dictionaries = current_matcher().dictionaries
+    vocab = [kw.rstrip("*") for group in ("red_flags", "green_flags", "context_clues")
+             for words in dictionaries[group].values() for kw in words]
+    now = time.time()
+    out = []
+    for i in range(items):
+        words = " ".join(rng.sample(vocab, 2)) if rng.random() < 0.4 else ""
+        title = rng.choice(FILLER).format(p=player)
+        out.append(
+            "<item>"
+            f"<title>{title} {escape(words)} - {escape(rng.choice(OUTLETS))}</title>"
+            f"<link>https://stub.local/{fixture_key(query)}/{i}</link>"
+            f"<description>&lt;p&gt;{player} {escape(words)} story {i}.&lt;/p&gt;</description>"
+            f"<pubDate>{formatdate(now - rng.uniform(0, 60 * 86400))}</pubDate>"
+            "</item>"
+        )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{"".join(out)}</channel></rss>'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real thing
+    config = None
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/rss+xml; charset=UTF-8", extra=()):
+        body = body.encode()
+        # Headers + body in one write: avoids Nagle/delayed-ACK stalls on keep-alive
+        head = [f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}",
+                f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+        head.extend(f"{k}: {v}" for k, v in extra)
+        self.wfile.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+        self.wfile.flush()
+
+    def do_GET(self):
+        cfg = self.config
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query).get("q", [""])[0]
+
+        delay, fail = cfg.roll()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            cfg.served["error"] += 1
+            self._send(fail, "stub: injected failure", "text/plain", [("Retry-After", "1")])
+            return
+
+        fixture = cfg.fixtures / f"{fixture_key(query)}.xml" if cfg.fixtures else None
+        if fixture is not None and fixture.exists():
+            cfg.served["fixture"] += 1
+            self._send(200, fixture.read_text(encoding="utf-8"))
+        elif cfg.synthetic:
+            cfg.served["synthetic"] += 1
+            with cfg.rng_lock:
+                body = synthetic_feed(query, cfg.items, cfg.rng)
+            self._send(200, body)
+        else:
+            cfg.served["missing"] += 1
+            self._send(404, f"stub: no fixture for {query!r}", "text/plain")
+
+
+def make_server(config, port=PORT, host="127.0.0.1"):
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def _arg(flag, cast, default):
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv):
+            try:
+                return cast(sys.argv[i + 1])
+            except ValueError:
+                pass
+    return default
+
+
+def main():
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print(__doc__)
+        sys.exit(0)
+
+    config = StubConfig(
+        fixtures=_arg("--fixtures", str, None),
+        latency_ms=_arg("--latency", float, 0),
+        jitter_ms=_arg("--jitter", float, 0),
+        error_rate=_arg("--error-rate", float, 0.0),
+        items=_arg("--items", int, 40),
+        synthetic="--no-synthetic" not in sys.argv,
+        seed=_arg("--seed", int, None),
+    )
+    port = _arg("--port", int, PORT)
+    server = make_server(config, port)
+    print(f"[*] Stub news server on http://127.0.0.1:{port}/rss/search")
+    print(f"[*] Fixtures: {config.fixtures or '-'} | latency {config.latency_ms}ms "
+          f"+/-{config.jitter_ms} | errors {config.error_rate:.0%} | {config.items} items/feed")
+    print(f"[*] Use with: SCOUT_NEWS_URL=http://127.0.0.1:{port}/rss/search")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n[*] Served: {config.served}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Soccer Player Scout - Bulk Watchlist Import / Export
+Load a whole scouting database into the watchlist in one pass and one
+atomic write, or dump the watchlist for another system.
+
+Usage:
+    python3 scout.py --import players.csv
+    python3 scout.py --import players.jsonl --dry-run   # counts only, nothing saved
+    python3 scout.py --export watchlist.csv
+    python3 scout.py --export - --format jsonl          # to stdout
+
+CSV: a header row with at least "name"; optional club, league, aliases
+(separated by ";" or "|"), last_score, last_run.
+JSONL: one player per line - {"name": ..., "club": ..., "aliases": [...]}
+or just a JSON string.
+
+Names match case-, accent- and spacing-blind, aliases included. A player
+already on the list gains any new club/league/aliases; scores are kept.
+"""
+
+import io
+import re
+import sys
+import csv
+import json
+from pathlib import Path
+
+from scout import load_watchlist, edit_watchlist, merge_players, player_entry
+
+FORMATS = ("csv", "jsonl")
+CSV_FIELDS = ["name", "club", "league", "aliases", "last_score", "last_run"]
+_ALIAS_SPLIT = re.compile(r"[;|]")
+
+
+def guess_format(path, default="csv"):
+    """Format from a file extension: .csv, .jsonl / .ndjson."""
+    suffix = Path(str(path)).suffix.lower().lstrip(".")
+    if suffix in ("jsonl", "ndjson"):
+        return "jsonl"
+    return suffix or default
+
+
+# ─── Reading ──────────────────────────────────────────────────────────────────
+
+def read_players(text, fmt):
+    """Yield player records from CSV or JSONL text. Bad lines are skipped and
+    yielded as None so the import can count them."""
+    if fmt == "jsonl":
+        yield from _read_jsonl(text)
+    elif fmt == "csv":
+        yield from _read_csv(text)
+    else:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+
+def _read_jsonl(text):
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            yield None
+            continue
+        yield rec if isinstance(rec, (str, dict)) else None
+
+
+def _read_csv(text):
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or "name" not in [f.strip().lower() for f in reader.fieldnames]:
+        raise ValueError('CSV needs a header row with a "name" column')
+    for row in reader:
+        rec = {}
+        for key, value in row.items():
+            if key is None or value is None or not value.strip():
+                continue
+            key, value = key.strip().lower(), value.strip()
+            if key == "aliases":
+                rec[key] = [a.strip() for a in _ALIAS_SPLIT.split(value) if a.strip()]
+            elif key == "last_score":
+                try:
+                    rec[key] = int(value)
+                except ValueError:
+                    pass
+            else:
+                rec[key] = value
+        yield rec
+
+
+# ─── Writing ──────────────────────────────────────────────────────────────────
+
+def export_players(players, fmt):
+    """The watchlist's players as CSV or JSONL text."""
+    players = [player_entry(p) for p in players]
+    if fmt == "jsonl":
+        return "".join(json.dumps(p, ensure_ascii=False) + "\n" for p in players)
+    if fmt != "csv":
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    for p in players:
+        row = dict(p, aliases=";".join(p.get("aliases", [])))
+        if row.get("last_score") is None:
+            row["last_score"] = ""
+        writer.writerow(row)
+    return out.getvalue()
+
+
+def import_players(text, fmt, dry_run=False):
+    """Merge `text` into the watchlist in one locked edit (dry_run: count only, no save)."""
+    players = list(read_players(text, fmt))  # parse (and reject a bad header) before taking the lock
+
+    def merge(wl):
+        counts = merge_players(wl, players)
+        counts["total"] = len(wl["players"])
+        return counts
+
+    return merge(load_watchlist()) if dry_run else edit_watchlist(merge)
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def _format_arg(argv, path):
+    if "--format" in argv:
+        i = argv.index("--format")
+        if i + 1 < len(argv):
+            return argv[i + 1].lower()
+    return guess_format(path)
+
+
+def main(argv):
+    """scout.py --import PATH [--format csv|jsonl] [--dry-run] | --export PATH|- [--format ...]"""
+    if len(argv) < 2 or argv[0] not in ("--import", "--export") or argv[1].startswith("--"):
+        print(__doc__)
+        sys.exit(1)
+    action, path = argv[0], argv[1]
+    fmt = _format_arg(argv, path if path != "-" else "x.jsonl")
+    if fmt not in FORMATS:
+        print(f"[!] Unknown format {fmt!r} - use --format {' or '.join(FORMATS)}")
+        sys.exit(1)
+
+    if action == "--export":
+        players = load_watchlist().get("players", [])
+        text = export_players(players, fmt)
+        if path == "-":
+            sys.stdout.write(text)
+        else:
+            Path(path).write_text(text, encoding="utf-8")
+            print(f"[*] Exported {len(players)} players to {path}")
+        return
+
+    source = sys.stdin.read() if path == "-" else None
+    if source is None:
+        try:
+            source = Path(path).read_text(encoding="utf-8-sig")
+        except OSError as e:
+            print(f"[!] {e}")
+            sys.exit(1)
+    dry_run = "--dry-run" in argv
+    try:
+        counts = import_players(source, fmt, dry_run=dry_run)
+    except ValueError as e:
+        print(f"[!] {e}")
+        sys.exit(1)
+    note = " (dry run - nothing saved)" if dry_run else ""
+    print(f"[*] Imported {path}: {counts['added']} added, {counts['updated']} updated, "
+          f"{counts['unchanged']} unchanged, {counts['invalid']} invalid{note}")
+    print(f"[*] Watchlist: {counts['total']} players")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
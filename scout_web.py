@@ -6,16 +6,230 @@ Uses Python's built-in http.server. No Flask. No Django. No npm. Just stdlib.
 Usage:
     python3 scout_web.py              # http://localhost:8888
     python3 scout_web.py --port 9000  # http://localhost:9000
+
+Admission control (scouts hit Google News, so they're rationed):
+    SCOUT_WEB_ACTIVE=4        # scouts running at once, across all clients
+    SCOUT_WEB_QUEUE=16        # more may wait; past that -> 429 + Retry-After
+    SCOUT_WEB_PER_CLIENT=2    # running + waiting per client IP (an open batch counts as one)
+    SCOUT_WEB_BATCHES=2       # batches open at once, across all clients
+    SCOUT_WEB_MAX_WAIT=60     # seconds a queued scout waits before giving up
+    SCOUT_WEB_DEADLINE=45     # seconds a scout may run; after that it returns what it
+                              # has, marked "partial" (0 = no limit)
+A scout whose client hangs up is cancelled at its next step - nothing logged.
+
+Several lookbacks, one fetch (the UI switches between them without asking again):
+    curl localhost:8888/api/scout -d '{"player": "Neymar Jr", "days": 14, "windows": [7, 30, 90]}'
+
+Batch API (one request, many players, results streamed as each finishes):
+    curl -N localhost:8888/api/scout/batch \\
+         -d '{"players": ["Neymar Jr", "Kylian Mbappe"], "days": 14, "fields": "player,risk_score"}'
 """
 
+import os
 import sys
 import json
+import math
+import time
+import select
+import socket
+import threading
 import urllib.parse
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from scout import run_scout, load_watchlist, save_watchlist, get_recent_logs
+from collections import deque, Counter
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from scout_metrics import REGISTRY
+from scout import (
+    run_scout, load_watchlist, edit_watchlist, query_logs, iter_logs, update_player, SEARCH_INDEX,
+    normalize_player, log_error, _project, merge_players, cached_result, FetchError, Deadline, Cancelled,
+)
+from scout_watchlist import FORMATS, import_players, export_players
 
 PORT = 8888
 
+# /api/scout/batch: one pool for every batch request, so concurrent batches
+# share (and are bounded by) the same workers, keep-alive connections and matcher
+BATCH_WORKERS = 8
+BATCH_MAX_PLAYERS = 500
+BATCH_FIELDS = [
+    "player", "run_id", "timestamp", "status", "risk_score", "risk_label", "articles_found",
+    "red_flags", "self_check.confidence", "review_items", "errors", "cached",
+]
+BATCH_POOL = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="batch")
+
+# Per-scout time budget; the client's socket (and a queued scout's deadline)
+# is checked this often
+SCOUT_DEADLINE = float(os.environ.get("SCOUT_WEB_DEADLINE", 45))
+DISCONNECT_POLL = 0.25  # seconds
+
+# /api/scout "windows": at most this many lookbacks per scout, each 1..MAX_WINDOW_DAYS
+MAX_WINDOWS = 8
+MAX_WINDOW_DAYS = 365
+
+ROUTES = {
+    "/", "/api/watchlist", "/api/watchlist/import", "/api/watchlist/export",
+    "/api/logs", "/api/scout", "/api/scout/batch", "/api/search", "/metrics",
+}
+HTTP_REQUESTS = REGISTRY.counter("scout_http_requests_total", "HTTP requests", ["route", "method", "status"])
+HTTP_SECONDS = REGISTRY.histogram("scout_http_request_duration_seconds", "HTTP request latency", ["route", "method"])
+HTTP_IN_FLIGHT = REGISTRY.gauge("scout_http_requests_in_flight", "HTTP requests being handled")
+
+ADMISSION_ACTIVE = REGISTRY.gauge("scout_admission_active", "Scouts running under admission control")
+ADMISSION_QUEUED = REGISTRY.gauge("scout_admission_queue_depth", "Scouts waiting for a slot")
+ADMISSION_WAIT = REGISTRY.histogram("scout_admission_wait_seconds", "Time a scout waited for a slot")
+ADMISSION_REJECTED = REGISTRY.counter("scout_admission_rejected_total", "Scouts turned away", ["reason"])
+
+
+# ─── Admission Control ────────────────────────────────────────────────────────
+# Every uncached scout is an upstream fetch. A burst shouldn't become a burst
+# at Google News: a fixed number run, a bounded FIFO queue waits behind them,
+# and anything past that is told when to come back instead of piling up.
+
+class Rejected(Exception):
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Admission:
+    def __init__(self, max_active=4, max_queue=16, per_client=2, max_wait=60.0, max_batches=2):
+        self.max_active = max_active
+        self.max_queue = max_queue
+        self.per_client = per_client
+        self.max_wait = max_wait
+        self.max_batches = max_batches
+        self.active = 0
+        self.batches = 0            # open batches
+        self._waiters = deque()     # one Event per queued scout, FIFO
+        self._clients = Counter()   # client -> running + queued single scouts + open batches
+        self._avg_s = 5.0           # recent scout duration, for Retry-After
+        self._lock = threading.Lock()
+
+    def retry_after(self):
+        """Rough seconds until a slot frees up for a newcomer."""
+        ahead = len(self._waiters) + 1
+        return max(1, math.ceil(self._avg_s * ahead / self.max_active))
+
+    def _reject(self, reason):
+        ADMISSION_REJECTED.inc(reason=reason)
+        return Rejected(reason, self.retry_after())
+
+    @contextmanager
+    def batch(self, client):
+        """
+        Admit a whole batch, or raise Rejected. While open it holds one of
+        the client's per_client units and one of max_batches; its scouts then
+        take slots with bounded=False. A full queue turns batches away too.
+        """
+        with self._lock:
+            if self._clients[client] >= self.per_client:
+                raise self._reject("client_quota")
+            if self.batches >= self.max_batches or len(self._waiters) >= self.max_queue:
+                raise self._reject("queue_full")
+            self._clients[client] += 1
+            self.batches += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._release_client(client)
+                self.batches -= 1
+
+    @contextmanager
+    def slot(self, client, bounded=True, deadline=None):
+        """
+        Hold one of the max_active slots for the duration of the block.
+        bounded=False (batch items - see batch(), which holds one quota unit
+        for all of them) skips the queue limit and the per-client quota and
+        has no max_wait; at most BATCH_WORKERS of them wait at once. Either
+        way a queued scout leaves the queue once its `deadline` is cancelled
+        (Cancelled) or spent (FetchError "deadline").
+        """
+        deadline = deadline or Deadline()
+        waiter = None
+        with self._lock:
+            if bounded and self._clients[client] >= self.per_client:
+                raise self._reject("client_quota")
+            if self.active < self.max_active and not self._waiters:
+                self.active += 1
+            elif bounded and len(self._waiters) >= self.max_queue:
+                raise self._reject("queue_full")
+            else:
+                waiter = threading.Event()
+                self._waiters.append(waiter)
+            if bounded:
+                self._clients[client] += 1
+            self._publish()
+
+        start = time.perf_counter()
+        if waiter is not None:
+            self._wait(waiter, client, bounded, deadline)
+        waited = time.perf_counter() - start
+        ADMISSION_WAIT.observe(waited)
+        try:
+            yield waited
+        finally:
+            ran = time.perf_counter() - start - waited
+            with self._lock:
+                self._avg_s = 0.8 * self._avg_s + 0.2 * ran
+                if bounded:
+                    self._release_client(client)
+                if self._waiters:
+                    self._waiters.popleft().set()  # slot passes straight to the next in line
+                else:
+                    self.active -= 1
+                self._publish()
+
+    def _wait(self, waiter, client, bounded, deadline):
+        """Wait in line for a slot, a short slice at a time, so an abandoned
+        scout gives up its place instead of pinning its thread."""
+        give_up = time.monotonic() + self.max_wait if bounded else None
+        while not waiter.wait(deadline.timeout(DISCONNECT_POLL) or 0.001):
+            timed_out = give_up is not None and time.monotonic() >= give_up
+            if not (deadline.cancelled or deadline.expired or timed_out):
+                continue
+            with self._lock:
+                if waiter.is_set():
+                    return  # handed a slot at the last moment - take it
+                self._waiters.remove(waiter)
+                if bounded:
+                    self._release_client(client)
+                self._publish()
+            deadline.check("admission")
+            if deadline.expired:
+                raise FetchError("ran out of time waiting for a scout slot", "deadline")
+            raise self._reject("wait_timeout")
+
+    def _release_client(self, client):
+        self._clients[client] -= 1
+        if self._clients[client] <= 0:
+            del self._clients[client]
+
+    def _publish(self):
+        ADMISSION_ACTIVE.set(self.active)
+        ADMISSION_QUEUED.set(len(self._waiters))
+
+
+ADMISSION = Admission(
+    max_active=int(os.environ.get("SCOUT_WEB_ACTIVE", 4)),
+    max_queue=int(os.environ.get("SCOUT_WEB_QUEUE", 16)),
+    per_client=int(os.environ.get("SCOUT_WEB_PER_CLIENT", 2)),
+    max_wait=float(os.environ.get("SCOUT_WEB_MAX_WAIT", 60)),
+    max_batches=int(os.environ.get("SCOUT_WEB_BATCHES", 2)),
+)
+
+
+def admitted_scout(client, player, bounded=True, **kwargs):
+    """run_scout behind admission control. Fresh cached results skip the line -
+    they don't touch upstream."""
+    if not kwargs.get("force") and cached_result(player, kwargs.get("days", 14),
+                                                  windows=kwargs.get("windows")) is not None:
+        return run_scout(player, **kwargs)
+    with ADMISSION.slot(client, bounded=bounded, deadline=kwargs.get("deadline")):
+        return run_scout(player, **kwargs)
+
+
 HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -59,12 +273,13 @@ body {
     padding: 8px 12px; border-radius: 4px; cursor: pointer;
     font-weight: bold; font-family: inherit;
 }
-.player-list { flex: 1; overflow-y: auto; }
+.player-list { flex: 1; overflow-y: auto; position: relative; }
 .player-item {
     display: flex; align-items: center; justify-content: space-between;
-    padding: 10px 20px; cursor: pointer; border-bottom: 1px solid #131a2b;
+    height: 40px; padding: 0 20px; cursor: pointer; border-bottom: 1px solid #131a2b;
     transition: background 0.15s;
 }
+.player-item .name { overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
 .player-item:hover { background: #131a2b; }
 .player-item.active { background: #1a2744; border-left: 3px solid #00d4aa; }
 .player-item .name { font-size: 14px; }
@@ -118,7 +333,7 @@ body {
 .tab.active { color: #00d4aa; border-bottom-color: #00d4aa; }
 
 /* Content */
-.content { flex: 1; overflow-y: auto; padding: 20px; }
+.content { flex: 1; overflow-y: auto; padding: 20px; position: relative; }
 .report-output {
     white-space: pre-wrap; font-size: 13px; line-height: 1.6;
     color: #a0b0c0;
@@ -130,14 +345,21 @@ body {
 .empty-state .icon { font-size: 48px; margin-bottom: 16px; }
 .empty-state p { font-size: 15px; }
 
+.cache-note {
+    color: #5a6e82; font-size: 12px; margin-bottom: 12px;
+}
+.cache-note a { color: #00d4aa; cursor: pointer; text-decoration: underline; }
+
 /* Logs */
 .log-entry {
-    padding: 12px 16px; border-bottom: 1px solid #131a2b;
+    height: 44px; padding: 0 16px; border-bottom: 1px solid #131a2b;
     font-size: 13px; display: flex; gap: 16px; align-items: center;
+    white-space: nowrap; overflow: hidden;
 }
 .log-entry .ts { color: #3a4a5c; white-space: nowrap; }
 .log-entry .player { color: #00d4aa; min-width: 140px; }
-.log-entry .result { flex: 1; }
+.log-entry .result { flex: 1; overflow: hidden; text-overflow: ellipsis; }
+.list-status { padding: 12px 16px; color: #3a4a5c; font-size: 12px; }
 .log-entry .trigger {
     color: #5a6e82; font-size: 11px; background: #131a2b;
     padding: 2px 8px; border-radius: 8px;
@@ -173,14 +395,17 @@ body {
             <input type="text" id="addName" placeholder="Add player..." onkeydown="if(event.key==='Enter')addPlayer()">
             <button onclick="addPlayer()">+</button>
         </div>
-        <div class="player-list" id="playerList"></div>
+        <div class="player-list" id="playerList">
+            <div id="playerEmpty" style="display:none;padding:20px;color:#2a3a4c;text-align:center;font-size:13px">No players yet.<br>Add one above.</div>
+            <div id="playerRows"></div>
+        </div>
     </div>
 
     <!-- Main -->
     <div class="main">
         <div class="search-bar">
             <input type="text" id="scoutName" placeholder="Scout any player..." onkeydown="if(event.key==='Enter')scoutPlayer()">
-            <select id="scoutDays">
+            <select id="scoutDays" onchange="selectWindow()">
                 <option value="7">7 days</option>
                 <option value="14" selected>14 days</option>
                 <option value="30">30 days</option>
@@ -203,7 +428,10 @@ body {
             </div>
             <div class="report-output" id="reportOutput" style="display:none"></div>
             <div id="auditOutput" style="display:none"></div>
-            <div id="logsOutput" style="display:none"></div>
+            <div id="logsOutput" style="display:none">
+                <div id="logRows"></div>
+                <div class="list-status" id="logsStatus"></div>
+            </div>
         </div>
     </div>
 </div>
@@ -211,6 +439,9 @@ body {
 <script>
 let currentResult = null;
 let watchlist = { players: [], settings: { days: 14 } };
+// Only what the log list renders - full entries stay on the server
+const LOG_FIELDS = 'run_id,timestamp,player,trigger,risk_score,risk_label,articles_found,duration_ms,self_check.confidence';
+const LOG_PAGE = 100;
 
 // ── API calls ──
 async function api(method, path, body) {
@@ -220,8 +451,86 @@ async function api(method, path, body) {
     return r.json();
 }
 
+// ── Windowed list ──
+// Only the rows in view (plus OVERSCAN either side) exist in the DOM, so a
+// list of 50,000 costs what a list of 50 does. Rows are keyed: a row that
+// stays in view keeps its element and is redrawn only if its data changed.
+const OVERSCAN = 10;
+
+class VirtualList {
+    constructor(host, scroller, rowHeight, opts) {
+        this.host = host;          // positioned box the rows live in
+        this.scroller = scroller;  // the element that actually scrolls
+        this.rowHeight = rowHeight;
+        this.key = opts.key;
+        this.sig = opts.sig || opts.key;   // changes when a row must be redrawn
+        this.draw = opts.draw;             // draw(el, item) fills a row element
+        this.onEnd = opts.onEnd || null;   // called when the window nears the end
+        this.items = [];
+        this.rows = new Map();             // key -> { el, sig }
+        this.pending = false;
+        host.style.position = 'relative';
+        scroller.addEventListener('scroll', () => this.schedule(), { passive: true });
+        window.addEventListener('resize', () => this.schedule());
+    }
+
+    setItems(items) {
+        this.items = items;
+        this.schedule();
+    }
+
+    schedule() {
+        if (this.pending) return;
+        this.pending = true;
+        requestAnimationFrame(() => { this.pending = false; this.render(); });
+    }
+
+    render() {
+        const h = this.rowHeight, n = this.items.length;
+        this.host.style.height = (n * h) + 'px';
+        if (this.host.offsetParent === null) return;  // hidden tab - draw when shown
+        const top = this.scroller.scrollTop - this.host.offsetTop;
+        const first = Math.max(0, Math.floor(top / h) - OVERSCAN);
+        const last = Math.min(n, Math.ceil((top + this.scroller.clientHeight) / h) + OVERSCAN);
+        const visible = new Map();
+        for (let i = first; i < last; i++) {
+            const item = this.items[i];
+            const k = this.key(item), s = this.sig(item);
+            let row = this.rows.get(k);
+            if (row) {
+                this.rows.delete(k);
+            } else {
+                row = { el: document.createElement('div'), sig: null };
+                row.el.style.cssText = 'position:absolute;left:0;right:0';
+                this.host.appendChild(row.el);
+            }
+            if (row.sig !== s) { this.draw(row.el, item); row.sig = s; }
+            row.el.dataset.index = i;
+            row.el.style.top = (i * h) + 'px';
+            visible.set(k, row);
+        }
+        this.rows.forEach(row => row.el.remove());
+        this.rows = visible;
+        if (this.onEnd && last >= n - OVERSCAN) this.onEnd();
+    }
+
+    itemAt(el) {
+        const row = el.closest('[data-index]');
+        return row ? this.items[+row.dataset.index] : null;
+    }
+}
+
+function scoreClass(score) {
+    return score === null || score === undefined ? '' : score <= 2 ? 'score-low' : score <= 5 ? 'score-mod' : 'score-high';
+}
+
 // ── Scout a player ──
-async function scoutPlayer() {
+// One scout scores every lookback in the dropdown (one fetch, server-side);
+// changing the dropdown afterwards just switches windows here.
+const WINDOWS = Array.from(document.getElementById('scoutDays').options, o => parseInt(o.value));
+let scoutedResult = null;
+
+async function scoutPlayer(force) {
     const name = document.getElementById('scoutName').value.trim();
     if (!name) return;
     const days = parseInt(document.getElementById('scoutDays').value);
@@ -231,7 +540,11 @@ async function scoutPlayer() {
     btn.innerHTML = '<span class="spinner"></span>Scouting...';
 
     try {
-        currentResult = await api('POST', '/api/scout', { player: name, days });
+        const result = await api('POST', '/api/scout', { player: name, days, force: !!force, windows: WINDOWS });
+        if (result.error) throw new Error(result.error + (result.retry_after ? ' - try again in ' + result.retry_after + 's' : ''));
+        scoutedResult = result;
+        currentResult = result;
+        if (!result.partial) updateScore(name, currentResult.log && currentResult.log.risk_score);
         showReport();
         switchTab('report');
     } catch(e) {
@@ -243,12 +556,33 @@ async function scoutPlayer() {
     btn.textContent = 'SCOUT';
 }
 
+function selectWindow() {
+    const days = document.getElementById('scoutDays').value;
+    const name = document.getElementById('scoutName').value.trim().toLowerCase();
+    const windows = scoutedResult && scoutedResult.windows;
+    if (!windows || !windows[days] || scoutedResult.log.player.toLowerCase() !== name) return;
+    const w = windows[days];
+    currentResult = Object.assign({}, scoutedResult, {
+        report: w.report,
+        log: Object.assign({}, scoutedResult.log, w),
+    });
+    const tab = document.querySelector('.tab.active').dataset.tab;
+    if (tab !== 'logs') switchTab(tab);
+}
+
 // ── Display report ──
 function showReport() {
     if (!currentResult) return;
     document.getElementById('emptyState').style.display = 'none';
-    document.getElementById('reportOutput').textContent = currentResult.report;
-    document.getElementById('reportOutput').style.display = 'block';
+    const out = document.getElementById('reportOutput');
+    out.textContent = currentResult.report;
+    if (currentResult.cached) {
+        const note = document.createElement('div');
+        note.className = 'cache-note';
+        note.innerHTML = 'Cached result from ' + currentResult.cache_age_s + 's ago. <a onclick="scoutPlayer(true)">Refresh</a>';
+        out.prepend(note);
+    }
+    out.style.display = 'block';
 }
 
 // ── Display audit ──
@@ -306,34 +640,66 @@ function showAudit() {
 }
 
 // ── Display logs ──
-async function showLogs() {
-    const el = document.getElementById('logsOutput');
+// Newest first, one page at a time: the next page is fetched when the
+// window scrolls near the end of what's loaded.
+const logView = { items: [], cursor: null, done: false, loading: false, generation: 0 };
+
+const logList = new VirtualList(
+    document.getElementById('logRows'), document.getElementById('content'), 44, {
+        key: log => log.run_id + '|' + log.timestamp,
+        draw: drawLog,
+        onEnd: () => loadLogPage(),
+    });
+
+function drawLog(el, log) {
+    const ts = log.timestamp ? log.timestamp.substring(0, 16).replace('T', ' ') : '?';
+    const sc = log.risk_score;
+    const conf = log.self_check ? Math.round(log.self_check.confidence * 100) + '%' : '?';
+    el.className = 'log-entry';
+    el.innerHTML = '<span class="ts"></span><span class="player"></span><span class="score"></span>' +
+        '<span class="result"></span><span class="trigger"></span>';
+    el.children[0].textContent = ts;
+    el.children[1].textContent = log.player || '?';
+    el.children[2].className = 'score ' + scoreClass(sc);
+    el.children[2].textContent = sc === null || sc === undefined ? '--' : sc + '/10';
+    el.children[3].textContent = (log.risk_label || '') + ' | ' + (log.articles_found || 0) + ' articles | ' +
+        conf + ' confidence | ' + (log.duration_ms || 0) + 'ms';
+    el.children[4].textContent = log.trigger || '?';
+}
+
+async function loadLogPage() {
+    if (logView.loading || logView.done) return;
+    logView.loading = true;
+    const generation = logView.generation;
+    const status = document.getElementById('logsStatus');
+    status.textContent = 'Loading...';
     try {
-        const logs = await api('GET', '/api/logs');
-        if (!logs.length) {
-            el.innerHTML = '<div class="empty-state"><p>No runs logged yet</p></div>';
-            el.style.display = 'block';
-            return;
-        }
-        let html = '';
-        logs.reverse().forEach(log => {
-            const ts = log.timestamp ? log.timestamp.substring(0, 16).replace('T', ' ') : '?';
-            const sc = log.risk_score;
-            const cls = sc <= 2 ? 'score-low' : sc <= 5 ? 'score-mod' : 'score-high';
-            const conf = log.self_check ? Math.round(log.self_check.confidence * 100) + '%' : '?';
-            html += '<div class="log-entry">';
-            html += '<span class="ts">' + ts + '</span>';
-            html += '<span class="player">' + (log.player || '?') + '</span>';
-            html += '<span class="score ' + cls + '">' + sc + '/10</span>';
-            html += '<span class="result">' + (log.risk_label || '') + ' | ' + (log.articles_found || 0) + ' articles | ' + conf + ' confidence | ' + (log.duration_ms || 0) + 'ms</span>';
-            html += '<span class="trigger">' + (log.trigger || '?') + '</span>';
-            html += '</div>';
-        });
-        el.innerHTML = html;
+        let path = '/api/logs?limit=' + LOG_PAGE + '&fields=' + LOG_FIELDS;
+        if (logView.cursor !== null) path += '&cursor=' + logView.cursor;
+        const page = await api('GET', path);
+        if (generation !== logView.generation) return;  // tab was reopened meanwhile
+        logView.items = logView.items.concat(page.entries);
+        logView.cursor = page.next_cursor;
+        logView.done = page.next_cursor === null;
+        status.textContent = !logView.items.length ? 'No runs logged yet' :
+            logView.done ? logView.items.length + ' runs' : '';
+        logList.setItems(logView.items);
     } catch(e) {
-        el.innerHTML = '<div style="color:#ff4444;padding:20px">Error loading logs: ' + e.message + '</div>';
+        status.textContent = 'Error loading logs: ' + e.message;
+        logView.done = true;
+    } finally {
+        if (generation === logView.generation) logView.loading = false;
     }
-    el.style.display = 'block';
+}
+
+function showLogs() {
+    // Fresh from the top each time the tab opens
+    Object.assign(logView, { items: [], cursor: null, done: false, loading: false });
+    logView.generation++;
+    document.getElementById('content').scrollTop = 0;
+    document.getElementById('logsOutput').style.display = 'block';
+    logList.setItems([]);
+    loadLogPage();
 }
 
 // ── Tab switching ──
@@ -350,41 +716,65 @@ function switchTab(tab) {
 }
 
 // ── Watchlist ──
-async function loadWatchlist() {
-    watchlist = await api('GET', '/api/watchlist');
-    renderWatchlist();
-}
+// The server answers every watchlist change with the new watchlist; that
+// response is applied directly and only rows whose data changed are redrawn.
+const playerList = new VirtualList(
+    document.getElementById('playerRows'), document.getElementById('playerList'), 40, {
+        key: p => p.name.toLowerCase(),
+        sig: p => p.name + '|' + p.last_score,
+        draw: drawPlayer,
+    });
 
-function renderWatchlist() {
-    const el = document.getElementById('playerList');
-    if (!watchlist.players || !watchlist.players.length) {
-        el.innerHTML = '<div style="padding:20px;color:#2a3a4c;text-align:center;font-size:13px">No players yet.<br>Add one above.</div>';
-        return;
+document.getElementById('playerRows').addEventListener('click', e => {
+    const p = playerList.itemAt(e.target);
+    if (!p) return;
+    if (e.target.closest('.remove')) removePlayer(watchlist.players.indexOf(p));
+    else scoutFromList(p.name);
+});
+
+function drawPlayer(el, p) {
+    const score = p.last_score !== undefined ? p.last_score : null;
+    el.className = 'player-item';
+    el.innerHTML = '<span class="name"></span><span><span></span><span class="remove">x</span></span>';
+    el.children[0].textContent = p.name;
+    if (score !== null) {
+        const badge = el.children[1].children[0];
+        badge.className = 'score ' + scoreClass(score);
+        badge.textContent = score;
     }
-    el.innerHTML = watchlist.players.map((p, i) => {
-        const name = typeof p === 'string' ? p : p.name;
-        const score = typeof p === 'object' && p.last_score !== undefined ? p.last_score : null;
-        const cls = score === null ? '' : score <= 2 ? 'score-low' : score <= 5 ? 'score-mod' : 'score-high';
-        return '<div class="player-item" onclick="scoutFromList(\'' + name.replace(/'/g, "\\'") + '\')">' +
-            '<span class="name">' + name + '</span>' +
-            '<span>' + (score !== null ? '<span class="score ' + cls + '">' + score + '</span>' : '') +
-            '<span class="remove" onclick="event.stopPropagation();removePlayer(' + i + ')">x</span></span>' +
-            '</div>';
-    }).join('');
+}
+
+function setWatchlist(wl) {
+    wl.players = (wl.players || []).map(p => typeof p === 'string' ? { name: p } : p);
+    watchlist = wl;
+    document.getElementById('playerEmpty').style.display = wl.players.length ? 'none' : 'block';
+    playerList.setItems(wl.players);
+}
+
+function updateScore(name, score) {
+    // The server already saved it; mirror that one row instead of refetching
+    const k = name.toLowerCase();
+    const i = watchlist.players.findIndex(p => p.name.toLowerCase() === k);
+    if (i < 0 || score === undefined) return;
+    watchlist.players[i] = Object.assign({}, watchlist.players[i], { last_score: score });
+    playerList.setItems(watchlist.players);
+}
+
+async function loadWatchlist() {
+    setWatchlist(await api('GET', '/api/watchlist'));
 }
 
 async function addPlayer() {
     const input = document.getElementById('addName');
     const name = input.value.trim();
     if (!name) return;
-    await api('POST', '/api/watchlist', { action: 'add', player: name });
+    setWatchlist(await api('POST', '/api/watchlist', { action: 'add', player: name }));
     input.value = '';
-    await loadWatchlist();
 }
 
 async function removePlayer(index) {
-    await api('POST', '/api/watchlist', { action: 'remove', index });
-    await loadWatchlist();
+    if (index < 0) return;
+    setWatchlist(await api('POST', '/api/watchlist', { action: 'remove', index }));
 }
 
 function scoutFromList(name) {
@@ -405,9 +795,37 @@ class ScoutHandler(BaseHTTPRequestHandler):
         # Quiet logs - just timestamp + path
         sys.stderr.write(f"[{self.log_date_time_string()}] {args[0]}\n")
 
-    def _json(self, data, status=200):
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def _instrumented(self, handler):
+        """Count and time every request by route (unknown paths share one label)."""
+        path = urllib.parse.urlparse(self.path).path or "/"
+        route = path if path in ROUTES else "other"
+        self._status = 0
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            handler()
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_SECONDS.observe(time.perf_counter() - start, route=route, method=self.command)
+            HTTP_REQUESTS.inc(route=route, method=self.command, status=self._status)
+
+    def _text(self, text, content_type="text/plain; version=0.0.4"):
+        body = text.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, data, status=200, headers=None):
         body = json.dumps(data, default=str).encode()
         self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
@@ -421,28 +839,270 @@ class ScoutHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(body)
 
+    def _ndjson(self, rows):
+        """Stream rows as NDJSON. Chunked on HTTP/1.1, close-delimited otherwise."""
+        chunked = self.request_version == "HTTP/1.1"
+        if chunked:
+            # Chunked framing needs an HTTP/1.1 status line; still one response per connection
+            self.protocol_version = "HTTP/1.1"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Connection", "close")
+        self.close_connection = True
+        self.end_headers()
+        try:
+            for row in rows:
+                line = json.dumps(row, default=str).encode() + b"\n"
+                if chunked:
+                    self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                else:
+                    self.wfile.write(line)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client hung up mid-stream; closing `rows` stops its producer
+        finally:
+            if hasattr(rows, "close"):
+                rows.close()
+
+    @contextmanager
+    def _cancel_on_disconnect(self, deadline):
+        """
+        Watch the client's connection while the block runs; if it hangs up,
+        cancel `deadline`. A closed socket reads as ready with nothing in it -
+        a peek tells that apart from a pipelined next request.
+        """
+        done = threading.Event()
+        sock = self.connection
+
+        def watch():
+            while not done.wait(DISCONNECT_POLL):
+                try:
+                    ready, _, _ = select.select([sock], [], [], 0)
+                    if ready and not sock.recv(1, socket.MSG_PEEK):
+                        deadline.cancel("client disconnected")
+                        return
+                except (OSError, ValueError):
+                    deadline.cancel("client disconnected")
+                    return
+
+        threading.Thread(target=watch, daemon=True, name="disconnect-watch").start()
+        try:
+            yield deadline
+        finally:
+            done.set()
+
+    def _query(self):
+        """Query string as a flat dict (last value wins)."""
+        qs = urllib.parse.urlparse(self.path).query
+        return {k: v[-1] for k, v in urllib.parse.parse_qs(qs).items()}
+
     def _read_body(self):
+        raw = self._read_raw()
+        return json.loads(raw) if raw else {}
+
+    def _read_raw(self):
         length = int(self.headers.get("Content-Length", 0))
-        if length == 0:
-            return {}
-        return json.loads(self.rfile.read(length))
+        return self.rfile.read(length) if length else b""
 
     def do_GET(self):
+        self._instrumented(self._get)
+
+    def do_POST(self):
+        self._instrumented(self._post)
+
+    def _get(self):
         path = urllib.parse.urlparse(self.path).path
 
         if path == "/" or path == "":
             self._html(HTML)
 
+        elif path == "/metrics":
+            self._text(REGISTRY.render())
+
         elif path == "/api/watchlist":
             self._json(load_watchlist())
 
+        elif path == "/api/watchlist/export":
+            fmt = self._query().get("format", "csv")
+            if fmt not in FORMATS:
+                self._json({"error": f"format must be one of {', '.join(FORMATS)}"}, 400)
+                return
+            content_type = "text/csv; charset=utf-8" if fmt == "csv" else "application/x-ndjson"
+            self._text(export_players(load_watchlist().get("players", []), fmt), content_type)
+
         elif path == "/api/logs":
-            self._json(get_recent_logs(100))
+            self._logs(self._query())
+
+        elif path == "/api/search":
+            self._search(self._query())
 
         else:
             self.send_error(404)
 
-    def do_POST(self):
+    def _logs(self, q):
+        """
+        GET /api/logs?cursor=&limit=&player=&trigger=&min_score=&max_score=&fields=&format=
+        Newest first. Page with the returned next_cursor. format=ndjson streams
+        every matching entry instead of one page - use that for exports.
+        """
+        try:
+            cursor = int(q["cursor"]) if q.get("cursor") else None
+            limit = max(1, min(int(q.get("limit", 50)), 500))
+            min_score = int(q["min_score"]) if q.get("min_score") else None
+            max_score = int(q["max_score"]) if q.get("max_score") else None
+        except ValueError:
+            self._json({"error": "cursor, limit, min_score and max_score must be integers"}, 400)
+            return
+        filters = {
+            "player": q.get("player") or None,
+            "trigger": q.get("trigger") or None,
+            "min_score": min_score,
+            "max_score": max_score,
+            "fields": [f for f in q.get("fields", "").split(",") if f] or None,
+        }
+        if q.get("format") == "ndjson":
+            self._ndjson(entry for _, entry in iter_logs(cursor=cursor, **filters))
+        else:
+            self._json(query_logs(cursor=cursor, limit=limit, **filters))
+
+    def _search(self, q):
+        """
+        GET /api/search?q=&phrase=&player=&days=&limit=&cursor=
+        Every article any run has fetched, latest first. q = words that must
+        all appear (drink* for prefixes), phrase = words in order, player =
+        only stories fetched for them, days = only the last N days.
+        """
+        try:
+            limit = max(1, min(int(q.get("limit", 50)), 200))
+            cursor = int(q["cursor"]) if q.get("cursor") else None
+            since = time.time() - int(q["days"]) * 86400 if q.get("days") else None
+        except ValueError:
+            self._json({"error": "limit, cursor and days must be integers"}, 400)
+            return
+        try:
+            self._json(SEARCH_INDEX.search(q.get("q"), q.get("phrase"), q.get("player"),
+                                           since=since, limit=limit, cursor=cursor))
+        except ValueError as e:
+            self._json({"error": str(e)}, 400)
+
+    def _batch(self, data):
+        """
+        POST /api/scout/batch {"players": [...], "days": 14, "force": false, "fields": "a,b.c"}
+        Streams one NDJSON line per player as it finishes (not in request
+        order), then {"summary": ...}. Lines are compact log entries - no text
+        report - projected to `fields` (default BATCH_FIELDS).
+        """
+        players = data.get("players")
+        if not isinstance(players, list) or not players:
+            self._json({"error": "players must be a non-empty list"}, 400)
+            return
+        try:
+            days = int(data.get("days", 14))
+        except (TypeError, ValueError):
+            self._json({"error": "days must be an integer"}, 400)
+            return
+        # Same player twice (any case/accents) is one scout
+        unique = {}
+        for p in players:
+            name = str(p).strip()
+            if name:
+                unique.setdefault(normalize_player(name), name)
+        if len(unique) > BATCH_MAX_PLAYERS:
+            self._json({"error": f"at most {BATCH_MAX_PLAYERS} players per batch"}, 400)
+            return
+        fields = data.get("fields") or BATCH_FIELDS
+        if isinstance(fields, str):
+            fields = [f for f in fields.split(",") if f]
+        force = bool(data.get("force"))
+        client = self.client_address[0]
+        try:
+            # The batch as a whole; its scouts then share the slots (bounded=False never rejects)
+            with ADMISSION.batch(client), self._cancel_on_disconnect(Deadline()) as batch_deadline:
+                self._ndjson(self._batch_rows(client, list(unique.values()), days, force, fields, batch_deadline))
+        except Rejected as e:
+            self._busy(e)
+
+    def _busy(self, rejected):
+        reasons = {
+            "client_quota": "too many scouts in flight from this client",
+            "queue_full": "scout queue is full",
+            "wait_timeout": "waited too long for a scout slot",
+        }
+        self._json({"error": reasons.get(rejected.reason, rejected.reason), "reason": rejected.reason,
+                    "retry_after": rejected.retry_after},
+                   429, headers={"Retry-After": str(rejected.retry_after)})
+
+    def _fetch_failed(self, error):
+        """Upstream is down or refusing: 503 + Retry-After when we know when to
+        come back (open circuit, throttled), 502 otherwise, 504 if the scout
+        ran out of time before scoring anything. Never a fake score."""
+        body = {"error": f"couldn't fetch news: {error}", "fetch_error": error.to_dict(),
+                "run_id": error.log_entry and error.log_entry["run_id"]}
+        if error.kind == "deadline":
+            self._json(body, 504)
+        elif error.retry_after:
+            retry = max(1, math.ceil(error.retry_after))
+            self._json(dict(body, retry_after=retry), 503, headers={"Retry-After": str(retry)})
+        else:
+            self._json(body, 502)
+
+    def _batch_rows(self, client, names, days, force, fields, batch_deadline):
+        start = time.time()
+        futures = {
+            BATCH_POOL.submit(admitted_scout, client, name, bounded=False, days=days, trigger="batch",
+                              force=force, deadline=Deadline(SCOUT_DEADLINE or None, parent=batch_deadline)): name
+            for name in names
+        }
+        scores = {}
+        errors = 0
+        finished = False
+        try:
+            for fut in as_completed(futures):
+                name = futures[fut]
+                try:
+                    result = fut.result()
+                except FetchError as e:
+                    errors += 1  # already in errors.log and the audit trail
+                    yield {"player": name, "error": str(e), "fetch_error": e.to_dict()}
+                    continue
+                except Cancelled:
+                    continue
+                except Exception as e:
+                    log_error(str(e), name, "batch")
+                    errors += 1
+                    yield {"player": name, "error": str(e)}
+                    continue
+                if not result.get("partial"):
+                    scores[normalize_player(name)] = result["log"]["risk_score"]
+                yield _project(dict(result["log"], cached=result["cached"]), fields)
+            finished = True
+        finally:
+            # Client went away: don't start scouts nobody will read, stop the running ones
+            for fut in futures:
+                fut.cancel()
+            if not finished:
+                batch_deadline.cancel("client disconnected")
+            self._save_scores(scores)
+        yield {"summary": {"players": len(names), "errors": errors,
+                           "duration_ms": int((time.time() - start) * 1000)}}
+
+    def _save_scores(self, scores):
+        """Put batch scores on watchlist players - one locked edit."""
+        if not scores:
+            return
+
+        def apply(wl):
+            for i, p in enumerate(wl["players"]):
+                key = normalize_player(p if isinstance(p, str) else p.get("name", ""))
+                if key in scores:
+                    wl["players"][i] = update_player(p, last_score=scores[key])
+
+        edit_watchlist(apply)
+
+    def _post(self):
         path = urllib.parse.urlparse(self.path).path
 
         if path == "/api/scout":
@@ -452,45 +1112,89 @@ class ScoutHandler(BaseHTTPRequestHandler):
             if not player:
                 self._json({"error": "player name required"}, 400)
                 return
-            result = run_scout(player, days=days, trigger="web")
+            windows = data.get("windows") or None
+            try:
+                if windows is not None:
+                    windows = sorted({int(w) for w in windows})
+                    if len(windows) > MAX_WINDOWS or not all(0 < w <= MAX_WINDOW_DAYS for w in windows):
+                        raise ValueError
+            except (TypeError, ValueError):
+                self._json({"error": f"windows must be up to {MAX_WINDOWS} day counts "
+                                     f"between 1 and {MAX_WINDOW_DAYS}"}, 400)
+                return
+            try:
+                with self._cancel_on_disconnect(Deadline(SCOUT_DEADLINE or None)) as deadline:
+                    result = admitted_scout(self.client_address[0], player, days=days, trigger="web",
+                                            force=bool(data.get("force")), windows=windows,
+                                            deadline=deadline)
+            except Rejected as e:
+                self._busy(e)
+                return
+            except FetchError as e:
+                self._fetch_failed(e)
+                return
+            except Cancelled:
+                self.close_connection = True  # nobody left to answer
+                return
+            if result.get("partial"):
+                self._json(result)  # a score over part of the news isn't the player's score
+                return
             # Update watchlist score if player is on it
-            wl = load_watchlist()
-            for i, p in enumerate(wl["players"]):
-                name = p if isinstance(p, str) else p.get("name", "")
-                if name.lower() == player.lower():
-                    wl["players"][i] = {"name": name, "last_score": result["log"]["risk_score"]}
-                    save_watchlist(wl)
-                    break
+            def apply(wl):
+                for i, p in enumerate(wl["players"]):
+                    name = p if isinstance(p, str) else p.get("name", "")
+                    if name.lower() == player.lower():
+                        wl["players"][i] = update_player(p, last_score=result["log"]["risk_score"])
+                        break
+
+            edit_watchlist(apply)
             self._json(result)
 
+        elif path == "/api/scout/batch":
+            self._batch(self._read_body())
+
+        elif path == "/api/watchlist/import":
+            # Raw CSV or JSONL body; ?format= or the Content-Type says which
+            q = self._query()
+            ctype = self.headers.get("Content-Type", "")
+            fmt = q.get("format") or ("jsonl" if "json" in ctype else "csv")
+            try:
+                text = self._read_raw().decode("utf-8-sig")
+                counts = import_players(text, fmt, dry_run=q.get("dry_run") in ("1", "true"))
+            except (UnicodeDecodeError, ValueError) as e:
+                self._json({"error": str(e)}, 400)
+                return
+            self._json(counts)
+
         elif path == "/api/watchlist":
             data = self._read_body()
-            wl = load_watchlist()
             action = data.get("action")
 
-            if action == "add":
-                name = data.get("player", "").strip()
-                if name:
-                    # Don't duplicate
-                    existing = [
-                        (p if isinstance(p, str) else p.get("name", "")).lower()
-                        for p in wl["players"]
-                    ]
-                    if name.lower() not in existing:
-                        wl["players"].append({"name": name, "last_score": None})
-                        save_watchlist(wl)
-            elif action == "remove":
-                idx = data.get("index")
-                if isinstance(idx, int) and 0 <= idx < len(wl["players"]):
-                    wl["players"].pop(idx)
-                    save_watchlist(wl)
-
-            self._json(wl)
+            def apply(wl):
+                if action == "add":
+                    name = data.get("player", "").strip()
+                    # Don't duplicate - by name or alias, accents and case ignored
+                    if name:
+                        merge_players(wl, [name])
+                elif action == "remove":
+                    idx = data.get("index")
+                    if isinstance(idx, int) and 0 <= idx < len(wl["players"]):
+                        wl["players"].pop(idx)
+                return wl
+
+            self._json(edit_watchlist(apply))
 
         else:
             self.send_error(404)
 
 
+class ScoutServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # A burst should reach admission control and get a 429, not a TCP reset
+    # from a full listen backlog (the default is 5)
+    request_queue_size = 128
+
+
 def main():
     port = PORT
     for i, arg in enumerate(sys.argv[1:], 1):
@@ -500,7 +1204,8 @@ def main():
             except ValueError:
                 pass
 
-    server = HTTPServer(("0.0.0.0", port), ScoutHandler)
+    # Threaded: a long scout or a streaming batch doesn't hold up the UI
+    server = ScoutServer(("0.0.0.0", port), ScoutHandler)
     print(f"[*] Soccer Scout Web UI running at http://localhost:{port}")
     print(f"[*] Press Ctrl+C to stop")
     try:
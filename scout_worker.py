@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Soccer Player Scout - Warm Worker
+A long-lived scout process on a Unix socket. Pays interpreter startup,
+imports and dictionary compilation once, then keeps the matcher, keep-alive
+HTTP connections and result cache warm for every CLI call after that.
+
+Usage:
+    python3 scout_worker.py &           # scout.py uses it automatically
+    python3 scout_worker.py --status    # is it up?
+
+Protocol: one JSON object per line in, one JSON object per line out.
+    {"op": "scout", "player": "Neymar Jr", "days": 14, "force": false}
+    {"op": "scout", "player": "Neymar Jr", "deadline": 10}   # seconds; partial result after
+    {"op": "ping"}
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import socketserver
+
+from scout import WORKER_SOCKET, run_scout, current_matcher, log_error, FetchError, Deadline
+
+STARTED = time.time()
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = self._dispatch(json.loads(line))
+            except Exception as e:
+                log_error(str(e), "worker", "handle")
+                reply = {"error": str(e)}
+            self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+    def _dispatch(self, req):
+        op = req.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "uptime_s": int(time.time() - STARTED),
+                    "dict_version": current_matcher().version}
+        if op == "scout":
+            player = str(req.get("player", "")).strip()
+            if not player:
+                return {"error": "player name required"}
+            try:
+                budget = req.get("deadline")
+                result = run_scout(player, days=int(req.get("days", 14)),
+                                   trigger=req.get("trigger", "cli"), force=bool(req.get("force")),
+                                   deadline=Deadline(float(budget)) if budget else None)
+            except FetchError as e:
+                return {"error": str(e), "fetch_error": e.to_dict()}
+            return dict(result, worker_pid=os.getpid())
+        return {"error": f"unknown op: {op}"}
+
+
+class WorkerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def ping():
+    """Worker status dict, or None if nothing is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2)
+            sock.connect(str(WORKER_SOCKET))
+            sock.sendall(b'{"op": "ping"}\n')
+            with sock.makefile("rb") as f:
+                return json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def serve():
+    status = ping()
+    if status:
+        print(f"[!] Worker already running (pid {status['pid']}) on {WORKER_SOCKET}")
+        sys.exit(1)
+    if WORKER_SOCKET.exists():
+        WORKER_SOCKET.unlink()  # left behind by a worker that died
+    WORKER_SOCKET.parent.mkdir(parents=True, exist_ok=True)
+
+    current_matcher()  # compile dictionaries before the first request, not during it
+    server = WorkerServer(str(WORKER_SOCKET), WorkerHandler)
+    os.chmod(WORKER_SOCKET, 0o600)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    print(f"[*] Scout worker listening on {WORKER_SOCKET}")
+    print(f"[*] PID: {os.getpid()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[*] Shutting down.")
+    finally:
+        server.server_close()
+        try:
+            WORKER_SOCKET.unlink()
+        except OSError:
+            pass
+
+
+def main():
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print(__doc__)
+        sys.exit(0)
+    if not hasattr(socket, "AF_UNIX"):
+        print("[!] Unix domain sockets aren't available on this platform.")
+        sys.exit(1)
+
+    if "--status" in sys.argv:
+        status = ping()
+        if status:
+            print(f"[*] Worker up: pid {status['pid']}, {status['uptime_s']}s, "
+                  f"dictionaries {status['dict_version']}")
+        else:
+            print("[*] No worker running.")
+            sys.exit(1)
+    else:
+        serve()
+
+
+if __name__ == "__main__":
+    main()
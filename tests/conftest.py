@@ -0,0 +1,26 @@
+"""
+Shared test setup. Every test session gets a throwaway scout_logs and
+watchlist (SCOUT_LOG_DIR / SCOUT_WATCHLIST are read when scout is imported,
+so they're set here first) - nothing touches the checkout's own.
+
+Run from the repo root:
+    python3 -m pytest -q tests
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SANDBOX = Path(tempfile.mkdtemp(prefix="scout_tests."))
+
+os.environ["SCOUT_LOG_DIR"] = str(SANDBOX / "scout_logs")
+os.environ["SCOUT_WATCHLIST"] = str(SANDBOX / "watchlist.json")
+os.environ.pop("SCOUT_SOCKET", None)
+sys.path.insert(0, str(ROOT))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(SANDBOX, ignore_errors=True)
@@ -0,0 +1,106 @@
+"""Admission: slots, the bounded queue, per-client quotas, batches."""
+
+import threading
+import time
+from contextlib import ExitStack
+
+import pytest
+
+from scout import Deadline, Cancelled, FetchError
+from scout_web import Admission, Rejected
+
+
+def rejected_for(fn):
+    with pytest.raises(Rejected) as e:
+        fn()
+    return e.value.reason
+
+
+def holder(adm, client, bounded=True):
+    """Hold a slot on another thread until the returned Event is set."""
+    release, held = threading.Event(), threading.Event()
+
+    def run():
+        with adm.slot(client, bounded=bounded):
+            held.set()
+            release.wait()
+
+    threading.Thread(target=run, daemon=True).start()
+    assert held.wait(2)
+    return release
+
+
+def test_per_client_quota_on_single_scouts():
+    adm = Admission(max_active=4, per_client=2)
+    with ExitStack() as stack:
+        stack.enter_context(adm.slot("a"))
+        stack.enter_context(adm.slot("a"))
+        assert rejected_for(lambda: stack.enter_context(adm.slot("a"))) == "client_quota"
+        stack.enter_context(adm.slot("b"))  # other clients unaffected
+    assert not adm._clients and adm.active == 0
+
+
+def test_open_batch_takes_one_quota_unit():
+    adm = Admission(max_active=4, per_client=2)
+    with ExitStack() as stack:
+        stack.enter_context(adm.batch("a"))
+        stack.enter_context(adm.slot("a"))
+        assert rejected_for(lambda: stack.enter_context(adm.slot("a"))) == "client_quota"
+        assert rejected_for(lambda: stack.enter_context(adm.batch("a"))) == "client_quota"
+    assert not adm._clients and adm.batches == 0
+
+
+def test_batch_items_dont_use_the_client_quota():
+    adm = Admission(max_active=8, per_client=1)
+    with ExitStack() as stack:
+        for _ in range(3):
+            stack.enter_context(adm.slot("a", bounded=False))
+        stack.enter_context(adm.slot("a"))
+    assert not adm._clients
+
+
+def test_open_batches_are_capped_across_clients():
+    adm = Admission(max_batches=2)
+    with ExitStack() as stack:
+        stack.enter_context(adm.batch("a"))
+        stack.enter_context(adm.batch("b"))
+        assert rejected_for(lambda: stack.enter_context(adm.batch("c"))) == "queue_full"
+    with adm.batch("c"):
+        pass
+
+
+def test_full_queue_turns_scouts_and_batches_away():
+    adm = Admission(max_active=1, max_queue=1, per_client=5, max_wait=5)
+    release = holder(adm, "a")
+    waiter = threading.Thread(target=lambda: adm.slot("b").__enter__(), daemon=True)
+    waiter.start()
+    deadline = time.time() + 2
+    while not adm._waiters and time.time() < deadline:
+        time.sleep(0.01)
+    assert rejected_for(lambda: adm.slot("c").__enter__()) == "queue_full"
+    assert rejected_for(lambda: adm.batch("c").__enter__()) == "queue_full"
+    release.set()
+
+
+def test_queued_scout_leaves_on_cancel_or_deadline():
+    adm = Admission(max_active=1, max_wait=30)
+    release = holder(adm, "x", bounded=False)
+    cancelled = Deadline()
+    threading.Timer(0.3, cancelled.cancel, ["client disconnected"]).start()
+    with pytest.raises(Cancelled):
+        with adm.slot("a", bounded=False, deadline=cancelled):
+            pass
+    with pytest.raises(FetchError) as e:
+        with adm.slot("a", bounded=False, deadline=Deadline(0.3)):
+            pass
+    assert e.value.kind == "deadline"
+    assert not adm._waiters
+    release.set()
+
+
+def test_bounded_wait_times_out():
+    adm = Admission(max_active=1, max_wait=0.3)
+    release = holder(adm, "x")
+    assert rejected_for(lambda: adm.slot("a").__enter__()) == "wait_timeout"
+    assert not adm._waiters and adm._clients == {"x": 1}
+    release.set()
@@ -0,0 +1,66 @@
+"""score_history: daily entries over a rolling lookback, each story once."""
+
+import json
+
+import pytest
+
+import scout_backfill
+from scout import DAY
+
+DAY0 = 20000 * DAY  # 2024-10-04, a UTC midnight
+
+
+def spool(tmp_path, rows):
+    path = tmp_path / "player.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+    return path
+
+
+def story(n, day, hour=12, link=None):
+    return {"title": f"A One story {n} - Outlet", "link": link or f"http://news/{n}",
+            "description": "", "ts": DAY0 + day * DAY + hour * 3600}
+
+
+def entries(path, days):
+    player, part, n, undated = scout_backfill.score_history("A One", path, days, "bf")
+    rows = [json.loads(line) for line in part.read_text(encoding="utf-8").splitlines()]
+    assert player == "A One" and n == len(rows)
+    return rows, undated
+
+
+def test_one_entry_per_day_with_news(tmp_path):
+    path = spool(tmp_path, [story(1, 0), story(2, 1), story(3, 5), dict(story(4, 2), ts=None)])
+    rows, undated = entries(path, days=3)
+    assert [r["timestamp"][:10] for r in rows] == ["2024-10-04", "2024-10-05", "2024-10-09"]
+    assert all(r["timestamp"].endswith("T23:59:59+00:00") for r in rows)
+    assert undated == 1
+
+
+def test_window_rolls_off_old_stories(tmp_path):
+    path = spool(tmp_path, [story(1, 0), story(2, 1), story(3, 2), story(4, 5)])
+    rows, _ = entries(path, days=3)
+    # day 2 still sees days 0-2; day 5's window (days 3-5) has only its own story
+    assert [r["articles_found"] for r in rows] == [1, 2, 3, 1]
+
+
+def test_repeated_snapshots_count_once(tmp_path):
+    # the first copy spooled wins - a re-dated repeat doesn't add a day
+    path = spool(tmp_path, [story(1, 0), story(1, 0), story(2, 0), story(1, 1), story(3, 1)])
+    rows, _ = entries(path, days=7)
+    assert [r["articles_found"] for r in rows] == [2, 3]
+
+
+def test_on_disk_sort_matches_in_memory(tmp_path, monkeypatch):
+    rows = [story(n % 40, day=(n * 7) % 30, hour=n % 24) for n in range(400)]
+    path = spool(tmp_path, rows)
+    whole, _ = entries(path, days=5)
+    monkeypatch.setattr(scout_backfill, "SORT_CHUNK", 13)
+    chunked, _ = entries(path, days=5)
+    strip = lambda r: {k: v for k, v in r.items() if k != "run_id"}
+    assert list(map(strip, chunked)) == list(map(strip, whole))
+
+
+@pytest.mark.parametrize("days", [0, -3])
+def test_lookback_must_be_a_day_or_more(tmp_path, days):
+    with pytest.raises(ValueError):
+        scout_backfill.score_history("A One", spool(tmp_path, [story(1, 0)]), days, "bf")
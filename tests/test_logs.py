@@ -0,0 +1,100 @@
+"""/api/logs: newest-first pages with byte-offset cursors, filters, NDJSON export."""
+
+import json
+import threading
+import http.client
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from scout import AUDIT_LOG, _read_lines_reverse
+from scout_web import ScoutHandler
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ScoutHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def write_audit(n, start=0):
+    """n entries, run_ids r<i>; odd i are "Odd Player", scores cycle 0..9."""
+    AUDIT_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(AUDIT_LOG, "a" if start else "w", encoding="utf-8") as f:
+        for i in range(start, start + n):
+            f.write(json.dumps({"run_id": f"r{i}", "player": "Odd Player" if i % 2 else "Even Player",
+                                "trigger": "cli", "risk_score": i % 10, "note": "x" * (i % 37)}) + "\n")
+
+
+def get(port, path):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.request("GET", path)
+    resp = conn.getresponse()
+    body = resp.read().decode()
+    conn.close()
+    return resp.status, body
+
+
+def pages(port, query):
+    seen, cursor = [], ""
+    while True:
+        status, body = get(port, f"/api/logs?{query}&cursor={cursor}")
+        assert status == 200
+        page = json.loads(body)
+        seen.append([e["run_id"] for e in page["entries"]])
+        if page["next_cursor"] is None:
+            return seen
+        cursor = page["next_cursor"]
+
+
+def test_pages_cover_every_entry_once_newest_first(server):
+    write_audit(120)
+    got = pages(server, "limit=50&fields=run_id")
+    assert [len(p) for p in got] == [50, 50, 20]
+    assert sum(got, []) == [f"r{i}" for i in reversed(range(120))]
+
+
+def test_exact_multiple_of_limit_ends_without_an_empty_page(server):
+    write_audit(100)
+    assert [len(p) for p in pages(server, "limit=50")] == [50, 50]
+
+
+def test_cursor_survives_appends_between_pages(server):
+    write_audit(60)
+    first = json.loads(get(server, "/api/logs?limit=25")[1])
+    write_audit(10, start=60)  # new runs land at the end of the file, after the cursor
+    rest = pages(server, f"limit=25&cursor={first['next_cursor']}")
+    assert sum(rest, []) == [f"r{i}" for i in reversed(range(35))]
+
+
+def test_filters_apply_across_pages(server):
+    write_audit(100)
+    got = sum(pages(server, "limit=7&player=odd%20player&min_score=5&max_score=7"), [])
+    assert got == [f"r{i}" for i in reversed(range(100)) if i % 2 and 5 <= i % 10 <= 7]
+
+
+def test_projection_and_ndjson_export(server):
+    write_audit(30)
+    status, body = get(server, "/api/logs?format=ndjson&fields=run_id,risk_score")
+    rows = [json.loads(line) for line in body.splitlines()]
+    assert status == 200 and len(rows) == 30
+    assert rows[0] == {"run_id": "r29", "risk_score": 9}
+
+
+def test_bad_cursor_is_a_400(server):
+    assert get(server, "/api/logs?cursor=abc")[0] == 400
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 65536])
+def test_reverse_reader_is_chunk_size_independent(tmp_path, chunk_size):
+    path = tmp_path / "log.jsonl"
+    lines = [f"line {i} " + "y" * (i % 13) for i in range(200)]
+    path.write_text("\n".join(lines) + "\n\n")
+    got = [line.decode() for _, line in _read_lines_reverse(path, chunk_size=chunk_size)]
+    assert got == lines[::-1]
+    # resuming from an offset picks up just before that line
+    offset = next(o for o, line in _read_lines_reverse(path) if line == b"line 150 " + b"y" * (150 % 13))
+    assert next(_read_lines_reverse(path, end=offset, chunk_size=chunk_size))[1] == b"line 149 " + b"y" * (149 % 13)
@@ -0,0 +1,56 @@
+"""merge_players / player_entry: de-dup by name or alias, aliases always a list."""
+
+import pytest
+
+from scout import merge_players, player_entry, watchlist_index, PlayerMatcher
+
+
+def names(wl):
+    return [player_entry(p)["name"] for p in wl["players"]]
+
+
+def test_same_player_by_case_accents_and_spacing_is_not_added_twice():
+    wl = {"players": ["Kylian Mbappé"]}
+    counts = merge_players(wl, ["kylian  MBAPPE", "Kylian Mbappe", "Erling Haaland"])
+    assert counts == {"added": 1, "updated": 0, "unchanged": 2, "invalid": 0}
+    assert names(wl) == ["Kylian Mbappé", "Erling Haaland"]
+
+
+def test_alias_matches_and_new_spellings_are_added_as_aliases():
+    wl = {"players": [{"name": "Vinicius Junior", "aliases": ["Vini Jr"], "last_score": 6}]}
+    counts = merge_players(wl, [{"name": "vini  JR", "club": "Real Madrid"},
+                                {"name": "Vinícius Júnior", "aliases": ["Vinicius Jr"]}])
+    assert counts["added"] == 0 and counts["updated"] == 2
+    entry = wl["players"][0]
+    assert entry["club"] == "Real Madrid" and entry["last_score"] == 6  # score never overwritten
+    assert entry["aliases"] == ["Vini Jr", "Vinicius Jr"]
+
+
+def test_first_duplicate_in_one_import_wins():
+    wl = {"players": []}
+    merge_players(wl, [{"name": "Pedri", "club": "Barcelona"}, {"name": "PEDRI", "club": "Other"}])
+    assert wl["players"] == [{"name": "Pedri", "club": "Barcelona", "last_score": None}]
+
+
+def test_string_alias_is_one_alias_and_other_types_are_invalid():
+    wl = {"players": []}
+    counts = merge_players(wl, [{"name": "Vinicius Junior", "aliases": "Vini Jr"},
+                                {"name": "Someone", "aliases": 5}, {"name": "  "}, 7])
+    assert counts == {"added": 1, "updated": 0, "unchanged": 0, "invalid": 3}
+    assert wl["players"][0]["aliases"] == ["Vini Jr"]
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Vini Jr", ["Vini Jr"]), ("", []), (None, []), (("A", "B"), ["A", "B"]), (["A"], ["A"]),
+])
+def test_player_entry_always_hands_back_an_alias_list(raw, expected):
+    assert player_entry({"name": "Vinicius Junior", "aliases": raw})["aliases"] == expected
+
+
+def test_hand_edited_string_alias_is_read_whole():
+    players = [{"name": "Vinicius Junior", "aliases": "Vini Jr"}]
+    assert set(watchlist_index(players)) == {"vinicius junior", "vini jr"}
+    wl = {"players": list(players)}
+    merge_players(wl, [{"name": "Vinicius Junior", "aliases": ["Vini"]}])
+    assert wl["players"][0]["aliases"] == ["Vini Jr", "Vini"]
+    assert len(PlayerMatcher.from_watchlist({"players": players})) == 1
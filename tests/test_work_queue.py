@@ -0,0 +1,78 @@
+"""WorkQueue: leases, expiry and reclaim, retries, MAX_ATTEMPTS."""
+
+import pytest
+
+import scout_scheduler
+from scout_scheduler import WorkQueue, MAX_ATTEMPTS
+
+LEASE = 300
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A clock the test moves by hand (WorkQueue reads time.time())."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(scout_scheduler.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    q = WorkQueue(tmp_path / "queue.db", lease_seconds=LEASE)
+    q.seed("b", ["A", "B", "C"])
+    return q
+
+
+def test_each_player_leased_once_while_held(queue):
+    claims = [queue.claim("b", f"w{i}") for i in range(4)]
+    assert claims == [("A", 1), ("B", 1), ("C", 1), None]
+
+
+def test_seed_is_idempotent(queue):
+    queue.claim("b", "w1")
+    queue.seed("b", ["A", "B", "C", "D"])
+    assert queue.progress("b") == {"claimed": 1, "pending": 3}
+
+
+def test_expired_lease_is_reclaimed_and_the_old_holder_loses_it(queue, clock):
+    assert queue.claim("b", "w1") == ("A", 1)
+    clock[0] += LEASE + 1
+    # retries go to the back: untried players first, then A again
+    assert [queue.claim("b", "w2") for _ in range(3)] == [("B", 1), ("C", 1), ("A", 2)]
+    assert not queue.renew("b", "A", "w1")
+    assert not queue.finish("b", "A", "w1", result={"player": "A", "risk_score": 1})
+    assert queue.finish("b", "A", "w2", result={"player": "A", "risk_score": 2}, attempt=2)
+    assert queue.results("b") == [{"player": "A", "risk_score": 2}]
+
+
+def test_renewed_lease_is_not_reclaimed(queue, clock):
+    queue.claim("b", "w1")
+    for _ in range(3):
+        clock[0] += LEASE - 10
+        assert queue.renew("b", "A", "w1")
+    assert queue.claim("b", "w2") == ("B", 1)
+
+
+def test_failed_fetch_goes_to_the_back_then_fails_for_good(queue):
+    assert queue.claim("b", "w1") == ("A", 1)
+    assert queue.finish("b", "A", "w1", error="upstream down", attempt=1)
+    for name in ("B", "C"):
+        assert queue.claim("b", "w1") == (name, 1)
+        assert queue.finish("b", name, "w1", result={"player": name}, attempt=1)
+    for attempt in range(2, MAX_ATTEMPTS + 1):
+        assert queue.claim("b", "w1") == ("A", attempt)
+        assert queue.finish("b", "A", "w1", error="upstream down", attempt=attempt)
+    assert queue.claim("b", "w1") is None
+    assert queue.progress("b") == {"done": 2, "failed": 1}
+    assert {"player": "A", "error": "upstream down"} in queue.results("b")
+
+
+def test_lease_expiring_max_attempts_times_fails_the_player(queue, clock):
+    queue.seed("c", ["X"])
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        assert queue.claim("c", "dies") == ("X", attempt)
+        clock[0] += LEASE + 1
+    assert queue.claim("c", "w2") is None
+    assert queue.progress("c") == {"failed": 1}
+    [result] = queue.results("c")
+    assert result["player"] == "X" and "lease expired" in result["error"]